@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+build_assets.py -> Pre-scale the screensaver and logo for the kiosk display.
+
+Writes `<stem>@<width>x<height>.<ext>` variants to src/assets/scaled/, which
+`utils.assets.resolve_asset` serves instead of the full-size sources. The
+screensaver is cover-cropped to each screen size (WebP and PNG); the logo is
+resized to each drawn width (PNG, keeps transparency). Run it before packaging
+and whenever the sources or APP_SCREEN_WIDTH/HEIGHT change.
+
+Usage:
+    uv run python scripts/build_assets.py [--screen 800x480] [--logo-width 160]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from utils.assets import ASSETS_DIR, SCALED_DIR_NAME  # noqa: E402
+from utils.config import config  # noqa: E402
+
+# Layout draws the logo at 120 px (compact) or 160 px (regular), scale <= 1.
+_DEFAULT_LOGO_WIDTHS = (120, 160)
+_WEBP_QUALITY = 85
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive, got {value!r}")
+    return width, height
+
+
+def build_screensaver(
+    source: Path, target_dir: Path, sizes: list[tuple[int, int]]
+) -> list[Path]:
+    written: list[Path] = []
+    with Image.open(source) as image:
+        image = image.convert("RGB")
+        for width, height in sizes:
+            fitted = ImageOps.fit(image, (width, height), Image.Resampling.LANCZOS)
+            webp_path = target_dir / f"{source.stem}@{width}x{height}.webp"
+            fitted.save(webp_path, "WEBP", quality=_WEBP_QUALITY, method=6)
+            png_path = target_dir / f"{source.stem}@{width}x{height}.png"
+            fitted.save(png_path, "PNG", optimize=True)
+            written.extend([webp_path, png_path])
+    return written
+
+
+def build_logo(source: Path, target_dir: Path, widths: list[int]) -> list[Path]:
+    written: list[Path] = []
+    with Image.open(source) as image:
+        image = image.convert("RGBA")
+        for width in widths:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            png_path = target_dir / f"{source.stem}@{width}x{height}.png"
+            resized.save(png_path, "PNG", optimize=True)
+            written.append(png_path)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--screen",
+        type=parse_size,
+        action="append",
+        help="screen size WIDTHxHEIGHT (repeatable, default: APP_SCREEN_*)",
+    )
+    parser.add_argument(
+        "--logo-width",
+        type=int,
+        action="append",
+        help=f"logo width in px (repeatable, default: {_DEFAULT_LOGO_WIDTHS})",
+    )
+    args = parser.parse_args()
+
+    screens = args.screen or [(config.app_screen_width, config.app_screen_height)]
+    logo_widths = args.logo_width or list(_DEFAULT_LOGO_WIDTHS)
+
+    target_dir = ASSETS_DIR / SCALED_DIR_NAME
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for stale in target_dir.glob("*@*"):
+        stale.unlink()
+
+    written = build_screensaver(
+        ASSETS_DIR / config.asset_screensaver, target_dir, screens
+    )
+    written += build_logo(ASSETS_DIR / config.asset_logo, target_dir, logo_widths)
+    for path in written:
+        print(f"{path.stat().st_size / 1024:>8.1f} KiB  {path.relative_to(SRC_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
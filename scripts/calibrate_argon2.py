@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+calibrate_argon2.py -> Pick argon2 cost parameters for the current device.
+
+Times PasswordHasher.hash for a grid of memory/time costs and prints the
+strongest combination whose median stays under the latency budget, as lines
+ready to paste into storage/data.
+
+Usage:
+    uv run python scripts/calibrate_argon2.py [--budget-ms 250] [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass
+
+from argon2 import PasswordHasher
+
+# OWASP minimum for argon2id is 19 MiB / t=2; never suggest weaker settings.
+_MEMORY_COSTS_KIB = (19456, 32768, 47104, 65536)
+_TIME_COSTS = (2, 3, 4)
+_SAMPLE_PASSCODE = "0000"
+
+
+@dataclass(frozen=True)
+class Measurement:
+    memory_cost_kib: int
+    time_cost: int
+    parallelism: int
+    median_ms: float
+
+
+def measure(
+    *,
+    memory_cost_kib: int,
+    time_cost: int,
+    parallelism: int,
+    rounds: int,
+) -> Measurement:
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost_kib,
+        parallelism=parallelism,
+    )
+    samples_ms: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        hasher.hash(_SAMPLE_PASSCODE)
+        samples_ms.append((time.perf_counter() - started) * 1000)
+    return Measurement(
+        memory_cost_kib=memory_cost_kib,
+        time_cost=time_cost,
+        parallelism=parallelism,
+        median_ms=statistics.median(samples_ms),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--parallelism", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'memory KiB':>10} {'time':>5} {'median ms':>10}")
+    best: Measurement | None = None
+    for memory_cost_kib in _MEMORY_COSTS_KIB:
+        for time_cost in _TIME_COSTS:
+            result = measure(
+                memory_cost_kib=memory_cost_kib,
+                time_cost=time_cost,
+                parallelism=args.parallelism,
+                rounds=args.rounds,
+            )
+            print(
+                f"{result.memory_cost_kib:>10} {result.time_cost:>5} "
+                f"{result.median_ms:>10.1f}"
+            )
+            if result.median_ms > args.budget_ms:
+                break  # higher time costs at this memory cost only get slower
+            if best is None or (
+                result.memory_cost_kib * result.time_cost
+                > best.memory_cost_kib * best.time_cost
+            ):
+                best = result
+
+    if best is None:
+        print(f"\nNo combination fits {args.budget_ms:.0f} ms; using the minimum.")
+        best = Measurement(_MEMORY_COSTS_KIB[0], _TIME_COSTS[0], args.parallelism, 0)
+    print("\n# storage/data")
+    print(f"ARGON2_TIME_COST={best.time_cost}")
+    print(f"ARGON2_MEMORY_COST_KIB={best.memory_cost_kib}")
+    print(f"ARGON2_PARALLELISM={best.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
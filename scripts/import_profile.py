@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+import_profile.py -> Report the slowest imports on the kiosk boot path.
+
+Runs `python -X importtime` on the app entry module and prints the top
+imports by cumulative and self time (microseconds).
+
+Usage:
+    uv run python scripts/import_profile.py [--module app] [--top 25]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+_PREFIX = "import time:"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile_imports(module: str) -> list[ImportTiming]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"Importing {module!r} failed")
+
+    timings: list[ImportTiming] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        fields = [field.strip() for field in line[len(_PREFIX) :].split("|")]
+        if len(fields) != 3 or not fields[0].isdigit():
+            continue  # header row
+        timings.append(
+            ImportTiming(
+                module=fields[2],
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+            )
+        )
+    return timings
+
+
+def print_table(title: str, rows: list[ImportTiming]) -> None:
+    print(f"\n{title}")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for row in rows:
+        print(
+            f"{row.cumulative_us / 1000:>14.1f} {row.self_us / 1000:>9.1f}  "
+            f"{row.module}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    timings = profile_imports(args.module)
+    total_us = sum(row.self_us for row in timings)
+    print(f"{len(timings)} modules imported in {total_us / 1000:.1f} ms")
+    print_table(
+        "Slowest by cumulative time",
+        sorted(timings, key=lambda row: row.cumulative_us, reverse=True)[: args.top],
+    )
+    print_table(
+        "Slowest by self time",
+        sorted(timings, key=lambda row: row.self_us, reverse=True)[: args.top],
+    )
+
+
+if __name__ == "__main__":
+    main()
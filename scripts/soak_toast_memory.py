@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+soak_toast_memory.py -> Check that toast dedupe state stays bounded.
+
+Pushes many distinct toast messages through the per-page dedupe cache
+(`TtlKeyCache` stored in a `PageSlot`), on several pages, with a simulated
+clock. Fails if a cache grows past its size cap, if traced memory keeps
+growing after warmup, or if a dropped page (with its slot values) is not
+collected.
+
+Usage:
+    uv run python scripts/soak_toast_memory.py [--toasts 200000] [--pages 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import flet as ft
+from flet.messaging.connection import Connection
+from flet.messaging.protocol import ClientMessage
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from components.ui.tango_toast import (  # noqa: E402
+    ToastType,
+    _DEDUPE_MAX_KEYS,
+    _DEDUPE_TTL_S,
+    _recent_toasts,
+)
+from utils.ttl_cache import TtlKeyCache  # noqa: E402
+
+# Simulated time between two toasts: a burst far denser than the kiosk sees.
+_TOAST_INTERVAL_S = 0.05
+# Allowed traced-memory growth between the warm and the final sample: the
+# caches are full after warmup, so later toasts only replace entries.
+_MAX_STEADY_GROWTH_KIB = 64.0
+
+
+class _DiscardConnection(Connection):
+    def send_message(self, message: ClientMessage) -> None:
+        pass
+
+
+class _SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_page(loop: asyncio.AbstractEventLoop, executor: ThreadPoolExecutor) -> ft.Page:
+    connection = _DiscardConnection()
+    connection.loop = loop
+    connection.executor = executor
+    connection.pubsubhub = PubSubHub(loop=loop, executor=executor)
+    page: ft.Page = Session(connection).page
+    return page
+
+
+def push_toasts(
+    pages: list[ft.Page], clock: _SimulatedClock, start: int, count: int
+) -> int:
+    """Returns the largest cache size seen."""
+    largest = 0
+    for index in range(start, start + count):
+        page = pages[index % len(pages)]
+        recent = _recent_toasts.get(page)
+        assert recent is not None
+        recent.seen_within((ToastType.INFO, f"message {index}"), _DEDUPE_TTL_S)
+        largest = max(largest, len(recent))
+        clock.now += _TOAST_INTERVAL_S
+    return largest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--toasts", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, default=4)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    clock = _SimulatedClock()
+    pages = [make_page(loop, executor) for _ in range(args.pages)]
+    for page in pages:
+        _recent_toasts.set(
+            page,
+            TtlKeyCache(max_size=_DEDUPE_MAX_KEYS, ttl_s=_DEDUPE_TTL_S, clock=clock),
+        )
+
+    tracemalloc.start()
+    warmup = args.toasts // 10
+    largest = push_toasts(pages, clock, 0, warmup)
+    gc.collect()
+    warm_kib = tracemalloc.get_traced_memory()[0] / 1024
+    largest = max(largest, push_toasts(pages, clock, warmup, args.toasts - warmup))
+    gc.collect()
+    final_kib = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+
+    sizes = [len(_recent_toasts.get(page) or ()) for page in pages]
+    print(f"toasts pushed:        {args.toasts} over {args.pages} pages")
+    print(f"largest cache:        {largest} keys (cap {_DEDUPE_MAX_KEYS})")
+    print(f"final cache sizes:    {sizes}")
+    print(f"traced memory growth: {final_kib - warm_kib:+.1f} KiB after warmup")
+    assert largest <= _DEDUPE_MAX_KEYS, "dedupe cache grew past its cap"
+    assert final_kib - warm_kib <= _MAX_STEADY_GROWTH_KIB, "memory keeps growing"
+
+    page = pages.pop()
+    cache = _recent_toasts.get(page)
+    assert cache is not None
+    dropped = weakref.ref(page)
+    dropped_cache = weakref.ref(cache)
+    del page, cache
+    gc.collect()
+    print(f"dropped page freed:   {dropped() is None and dropped_cache() is None}")
+    assert dropped() is None, "dropped page is still referenced"
+    assert dropped_cache() is None, "dropped page's dedupe cache is still referenced"
+
+    executor.shutdown()
+    loop.close()
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
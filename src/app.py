@@ -8,6 +8,7 @@ from components.shell.layout import Layout
 from components.shell.loading_spinner import LoadingSpinner
 from contexts.locale import LocaleContext, LocaleContextValue
 from contexts.motor import MotorContext, MotorContextValue
+from contexts.observable import use_fields
 from contexts.route import RouteContext, RouteContextValue
 from contexts.settings import SettingsContext, SettingsContextValue
 from contexts.shell import ShellContext, ShellContextValue
@@ -18,23 +19,52 @@ from services.app.settings import SettingsService
 from services.app.shell import ShellService
 from services.motors.controller import MotorController
 from theme import animation
+from utils.metrics import metrics
+from utils.render_profiler import render_profiler
+from utils.startup_trace import startup_trace
+
+_RENDERS = metrics.counter(
+    "tango_ui_renders_total",
+    "Component renders",
+    ["component"],
+)
+
+
+def create_motor_controller() -> MotorController:
+    with startup_trace.span("MotorController()"):
+        return MotorController()
 
 
 @ft.component
+@render_profiler.profile("App")
 def App() -> ft.Control:
-    navigation, _ = ft.use_state(NavigationService(route=ft.context.page.route))
+    _RENDERS.labels("App").inc()
+    # Services are built once in use_memo. App only subscribes to the fields
+    # that feed its context values; views select their own fields, so motor
+    # telemetry or touch activity never re-renders the whole tree.
+    navigation = ft.use_memo(
+        lambda: NavigationService(route=ft.context.page.route),
+        dependencies=[],
+    )
     i18n_service = ft.use_memo(lambda: I18nService(), dependencies=[])
-    settings_service, _ = ft.use_state(SettingsService(i18n_service))
-    motor_controller, _ = ft.use_state(MotorController())
-    shell_service, _ = ft.use_state(ShellService())
+    settings_service = ft.use_memo(
+        lambda: SettingsService(i18n_service), dependencies=[]
+    )
+    motor_controller = ft.use_memo(create_motor_controller, dependencies=[])
+    shell_service = ft.use_memo(lambda: ShellService(), dependencies=[])
+    use_fields(navigation, "route")
+    use_fields(settings_service, "locale_version")
     viewport_size, set_viewport_size = ft.use_state((0.0, 0.0))
     ui_ready, set_ui_ready = ft.use_state(False)
     entry_animation_started, set_entry_animation_started = ft.use_state(False)
     entry_animation_done, set_entry_animation_done = ft.use_state(False)
 
-    _ = settings_service.locale_version
-    _ = navigation.route
-    _ = viewport_size
+    render_profiler.track(
+        locale_version=settings_service.locale_version,
+        route=navigation.route,
+        viewport_size=viewport_size,
+        ui_ready=ui_ready,
+    )
 
     runtime = ft.use_memo(
         lambda: AppRuntime(
@@ -2,6 +2,10 @@ from collections.abc import Callable
 
 import flet as ft
 
+# The client throttles pan updates to one per interval. Activity only needs
+# to be seen once in a while, so a drag no longer streams events to Python.
+_ACTIVITY_DRAG_INTERVAL_MS = 500
+
 
 def ActivityBoundary(
     *,
@@ -10,7 +14,7 @@ def ActivityBoundary(
 ) -> ft.GestureDetector:
     return ft.GestureDetector(
         content=content,
-        drag_interval=0,
+        drag_interval=_ACTIVITY_DRAG_INTERVAL_MS,
         on_tap_down=lambda _: on_activity(),
         on_pan_down=lambda _: on_activity(),
         on_pan_update=lambda _: on_activity(),
@@ -1,15 +1,35 @@
 import flet as ft
 from contexts.route import RouteContext
 from theme import animation
-from views.admin.admin_view import AdminView
-from views.admin.auth_view import AuthView
+from utils.render_profiler import render_profiler
 from views.main.main_view import MainView
 
 
 @ft.component
+@render_profiler.profile("AppBody")
 def AppBody() -> ft.Control:
     route_ctx = ft.use_context(RouteContext)
     active_route = route_ctx.route
+    visited_routes, set_visited_routes = ft.use_state(frozenset({"/"}))
+    render_profiler.track(route=active_route, visited_routes=visited_routes)
+
+    def remember_active_route() -> None:
+        if active_route not in visited_routes:
+            set_visited_routes(visited_routes | {active_route})
+
+    ft.use_effect(remember_active_route, [active_route])
+
+    def build_route_content(route: str) -> ft.Control:
+        # Admin views (and their imports) are built on first visit only.
+        if route not in visited_routes and route != active_route:
+            return ft.Container()
+        if route == "/auth":
+            from views.admin.auth_view import AuthView
+
+            return AuthView()
+        from views.admin.admin_view import AdminView
+
+        return AdminView()
 
     def route_layer(route: str, content: ft.Control) -> ft.Container:
         is_active = route == active_route
@@ -30,7 +50,7 @@ def AppBody() -> ft.Control:
         fit=ft.StackFit.EXPAND,
         controls=[
             route_layer("/", MainView()),
-            route_layer("/auth", AuthView()),
-            route_layer("/admin", AdminView()),
+            route_layer("/auth", build_route_content("/auth")),
+            route_layer("/admin", build_route_content("/admin")),
         ],
     )
@@ -1,52 +1,89 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
 import flet as ft
 from components.ui.text import TangoText
 from contexts.locale import LocaleContext
+from contexts.observable import use_fields
 from contexts.route import RouteContext
 from contexts.shell import ShellContext
 from theme import colors, spacing
-from theme.scale import get_viewport_metrics
+from theme.scale import ViewportMetrics, get_viewport_metrics, scaled
 from .navigation import AdminModeToggle, LanguageSelector
+from .render_profiler_overlay import RenderProfilerOverlay
 from .screensaver import Screensaver
+from utils.assets import resolve_asset
 from utils.config import config
+from utils.render_profiler import render_profiler
+
+
+@dataclass(frozen=True)
+class _ShellLayout:
+    logo_left_padding: int
+    logo_bottom_padding: int
+    body_bottom_inset: int
+    logo_width: int
+    logo_src: str
+    screensaver_src: str
+    header_side_padding: int
+    header_right: int
+    header_gap: int
+    top_band_height: int
+    toast_top_offset: int
+    title_spacing: int
+    title_size: int
+    subtitle_size: int
+
+
+@lru_cache(maxsize=8)
+def _shell_layout(metrics: ViewportMetrics) -> _ShellLayout:
+    top_band_height = scaled(metrics, 68, 76)
+    logo_width = scaled(metrics, 120, 160)
+    return _ShellLayout(
+        logo_left_padding=scaled(metrics, spacing.MD, spacing.LG),
+        logo_bottom_padding=scaled(metrics, spacing.XS, spacing.SM),
+        body_bottom_inset=scaled(metrics, spacing.LG, spacing.XL),
+        logo_width=logo_width,
+        logo_src=resolve_asset(config.asset_logo, width=logo_width),
+        screensaver_src=resolve_asset(
+            config.asset_screensaver,
+            width=int(round(metrics.width)),
+            height=int(round(metrics.height)),
+        ),
+        header_side_padding=scaled(metrics, spacing.MD, spacing.LG),
+        header_right=scaled(metrics, spacing.MD),
+        header_gap=scaled(metrics, spacing.XS, spacing.SM),
+        top_band_height=top_band_height,
+        toast_top_offset=top_band_height + scaled(metrics, spacing.SM),
+        title_spacing=scaled(metrics, 2),
+        title_size=scaled(metrics, 18, 22),
+        subtitle_size=scaled(metrics, 11, 13),
+    )
 
 
 @ft.component
+@render_profiler.profile("Layout")
 def Layout(content: ft.Control) -> ft.Control:
     loc = ft.use_context(LocaleContext)
     route_ctx = ft.use_context(RouteContext)
     shell = ft.use_context(ShellContext).current()
-    ASSET_LOGO = config.asset_logo
-    ASSET_SCREENSAVER = config.asset_screensaver
+    use_fields(shell, "is_screensaver_active")
     metrics = get_viewport_metrics(ft.context.page, min_scale=0.7)
 
-    logo_left_padding = int(
-        round((spacing.MD if metrics.is_compact else spacing.LG) * metrics.scale)
+    layout = _shell_layout(metrics)
+    render_profiler.track(
+        route=route_ctx.route,
+        locale=loc.locale,
+        metrics=metrics,
+        screensaver=shell.is_screensaver_active,
     )
-    logo_bottom_padding = int(
-        round((spacing.XS if metrics.is_compact else spacing.SM) * metrics.scale)
-    )
-    body_bottom_inset = int(
-        round((spacing.LG if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
-    logo_width = int(round((120 if metrics.is_compact else 160) * metrics.scale))
-    header_side_padding = int(
-        round((spacing.MD if metrics.is_compact else spacing.LG) * metrics.scale)
-    )
-    header_right = int(round(spacing.MD * metrics.scale))
-    header_gap = int(
-        round((spacing.XS if metrics.is_compact else spacing.SM) * metrics.scale)
-    )
-    top_band_height = int(round((68 if metrics.is_compact else 76) * metrics.scale))
-    toast_top_offset = top_band_height + int(round(spacing.SM * metrics.scale))
-    title_spacing = int(round(2 * metrics.scale))
-    title_size = int(round((18 if metrics.is_compact else 22) * metrics.scale))
-    subtitle_size = int(round((11 if metrics.is_compact else 13) * metrics.scale))
 
-    setattr(ft.context.page, "_tango_toast_top_offset", toast_top_offset)
-    setattr(ft.context.page, "_tango_toast_right_offset", header_right)
+    setattr(ft.context.page, "_tango_toast_top_offset", layout.toast_top_offset)
+    setattr(ft.context.page, "_tango_toast_right_offset", layout.header_right)
     setattr(ft.context.page, "_tango_toast_close_tooltip", loc.t("close"))
-    setattr(ft.context.page, "_tango_content_top_inset", top_band_height)
-    setattr(ft.context.page, "_tango_content_bottom_inset", body_bottom_inset)
+    setattr(ft.context.page, "_tango_toast_more_events", loc.t("toast_more_events"))
+    setattr(ft.context.page, "_tango_content_top_inset", layout.top_band_height)
+    setattr(ft.context.page, "_tango_content_bottom_inset", layout.body_bottom_inset)
 
     title_key = "motors_control"
     subtitle_key: str | None = None
@@ -58,14 +95,14 @@ def Layout(content: ft.Control) -> ft.Control:
         subtitle_key = "application_config"
 
     title_block = ft.Column(
-        spacing=title_spacing,
+        spacing=layout.title_spacing,
         alignment=ft.MainAxisAlignment.CENTER,
         horizontal_alignment=ft.CrossAxisAlignment.START,
         controls=[
             TangoText(
                 loc.t(title_key),
                 variant="title",
-                size=title_size,
+                size=layout.title_size,
                 color=colors.TEXT_INVERSE,
             ),
             *(
@@ -73,7 +110,7 @@ def Layout(content: ft.Control) -> ft.Control:
                     TangoText(
                         loc.t(subtitle_key),
                         variant="caption",
-                        size=subtitle_size,
+                        size=layout.subtitle_size,
                         color=colors.APP_SHELL_SUBTITLE,
                     )
                 ]
@@ -90,7 +127,7 @@ def Layout(content: ft.Control) -> ft.Control:
             expand=True,
             controls=[
                 ft.Container(
-                    height=top_band_height,
+                    height=layout.top_band_height,
                     expand=False,
                     bgcolor=colors.APP_SHELL,
                 ),
@@ -100,30 +137,32 @@ def Layout(content: ft.Control) -> ft.Control:
                     padding=ft.Padding(
                         0,
                         0,
-                        logo_left_padding,
-                        logo_bottom_padding,
+                        layout.logo_left_padding,
+                        layout.logo_bottom_padding,
                     ),
                     opacity=0.06,
                     content=ft.Image(
-                        src=ASSET_LOGO,
-                        width=logo_width,
+                        src=layout.logo_src,
+                        width=layout.logo_width,
                         fit=ft.BoxFit.CONTAIN,
                     ),
                 ),
                 ft.Container(
                     expand=True,
-                    padding=ft.Padding(0, top_band_height, 0, body_bottom_inset),
+                    padding=ft.Padding(
+                        0, layout.top_band_height, 0, layout.body_bottom_inset
+                    ),
                     content=content,
                 ),
                 ft.Container(
                     top=0,
                     left=0,
                     right=0,
-                    height=top_band_height,
+                    height=layout.top_band_height,
                     padding=ft.Padding(
-                        header_side_padding,
+                        layout.header_side_padding,
                         0,
-                        header_side_padding,
+                        layout.header_side_padding,
                         0,
                     ),
                     alignment=ft.Alignment.CENTER,
@@ -137,7 +176,7 @@ def Layout(content: ft.Control) -> ft.Control:
                                     AdminModeToggle(),
                                     LanguageSelector(),
                                 ],
-                                spacing=header_gap,
+                                spacing=layout.header_gap,
                                 tight=True,
                                 alignment=ft.MainAxisAlignment.END,
                                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
@@ -146,10 +185,11 @@ def Layout(content: ft.Control) -> ft.Control:
                     ),
                 ),
                 *(
-                    [Screensaver(ASSET_SCREENSAVER)]
+                    [Screensaver(layout.screensaver_src)]
                     if shell.is_screensaver_active
                     else []
                 ),
+                *([RenderProfilerOverlay()] if render_profiler.enabled else []),
             ],
         ),
     )
@@ -15,8 +15,8 @@ from services.app.overlay_registry import (
     refresh_overlay,
 )
 from models.nav_item import NavItem
-from theme import colors, shadows
-from theme.scale import get_viewport_metrics
+from theme import colors, registry
+from theme.scale import get_viewport_metrics, scaled
 
 ContainerHandler = ControlEventHandler[ft.Container] | None
 
@@ -32,8 +32,8 @@ def LanguageSelector() -> ft.Control:
     loc = ft.use_context(LocaleContext)
     settings_service = ft.use_context(SettingsContext).current()
     metrics = get_viewport_metrics(ft.context.page, min_scale=0.7)
-    diameter = int(round((40 if metrics.is_compact else 48) * metrics.scale))
-    label_size = int(round((14 if metrics.is_compact else 16) * metrics.scale))
+    diameter = scaled(metrics, 40, 48)
+    label_size = scaled(metrics, 14, 16)
     next_locale = "fr" if loc.locale == "en" else "en"
 
     def on_toggle_language(_: Event[ft.Container]) -> None:
@@ -49,9 +49,9 @@ def LanguageSelector() -> ft.Control:
         height=diameter,
         alignment=ft.Alignment.CENTER,
         bgcolor=colors.SURFACE,
-        border=ft.Border.all(1, colors.OUTLINE),
+        border=registry.border_all(1, colors.OUTLINE),
         border_radius=diameter / 2,
-        shadow=shadows.soft_shadow(metrics.scale),
+        shadow=registry.soft_shadow(metrics.scale),
         ink=True,
         tooltip=loc.t("select_language"),
         on_click=on_toggle_language,
@@ -68,14 +68,14 @@ def LanguageSelector() -> ft.Control:
 def Group(item: NavItem, selected: bool) -> ft.Control:
     route_context = ft.use_context(RouteContext)
     metrics = get_viewport_metrics(ft.context.page, min_scale=0.7)
-    icon_size = int(round(22 * metrics.scale))
+    icon_size = scaled(metrics, 22)
     return TangoNavItem(
         icon=item.icon,
         selected_icon=item.selected_icon,
         selected=selected,
         tooltip=item.label,
         icon_size=icon_size,
-        size=int(round((40 if metrics.is_compact else 48) * metrics.scale)),
+        size=scaled(metrics, 40, 48),
         on_click=lambda _: route_context.navigate(f"/{item.name}"),
     )
 
@@ -83,7 +83,7 @@ def Group(item: NavItem, selected: bool) -> ft.Control:
 @ft.component
 def Groups(nav_items: list[NavItem], selected_name: str | None) -> ft.Control:
     metrics = get_viewport_metrics(ft.context.page, min_scale=0.7)
-    nav_width = int(round((40 if metrics.is_compact else 48) * metrics.scale))
+    nav_width = scaled(metrics, 40, 48)
     return ft.Column(
         expand=True,
         spacing=0,
@@ -111,7 +111,7 @@ def AdminModeToggle() -> ft.Control:
 
     return TangoIconButton(
         icon=ft.Icons.SETTINGS if not is_admin else ft.Icons.HOME,
-        icon_size=int(round((20 if metrics.is_compact else 22) * metrics.scale)),
+        icon_size=scaled(metrics, 20, 22),
         tooltip=loc.t("admin_settings") if not is_admin else loc.t("main_view"),
         on_click=on_admin_click,
         variant="inverse" if is_admin else "surface",
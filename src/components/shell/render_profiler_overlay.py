@@ -0,0 +1,65 @@
+import asyncio
+from concurrent.futures import Future
+
+import flet as ft
+from flet.components.hooks.use_ref import MutableRef
+
+from components.ui.text import TangoText
+from theme import colors, spacing
+from utils.render_profiler import RenderStats, render_profiler
+
+_REFRESH_INTERVAL_S = 1.0
+_MAX_ROWS = 8
+
+
+def _format_row(row: RenderStats) -> str:
+    triggers = " ".join(f"{name}:{count}" for name, count in row.triggers.items())
+    return (
+        f"{row.component} ×{row.renders} "
+        f"{row.mean_ms:.1f}/{row.max_ms:.1f} ms  {triggers}"
+    )
+
+
+@ft.component
+def RenderProfilerOverlay() -> ft.Control:
+    """Dev-mode readout of the busiest components; never takes input."""
+    lines, set_lines = ft.use_state(list[str]())
+    refresh_task: MutableRef[Future[None]] = ft.use_ref(None)
+
+    async def refresh_loop() -> None:
+        current: list[str] = []
+        while True:
+            await asyncio.sleep(_REFRESH_INTERVAL_S)
+            latest = [
+                _format_row(row) for row in render_profiler.snapshot()[:_MAX_ROWS]
+            ]
+            if latest != current:
+                current = latest
+                set_lines(current)
+
+    def start_refresh() -> None:
+        refresh_task.current = ft.context.page.run_task(refresh_loop)
+
+    def stop_refresh() -> None:
+        if refresh_task.current is not None:
+            refresh_task.current.cancel()
+            refresh_task.current = None
+
+    ft.use_effect(start_refresh, [], cleanup=stop_refresh)
+
+    return ft.Container(
+        left=spacing.SM,
+        bottom=spacing.SM,
+        padding=spacing.XS,
+        border_radius=spacing.XS,
+        bgcolor=colors.DEBUG_OVERLAY,
+        ignore_interactions=True,
+        content=ft.Column(
+            spacing=0,
+            tight=True,
+            controls=[
+                TangoText(line, variant="caption", size=11, color=colors.TEXT_INVERSE)
+                for line in lines
+            ],
+        ),
+    )
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import flet as ft
 from flet.controls.control_event import ControlEventHandler
 from flet.controls.material.button import Button
@@ -33,6 +35,20 @@ _VARIANT_STYLES: dict[ButtonVariant, tuple[str, str, str]] = {
 }
 
 
+@lru_cache(maxsize=len(_VARIANT_STYLES) * len(_PADDING))
+def _button_style(variant: ButtonVariant, size: ButtonSize) -> ft.ButtonStyle:
+    """Shared per variant and size; read-only."""
+    background, foreground, border_color = _VARIANT_STYLES[variant]
+    pad_x, pad_y = _PADDING[size]
+    return ft.ButtonStyle(
+        bgcolor=background,
+        color=foreground,
+        side=ft.BorderSide(1, border_color),
+        padding=ft.Padding(pad_x, pad_y, pad_x, pad_y),
+        shape=ft.RoundedRectangleBorder(radius=radius.BUTTON),
+    )
+
+
 def TangoButton(
     text: str | None = None,
     *,
@@ -48,8 +64,7 @@ def TangoButton(
     width: int | None = None,
     text_size: int | None = None,
 ) -> ft.FilledButton:
-    background, foreground, border_color = _VARIANT_STYLES[variant]
-    pad_x, pad_y = _PADDING[size]
+    _, foreground, _ = _VARIANT_STYLES[variant]
     resolved_height = _HEIGHTS[size]
     resolved_icon_size = icon_size or (
         32 if size == "xl" else 22 if size == "lg" else 20
@@ -113,13 +128,7 @@ def TangoButton(
         tooltip=tooltip,
         disabled=disabled,
         on_click=on_click,
-        style=ft.ButtonStyle(
-            bgcolor=background,
-            color=foreground,
-            side=ft.BorderSide(1, border_color),
-            padding=ft.Padding(pad_x, pad_y, pad_x, pad_y),
-            shape=ft.RoundedRectangleBorder(radius=radius.BUTTON),
-        ),
+        style=_button_style(variant, size),
         content=content,
         height=resolved_height,
     )
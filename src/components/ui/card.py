@@ -1,6 +1,6 @@
 import flet as ft
 
-from theme import colors, radius, shadows, spacing
+from theme import colors, radius, registry, spacing
 
 
 def _resolve_padding(padding: ft.Padding | int | None) -> ft.Padding:
@@ -63,7 +63,7 @@ def TangoCard(
         height=height,
         bgcolor=colors.SURFACE,
         border_radius=border_radius or radius.PANEL,
-        border=ft.Border.all(1, colors.OUTLINE_STRONG),
-        shadow=shadows.card_shadow(1.3),
+        border=registry.border_all(1, colors.OUTLINE_STRONG),
+        shadow=registry.card_shadow(1.3),
         clip_behavior=ft.ClipBehavior.HARD_EDGE,
     )
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import flet as ft
 from flet.controls.control_event import ControlEventHandler
 from flet.controls.material.icon_button import IconButton
@@ -26,6 +28,28 @@ _VARIANT_STYLES: dict[IconButtonVariant, tuple[str, str, str]] = {
 }
 
 
+@lru_cache(maxsize=len(_VARIANT_STYLES))
+def _icon_button_style(variant: IconButtonVariant) -> ft.ButtonStyle:
+    """Shared per variant; read-only."""
+    bgcolor, border_color, icon_color = _VARIANT_STYLES[variant]
+    return ft.ButtonStyle(
+        bgcolor={
+            ft.ControlState.DEFAULT: bgcolor,
+            ft.ControlState.DISABLED: colors.SURFACE_SUBTLE,
+        },
+        icon_color={
+            ft.ControlState.DEFAULT: icon_color,
+            ft.ControlState.DISABLED: colors.TEXT_SOFT,
+        },
+        side={
+            ft.ControlState.DEFAULT: ft.BorderSide(1, border_color),
+            ft.ControlState.DISABLED: ft.BorderSide(1, colors.OUTLINE),
+        },
+        shape=ft.RoundedRectangleBorder(radius=radius.BUTTON),
+        animation_duration=ICON_BUTTON_STYLE_MS,
+    )
+
+
 def TangoIconButton(
     *,
     icon: ft.IconData,
@@ -38,7 +62,7 @@ def TangoIconButton(
 ) -> ft.IconButton:
     diameter, default_icon_size = _SIZE_MAP[size]
     resolved_icon_size = icon_size or default_icon_size
-    bgcolor, border_color, icon_color = _VARIANT_STYLES[variant]
+    _, _, icon_color = _VARIANT_STYLES[variant]
 
     return ft.IconButton(
         icon=icon,
@@ -50,20 +74,5 @@ def TangoIconButton(
         width=diameter,
         height=diameter,
         disabled_color=colors.TEXT_SOFT,
-        style=ft.ButtonStyle(
-            bgcolor={
-                ft.ControlState.DEFAULT: bgcolor,
-                ft.ControlState.DISABLED: colors.SURFACE_SUBTLE,
-            },
-            icon_color={
-                ft.ControlState.DEFAULT: icon_color,
-                ft.ControlState.DISABLED: colors.TEXT_SOFT,
-            },
-            side={
-                ft.ControlState.DEFAULT: ft.BorderSide(1, border_color),
-                ft.ControlState.DISABLED: ft.BorderSide(1, colors.OUTLINE),
-            },
-            shape=ft.RoundedRectangleBorder(radius=radius.BUTTON),
-            animation_duration=ICON_BUTTON_STYLE_MS,
-        ),
+        style=_icon_button_style(variant),
     )
@@ -2,7 +2,7 @@ import flet as ft
 from flet.controls.control_event import ControlEventHandler
 from flet.controls.material.container import Container
 
-from theme import colors, radius, shadows
+from theme import colors, radius, registry
 
 ControlHandler = ControlEventHandler[Container] | None
 
@@ -26,8 +26,8 @@ def TangoNavItem(
         border_radius=radius.BUTTON,
         tooltip=tooltip,
         bgcolor=colors.PRIMARY if selected else colors.SURFACE,
-        border=ft.Border.all(1, colors.PRIMARY if selected else colors.OUTLINE),
-        shadow=shadows.soft_shadow(),
+        border=registry.border_all(1, colors.PRIMARY if selected else colors.OUTLINE),
+        shadow=registry.soft_shadow(),
         content=ft.Row(
             [
                 ft.Icon(
@@ -5,7 +5,7 @@ from flet.controls.control_event import Event
 from flet.controls.material.icon_button import IconButton
 from components.ui.icon_button import IconButtonSize, TangoIconButton
 from components.ui.text import TangoText
-from theme import colors, spacing
+from theme import colors, registry, spacing
 from theme.scale import ViewportArea, get_viewport_metrics
 
 _BASE_DIGIT_DIAMETER = 72
@@ -26,7 +26,7 @@ def DigitButton(
         height=diameter,
         alignment=ft.Alignment.CENTER,
         bgcolor=colors.SURFACE,
-        border=ft.Border.all(1, colors.OUTLINE),
+        border=registry.border_all(1, colors.OUTLINE),
         border_radius=diameter / 2,
         ink=True,
         on_click=on_click,
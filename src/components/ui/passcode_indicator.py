@@ -3,7 +3,7 @@ from collections.abc import Callable
 
 import flet as ft
 
-from theme import animation, colors, radius
+from theme import animation, colors, radius, registry
 
 PASSCODE_LENGTH = 4
 _SHAKE_POINTS = [
@@ -41,7 +41,7 @@ def build_passcode_indicators(
                 height=indicator_size,
                 border_radius=radius.FULL,
                 bgcolor=colors.PRIMARY if is_active else colors.SURFACE,
-                border=ft.Border.all(
+                border=registry.border_all(
                     2,
                     colors.PRIMARY if is_active else colors.OUTLINE_STRONG,
                 ),
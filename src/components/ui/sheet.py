@@ -11,9 +11,14 @@ from services.app.overlay_registry import (
     cleanup_overlay,
     get_overlay_close_callback,
     get_overlay_control,
+    get_pooled_overlay_control,
+    mount_overlay_control,
+    pool_overlay_control,
     register_overlay,
 )
-from theme import colors, radius, shadows, spacing
+from services.app.page_state import PageSlot
+from services.app.update_scheduler import flush_updates, request_update
+from theme import colors, radius, registry, spacing
 from theme.animation import (
     OVERLAY_MOUNT_FRAME_DELAY_S,
     SHEET_ANCHOR_CLOSED_OFFSET,
@@ -29,7 +34,7 @@ from theme.animation import (
     SHEET_TRANSITION_MS,
     make,
 )
-from theme.scale import get_viewport_metrics
+from theme.scale import get_viewport_metrics, scaled
 
 from .icon_button import IconButtonSize, TangoIconButton
 from .text import TangoText
@@ -70,7 +75,9 @@ class _SheetRuntime:
     close_token: int
 
 
-_active_sheets: dict[int, _SheetRuntime] = {}
+_active_sheets: PageSlot[_SheetRuntime] = PageSlot("active_sheet")
+# One mounted shell per page, hidden between opens and reused by the next.
+_sheet_pool: PageSlot[_SheetRuntime] = PageSlot("sheet_pool")
 
 
 def _trigger_dismiss(
@@ -81,18 +88,24 @@ def _trigger_dismiss(
     on_dismiss()
 
 
-def _is_active_sheet(page_key: int, close_token: int) -> bool:
-    current = _active_sheets.get(page_key)
+def _is_active_sheet(page: ft.Page, close_token: int) -> bool:
+    current = _active_sheets.get(page)
     return current is not None and current.close_token == close_token
 
 
-def _clear_existing_sheet(page: ft.Page, page_key: int) -> None:
-    existing = _active_sheets.get(page_key)
+def _close_current_sheet(page: ft.Page) -> None:
+    close_sheet = get_overlay_close_callback(page, OverlayRole.SHEET)
+    if close_sheet is not None:
+        close_sheet()
+
+
+def _clear_existing_sheet(page: ft.Page) -> None:
+    existing = _active_sheets.get(page)
     if existing is None:
         return
 
     def finalize_cleanup() -> None:
-        _active_sheets.pop(page_key, None)
+        _active_sheets.pop(page)
 
     cleanup_overlay(
         page=page,
@@ -109,7 +122,7 @@ def _resolve_sheet_layout(
     full_screen: bool,
 ) -> _SheetLayout:
     metrics = get_viewport_metrics(page, min_scale=0.7)
-    top_band_height = int(round((68 if metrics.is_compact else 76) * metrics.scale))
+    top_band_height = scaled(metrics, 68, 76)
     is_docked = not full_screen
     panel_height = (
         metrics.height
@@ -127,16 +140,14 @@ def _resolve_sheet_layout(
         panel_height=panel_height,
         panel_radius=panel_radius,
         overlay_top_inset=float(top_band_height),
-        shadow=shadows.card_shadow(metrics.scale),
+        shadow=registry.card_shadow(metrics.scale),
         header_padding=ft.Padding(
             spacing.MD,
             spacing.SM if metrics.is_compact else spacing.MD,
             spacing.MD,
             spacing.SM if metrics.is_compact else spacing.MD,
         ),
-        header_title_size=int(
-            round((16 if metrics.is_compact else 18) * metrics.scale)
-        ),
+        header_title_size=scaled(metrics, 16, 18),
         close_button_size="sm" if metrics.is_compact else "md",
         body_padding=padding or spacing.LG,
     )
@@ -183,7 +194,7 @@ def _build_sheet_header(
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=layout.header_padding,
-            border=ft.Border(bottom=ft.BorderSide(1, colors.OUTLINE)),
+            border=registry.border_bottom(1, colors.OUTLINE),
         ),
         title_slot,
         close_button,
@@ -420,7 +431,7 @@ def _update_sheet_runtime(
         size=layout.header_title_size,
     )
     runtime.close_button.tooltip = getattr(page, "_tango_sheet_close_tooltip", "Close")
-    runtime.overlay.update()
+    request_update(page, runtime.overlay)
 
 
 def _create_sheet_runtime(
@@ -455,7 +466,9 @@ def _resolve_sheet_insert_index(page: ft.Page, insert_at: int | None) -> int:
         return insert_at
 
     next_insert_at = len(page.overlay)
-    toast_overlay = get_overlay_control(page, OverlayRole.TOAST)
+    toast_overlay = get_overlay_control(
+        page, OverlayRole.TOAST
+    ) or get_pooled_overlay_control(page, OverlayRole.TOAST)
     if toast_overlay is not None and toast_overlay in page.overlay:
         next_insert_at = page.overlay.index(toast_overlay)
     return next_insert_at
@@ -475,8 +488,7 @@ def _present_sheet(
     animate_in: bool,
     insert_at: int | None,
 ) -> ft.Container:
-    page_key = id(page)
-    current = _active_sheets.get(page_key)
+    current = _active_sheets.get(page)
     if current is not None and current.overlay in page.overlay:
         _update_sheet_runtime(
             current,
@@ -490,22 +502,26 @@ def _present_sheet(
         )
         return current.overlay
 
-    _clear_existing_sheet(page, page_key)
+    _clear_existing_sheet(page)
 
     close_token = time.monotonic_ns()
 
     def close_sheet() -> None:
-        current = _active_sheets.get(page_key)
+        current = _active_sheets.get(page)
         if current is None or current.close_token != close_token:
             return
         if current.overlay not in page.overlay:
             return
 
         _apply_closed_state(current)
-        current.overlay.update()
+        request_update(page, current.overlay)
+
+        closed_runtime = current
 
         def finalize_cleanup() -> None:
-            _active_sheets.pop(page_key, None)
+            _active_sheets.pop(page)
+            # The shell stays parked; drop the content it no longer shows.
+            closed_runtime.body_content_slot.content = None
             _trigger_dismiss(on_dismiss)
 
         cleanup_overlay(
@@ -513,15 +529,16 @@ def _present_sheet(
             role=OverlayRole.SHEET,
             control=current.overlay,
             delay_s=SHEET_CLOSE_DELAY_S,
-            is_current=lambda: _is_active_sheet(page_key, close_token),
+            is_current=lambda: _is_active_sheet(page, close_token),
             on_cleanup=finalize_cleanup,
+            keep_mounted=True,
         )
 
     def refresh_sheet() -> None:
-        if build is None or not _is_active_sheet(page_key, close_token):
+        if build is None or not _is_active_sheet(page, close_token):
             return
 
-        current = _active_sheets.get(page_key)
+        current = _active_sheets.get(page)
         next_insert_at = (
             page.overlay.index(current.overlay)
             if current is not None and current.overlay in page.overlay
@@ -542,18 +559,38 @@ def _present_sheet(
             insert_at=next_insert_at,
         )
 
-    runtime = _create_sheet_runtime(
-        page=page,
-        content=content,
-        title=title,
-        padding=padding,
-        full_screen=full_screen,
-        scrollable=scrollable,
-        body_align=body_align,
-        on_close=close_sheet,
-    )
+    runtime = _sheet_pool.get(page)
+    is_pooled = runtime is not None and runtime.overlay in page.overlay
+    if runtime is not None and is_pooled:
+        # Reuse the parked shell: swap content and layout, then reveal it.
+        runtime.overlay.visible = True
+        if not animate_in:
+            _apply_open_state(runtime)
+        _update_sheet_runtime(
+            runtime,
+            page=page,
+            content=content,
+            title=title,
+            padding=padding,
+            full_screen=full_screen,
+            scrollable=scrollable,
+            body_align=body_align,
+        )
+    else:
+        runtime = _create_sheet_runtime(
+            page=page,
+            content=content,
+            title=title,
+            padding=padding,
+            full_screen=full_screen,
+            scrollable=scrollable,
+            body_align=body_align,
+            on_close=lambda: _close_current_sheet(page),
+        )
+        _sheet_pool.set(page, runtime)
+        pool_overlay_control(page, OverlayRole.SHEET, runtime.overlay)
     runtime.close_token = close_token
-    _active_sheets[page_key] = runtime
+    _active_sheets.set(page, runtime)
     register_overlay(
         page,
         OverlayRole.SHEET,
@@ -562,24 +599,27 @@ def _present_sheet(
         refresh_callback=refresh_sheet if build is not None else None,
     )
 
-    resolved_insert_at = _resolve_sheet_insert_index(page, insert_at)
+    if is_pooled:
+        # The reveal must reach the client before the open state does.
+        flush_updates(page)
+    else:
+        if not animate_in:
+            _apply_open_state(runtime)
+        mount_overlay_control(
+            page, runtime.overlay, _resolve_sheet_insert_index(page, insert_at)
+        )
+
     if animate_in:
-        page.overlay.insert(resolved_insert_at, runtime.overlay)
-        page.update()
+        opened_runtime = runtime
 
         async def animate_in_task() -> None:
             await asyncio.sleep(OVERLAY_MOUNT_FRAME_DELAY_S)
-            if not _is_active_sheet(page_key, close_token):
+            if not _is_active_sheet(page, close_token):
                 return
-            current = _active_sheets[page_key]
-            _apply_open_state(current)
-            current.overlay.update()
+            _apply_open_state(opened_runtime)
+            request_update(page, opened_runtime.overlay)
 
         asyncio.create_task(animate_in_task())
-    else:
-        _apply_open_state(runtime)
-        page.overlay.insert(resolved_insert_at, runtime.overlay)
-        page.update()
 
     return runtime.overlay
 
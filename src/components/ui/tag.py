@@ -2,7 +2,7 @@ import flet as ft
 from typing import Literal
 
 from .text import TangoText
-from theme import colors, radius
+from theme import colors, radius, registry
 
 TagVariant = Literal["primary", "secondary", "success", "warning", "error", "neutral"]
 
@@ -26,7 +26,7 @@ def TangoTag(
     return ft.Container(
         bgcolor=bgcolor,
         border_radius=radius.TAG,
-        border=ft.Border.all(1, border_color),
+        border=registry.border_all(1, border_color),
         padding=ft.Padding(8, 6, 8, 6),
         height=40,
         alignment=ft.Alignment.CENTER,
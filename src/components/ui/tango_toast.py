@@ -1,8 +1,9 @@
 import asyncio
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
 
 import flet as ft
 from flet.controls.control_event import ControlEventHandler
@@ -12,9 +13,13 @@ from services.app.overlay_registry import (
     OverlayRole,
     cleanup_overlay,
     get_overlay_close_callback,
+    mount_overlay_control,
+    pool_overlay_control,
     register_overlay,
 )
-from theme import colors, radius, shadows
+from services.app.page_state import PageSlot
+from services.app.update_scheduler import request_update
+from theme import colors, radius, registry
 from theme.animation import (
     OVERLAY_MOUNT_FRAME_DELAY_S,
     TOAST_CLOSE_DELAY_S,
@@ -29,7 +34,8 @@ from theme.animation import (
     TOAST_VISIBLE_OPACITY,
     make,
 )
-from theme.scale import get_viewport_metrics
+from theme.scale import get_viewport_metrics, scaled
+from utils.ttl_cache import TtlKeyCache
 
 from .icon_button import TangoIconButton
 from .text import TangoText
@@ -66,10 +72,47 @@ class _ToastRuntime:
     expires_at: float | None
     message: str
     type: ToastType
+    is_closing: bool = False
+    # At most one animation and one auto-hide timer in flight per toast.
+    animation_task: asyncio.Task[None] | None = None
+    hide_task: asyncio.Task[None] | None = None
 
 
-_active_toasts: dict[int, _ToastRuntime] = {}
-_last_toast_at: dict[tuple[int, str], float] = {}
+@dataclass(frozen=True)
+class _QueuedToast:
+    message: str
+    type: ToastType
+    duration: float
+    position_top: int
+    position_right: int
+    close_tooltip: str | None
+    build: ToastBuild | None
+
+
+@dataclass
+class _ToastQueue:
+    entries: list[_QueuedToast] = field(default_factory=list)
+    dropped: int = 0
+
+
+_active_toasts: PageSlot[_ToastRuntime] = PageSlot("active_toast")
+_recent_toasts: PageSlot[TtlKeyCache] = PageSlot("recent_toasts")
+_toast_queues: PageSlot[_ToastQueue] = PageSlot("toast_queue")
+# One mounted shell per page, hidden between toasts and reused by the next.
+_toast_pool: PageSlot[_ToastRuntime] = PageSlot("toast_pool")
+
+# Higher preempts the visible toast; equal or lower waits in the queue.
+_TOAST_PRIORITY = {
+    ToastType.ERROR: 3,
+    ToastType.WARNING: 2,
+    ToastType.SUCCESS: 1,
+    ToastType.INFO: 0,
+}
+_TOAST_QUEUE_MAX = 8
+
+# Dedupe memory per page: bounded, and no entry outlives the longest window.
+_DEDUPE_MAX_KEYS = 64
+_DEDUPE_TTL_S = 30.0
 
 
 def TangoToast(
@@ -133,7 +176,7 @@ def TangoToast(
         padding=ft.Padding(pad_h_left, pad_v, pad_h_right, pad_v),
         border_radius=radius.TOAST,
         width=width,
-        shadow=shadows.card_shadow(metrics_scale),
+        shadow=registry.card_shadow(metrics_scale),
         animate_opacity=_TOAST_TRANSITION,
         animate_offset=_TOAST_TRANSITION,
         opacity=TOAST_HIDDEN_OPACITY,
@@ -143,6 +186,36 @@ def TangoToast(
     )
 
 
+# Leaf properties copied onto a mounted toast row, so swapping the message
+# patches a few values instead of resending the whole row.
+_TOAST_MERGED_PROPS: dict[type[ft.Control], tuple[str, ...]] = {
+    ft.Icon: ("icon", "color", "size"),
+    ft.Container: ("height",),
+    ft.Text: ("value", "style"),
+    ft.IconButton: ("tooltip", "on_click", "icon_size"),
+}
+
+
+def _merge_toast_row(
+    mounted: ft.Control | None,
+    next_row: ft.Control | None,
+) -> bool:
+    if not isinstance(mounted, ft.Row) or not isinstance(next_row, ft.Row):
+        return False
+    if len(mounted.controls) != len(next_row.controls):
+        return False
+    pairs = list(zip(mounted.controls, next_row.controls))
+    if any(type(current) is not type(next_control) for current, next_control in pairs):
+        return False
+    for current, next_control in pairs:
+        for name in _TOAST_MERGED_PROPS.get(type(current), ()):
+            value = getattr(next_control, name)
+            if getattr(current, name) != value:
+                setattr(current, name, value)
+    mounted.spacing = next_row.spacing
+    return True
+
+
 def _update_toast_container(
     *,
     container: ft.Container,
@@ -162,7 +235,8 @@ def _update_toast_container(
         right=layout.right,
         on_close=on_close,
     )
-    container.content = next_container.content
+    if not _merge_toast_row(container.content, next_container.content):
+        container.content = next_container.content
     container.bgcolor = next_container.bgcolor
     container.padding = next_container.padding
     container.border_radius = next_container.border_radius
@@ -172,19 +246,18 @@ def _update_toast_container(
     container.right = next_container.right
 
 
-def _is_active_toast(page_key: int, close_token: int) -> bool:
-    current = _active_toasts.get(page_key)
+def _is_active_toast(page: ft.Page, close_token: int) -> bool:
+    current = _active_toasts.get(page)
     return current is not None and current.close_token == close_token
 
 
 def _is_same_visible_toast(
     *,
     page: ft.Page,
-    page_key: int,
     message: str,
     type: ToastType,
 ) -> bool:
-    current = _active_toasts.get(page_key)
+    current = _active_toasts.get(page)
     if current is None:
         return False
     if current.container not in page.overlay:
@@ -192,13 +265,13 @@ def _is_same_visible_toast(
     return current.message == message and current.type == type
 
 
-def _clear_existing_toast(page: ft.Page, page_key: int) -> None:
-    existing = _active_toasts.get(page_key)
+def _clear_existing_toast(page: ft.Page) -> None:
+    existing = _active_toasts.get(page)
     if existing is None:
         return
 
     def finalize_cleanup() -> None:
-        _active_toasts.pop(page_key, None)
+        _active_toasts.pop(page)
 
     cleanup_overlay(
         page=page,
@@ -226,12 +299,12 @@ def _resolve_toast_layout(
     top = (
         int(resolved_top)
         if isinstance(resolved_top, int | float)
-        else int(round(position_top * metrics.scale))
+        else scaled(metrics, position_top)
     )
     right = (
         int(resolved_right)
         if isinstance(resolved_right, int | float)
-        else int(round(position_right * metrics.scale))
+        else scaled(metrics, position_right)
     )
     resolved_close_tooltip = (
         close_tooltip
@@ -299,10 +372,19 @@ def _build_toast_runtime(
     )
 
 
+def _replace_task(
+    previous: asyncio.Task[None] | None,
+    coroutine: Coroutine[Any, Any, None],
+) -> asyncio.Task[None]:
+    if previous is not None and not previous.done():
+        previous.cancel()
+    return asyncio.create_task(coroutine)
+
+
 def _schedule_toast_auto_hide(
     *,
     runtime: _ToastRuntime,
-    page_key: int,
+    page: ft.Page,
     close_token: int,
     hide_token: int,
     close_toast: Callable[[], None],
@@ -315,50 +397,49 @@ def _schedule_toast_auto_hide(
     async def auto_hide() -> None:
         remaining_s = max(0.0, expires_at - time.monotonic())
         await asyncio.sleep(remaining_s)
-        current = _active_toasts.get(page_key)
+        current = _active_toasts.get(page)
         if current is None:
             return
         if current.close_token != close_token or current.hide_token != hide_token:
             return
         close_toast()
 
-    asyncio.create_task(auto_hide())
+    runtime.hide_task = _replace_task(runtime.hide_task, auto_hide())
 
 
 def _schedule_toast_update_animation(
     *,
     runtime: _ToastRuntime,
-    page_key: int,
+    page: ft.Page,
     close_token: int,
     update_content: Callable[[], None],
 ) -> None:
     async def animate_update() -> None:
         runtime.container.animate_opacity = _TOAST_UPDATE_TRANSITION
         runtime.container.opacity = TOAST_UPDATE_DIM_OPACITY
-        runtime.container.update()
+        request_update(page, runtime.container)
 
         await asyncio.sleep(TOAST_UPDATE_DELAY_S)
-        if not _is_active_toast(page_key, close_token):
+        if not _is_active_toast(page, close_token):
             return
 
         update_content()
         runtime.container.opacity = TOAST_VISIBLE_OPACITY
-        runtime.container.update()
+        request_update(page, runtime.container)
 
         await asyncio.sleep(TOAST_UPDATE_DELAY_S)
-        if not _is_active_toast(page_key, close_token):
+        if not _is_active_toast(page, close_token):
             return
 
         runtime.container.animate_opacity = _TOAST_TRANSITION
 
-    asyncio.create_task(animate_update())
+    runtime.animation_task = _replace_task(runtime.animation_task, animate_update())
 
 
 def _update_active_toast(
     *,
     page: ft.Page,
     runtime: _ToastRuntime,
-    page_key: int,
     message: str,
     type: ToastType,
     duration: float,
@@ -382,37 +463,39 @@ def _update_active_toast(
     )
 
     def close_toast() -> None:
-        current = _active_toasts.get(page_key)
+        current = _active_toasts.get(page)
         if current is None or current.close_token != close_token:
             return
         if current.container not in page.overlay:
             return
 
         _apply_closed_state(current)
-        current.container.update()
+        current.is_closing = True
+        request_update(page, current.container)
 
         def finalize_cleanup() -> None:
-            _active_toasts.pop(page_key, None)
+            _active_toasts.pop(page)
+            _drain_toast_queue(page)
 
         cleanup_overlay(
             page=page,
             role=OverlayRole.TOAST,
             control=current.container,
             delay_s=TOAST_CLOSE_DELAY_S,
-            is_current=lambda: _is_active_toast(page_key, close_token),
+            is_current=lambda: _is_active_toast(page, close_token),
             on_cleanup=finalize_cleanup,
+            keep_mounted=True,
         )
 
     def refresh_toast() -> None:
-        if build is None or not _is_active_toast(page_key, close_token):
+        if build is None or not _is_active_toast(page, close_token):
             return
-        current = _active_toasts.get(page_key)
+        current = _active_toasts.get(page)
         if current is None:
             return
         _update_active_toast(
             page=page,
             runtime=current,
-            page_key=page_key,
             message=build(),
             type=type,
             duration=duration,
@@ -438,6 +521,7 @@ def _update_active_toast(
     runtime.expires_at = resolved_expires_at
     runtime.message = message
     runtime.type = type
+    runtime.is_closing = False
     _apply_open_state(runtime)
     register_overlay(
         page,
@@ -449,16 +533,16 @@ def _update_active_toast(
     if animate_update:
         _schedule_toast_update_animation(
             runtime=runtime,
-            page_key=page_key,
+            page=page,
             close_token=close_token,
             update_content=apply_content_update,
         )
     else:
         apply_content_update()
-        runtime.container.update()
+        request_update(page, runtime.container)
     _schedule_toast_auto_hide(
         runtime=runtime,
-        page_key=page_key,
+        page=page,
         close_token=close_token,
         hide_token=runtime.hide_token,
         close_toast=close_toast,
@@ -469,7 +553,6 @@ def _reset_active_toast_duration(
     *,
     page: ft.Page,
     runtime: _ToastRuntime,
-    page_key: int,
     duration: float,
 ) -> None:
     runtime.expires_at = _resolve_expires_at(duration=duration, expires_at=None)
@@ -479,7 +562,7 @@ def _reset_active_toast_duration(
         return
     _schedule_toast_auto_hide(
         runtime=runtime,
-        page_key=page_key,
+        page=page,
         close_token=runtime.close_token,
         hide_token=runtime.hide_token,
         close_toast=close_toast,
@@ -501,13 +584,11 @@ def _present_toast(
     insert_at: int | None,
     expires_at: float | None = None,
 ) -> None:
-    page_key = id(page)
-    current = _active_toasts.get(page_key)
+    current = _active_toasts.get(page)
     if current is not None and current.container in page.overlay:
         _update_active_toast(
             page=page,
             runtime=current,
-            page_key=page_key,
             message=message,
             type=type,
             duration=duration,
@@ -526,7 +607,7 @@ def _present_toast(
         position_top=position_top,
         position_right=position_right,
     )
-    _clear_existing_toast(page, page_key)
+    _clear_existing_toast(page)
 
     close_token = time.monotonic_ns()
     resolved_expires_at = _resolve_expires_at(
@@ -535,32 +616,35 @@ def _present_toast(
     )
 
     def close_toast() -> None:
-        current = _active_toasts.get(page_key)
+        current = _active_toasts.get(page)
         if current is None or current.close_token != close_token:
             return
         if current.container not in page.overlay:
             return
 
         _apply_closed_state(current)
-        current.container.update()
+        current.is_closing = True
+        request_update(page, current.container)
 
         def finalize_cleanup() -> None:
-            _active_toasts.pop(page_key, None)
+            _active_toasts.pop(page)
+            _drain_toast_queue(page)
 
         cleanup_overlay(
             page=page,
             role=OverlayRole.TOAST,
             control=current.container,
             delay_s=TOAST_CLOSE_DELAY_S,
-            is_current=lambda: _is_active_toast(page_key, close_token),
+            is_current=lambda: _is_active_toast(page, close_token),
             on_cleanup=finalize_cleanup,
+            keep_mounted=True,
         )
 
     def refresh_toast() -> None:
-        if build is None or not _is_active_toast(page_key, close_token):
+        if build is None or not _is_active_toast(page, close_token):
             return
 
-        current = _active_toasts.get(page_key)
+        current = _active_toasts.get(page)
         next_insert_at = (
             page.overlay.index(current.container)
             if current is not None and current.container in page.overlay
@@ -583,16 +667,36 @@ def _present_toast(
             ),
         )
 
-    runtime = _build_toast_runtime(
-        message=message,
-        type=type,
-        layout=layout,
-        on_close=lambda _: close_toast(),
-        expires_at=resolved_expires_at,
-    )
+    runtime = _toast_pool.get(page)
+    is_pooled = runtime is not None and runtime.container in page.overlay
+    if runtime is not None and is_pooled:
+        # Reuse the parked shell: swap its content, then reveal it.
+        _update_toast_container(
+            container=runtime.container,
+            message=message,
+            type=type,
+            layout=layout,
+            on_close=lambda _: close_toast(),
+        )
+        runtime.container.visible = True
+        runtime.container.animate_opacity = _TOAST_TRANSITION
+        runtime.expires_at = resolved_expires_at
+        runtime.message = message
+        runtime.type = type
+        runtime.is_closing = False
+    else:
+        runtime = _build_toast_runtime(
+            message=message,
+            type=type,
+            layout=layout,
+            on_close=lambda _: close_toast(),
+            expires_at=resolved_expires_at,
+        )
+        _toast_pool.set(page, runtime)
+        pool_overlay_control(page, OverlayRole.TOAST, runtime.container)
     runtime.close_token = close_token
     runtime.hide_token = time.monotonic_ns()
-    _active_toasts[page_key] = runtime
+    _active_toasts.set(page, runtime)
     register_overlay(
         page,
         OverlayRole.TOAST,
@@ -601,34 +705,115 @@ def _present_toast(
         refresh_callback=refresh_toast if build is not None else None,
     )
 
-    resolved_insert_at = len(page.overlay) if insert_at is None else insert_at
+    if not animate_in:
+        _apply_open_state(runtime)
+    if is_pooled:
+        # The reveal must reach the client before the open state does.
+        request_update(page, runtime.container, immediate=True)
+    else:
+        resolved_insert_at = len(page.overlay) if insert_at is None else insert_at
+        mount_overlay_control(page, runtime.container, resolved_insert_at)
+
     if animate_in:
-        page.overlay.insert(resolved_insert_at, runtime.container)
-        page.update()
+        opened_runtime = runtime
 
         async def animate_in_task() -> None:
             await asyncio.sleep(OVERLAY_MOUNT_FRAME_DELAY_S)
-            if not _is_active_toast(page_key, close_token):
+            if not _is_active_toast(page, close_token):
                 return
-            current = _active_toasts[page_key]
-            _apply_open_state(current)
-            current.container.update()
+            _apply_open_state(opened_runtime)
+            request_update(page, opened_runtime.container)
 
-        asyncio.create_task(animate_in_task())
-    else:
-        _apply_open_state(runtime)
-        page.overlay.insert(resolved_insert_at, runtime.container)
-        page.update()
+        runtime.animation_task = _replace_task(
+            runtime.animation_task, animate_in_task()
+        )
 
     _schedule_toast_auto_hide(
         runtime=runtime,
-        page_key=page_key,
+        page=page,
         close_token=close_token,
         hide_token=runtime.hide_token,
         close_toast=close_toast,
     )
 
 
+def _with_batch_count(page: ft.Page, message: str, extra_count: int) -> str:
+    template = getattr(page, "_tango_toast_more_events", "(+{count})")
+    return f"{message} {template.format(count=extra_count)}"
+
+
+def _enqueue_toast(page: ft.Page, entry: _QueuedToast) -> None:
+    queue = _toast_queues.get(page)
+    if queue is None:
+        queue = _ToastQueue()
+        _toast_queues.set(page, queue)
+    queue.entries = [
+        queued
+        for queued in queue.entries
+        if (queued.type, queued.message) != (entry.type, entry.message)
+    ]
+    queue.entries.append(entry)
+    if len(queue.entries) > _TOAST_QUEUE_MAX:
+        # Fault storms: drop the oldest of the least important, keep the count.
+        dropped_index = min(
+            range(len(queue.entries)),
+            key=lambda index: (_TOAST_PRIORITY[queue.entries[index].type], index),
+        )
+        queue.entries.pop(dropped_index)
+        queue.dropped += 1
+
+
+def _drain_toast_queue(page: ft.Page) -> None:
+    """
+    Shows what queued up behind the toast that just closed as one toast: the
+    newest of the most important entries, suffixed with how many others it
+    stands for.
+    """
+    queue = _toast_queues.get(page)
+    if queue is None or not queue.entries:
+        return
+    entries = queue.entries
+    extra_count = len(entries) - 1 + queue.dropped
+    queue.entries = []
+    queue.dropped = 0
+
+    top_index = max(
+        range(len(entries)),
+        key=lambda index: (_TOAST_PRIORITY[entries[index].type], index),
+    )
+    top = entries[top_index]
+    build = top.build
+    if build is not None and extra_count > 0:
+        entry_build = build
+
+        def build_batch() -> str:
+            return _with_batch_count(page, entry_build(), extra_count)
+
+        build = build_batch
+    message = (
+        build()
+        if build is not None
+        else (
+            _with_batch_count(page, top.message, extra_count)
+            if extra_count > 0
+            else top.message
+        )
+    )
+    _present_toast(
+        page=page,
+        message=message,
+        type=top.type,
+        duration=top.duration,
+        position_top=top.position_top,
+        position_right=top.position_right,
+        close_tooltip=top.close_tooltip,
+        build=build,
+        animate_in=True,
+        animate_update=True,
+        insert_at=None,
+    )
+
+
 def show_toast(
     page: ft.Page,
     message: str | None = None,
@@ -649,12 +834,10 @@ def show_toast(
     if resolved_message is None:
         raise ValueError("show_toast() could not resolve a message.")
 
-    page_key = id(page)
-    current = _active_toasts.get(page_key)
+    current = _active_toasts.get(page)
     if (
         _is_same_visible_toast(
             page=page,
-            page_key=page_key,
             message=resolved_message,
             type=type,
         )
@@ -663,17 +846,36 @@ def show_toast(
         _reset_active_toast_duration(
             page=page,
             runtime=current,
-            page_key=page_key,
             duration=duration,
         )
         return
 
-    toast_key = f"{type.value}:{resolved_message}"
-    now = time.monotonic()
-    last_shown = _last_toast_at.get((page_key, toast_key))
-    if last_shown is not None and (now - last_shown) < dedupe_window_s:
+    recent = _recent_toasts.get(page)
+    if recent is None:
+        recent = TtlKeyCache(max_size=_DEDUPE_MAX_KEYS, ttl_s=_DEDUPE_TTL_S)
+        _recent_toasts.set(page, recent)
+    if recent.seen_within((type, resolved_message), dedupe_window_s):
+        return
+
+    if (
+        current is not None
+        and not current.is_closing
+        and current.container in page.overlay
+        and _TOAST_PRIORITY[type] <= _TOAST_PRIORITY[current.type]
+    ):
+        _enqueue_toast(
+            page,
+            _QueuedToast(
+                message=resolved_message,
+                type=type,
+                duration=duration,
+                position_top=position_top,
+                position_right=position_right,
+                close_tooltip=close_tooltip,
+                build=build,
+            ),
+        )
         return
-    _last_toast_at[(page_key, toast_key)] = now
 
     _present_toast(
         page=page,
@@ -14,6 +14,7 @@ def TangoText(
     expand: bool | None = None,
     letter_spacing: float | None = None,
 ) -> ft.Text:
+    # Shared across every TangoText with the same look; never mutate it.
     style = typography.text_style(
         variant,
         color=color,
@@ -1,5 +1,7 @@
 import asyncio
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 
 import flet as ft
 
@@ -12,8 +14,35 @@ from components.ui.passcode_indicator import (
 from components.ui.tango_toast import ToastType, show_toast
 from contexts.locale import LocaleContext
 from contexts.settings import SettingsContext
+from services.app.update_scheduler import request_update
 from theme import colors, spacing, typography
-from theme.scale import ViewportArea, get_viewport_metrics
+from theme.scale import ViewportArea, ViewportMetrics, get_viewport_metrics, scaled
+
+
+@dataclass(frozen=True)
+class _PasscodeSheetLayout:
+    sheet_spacing: int
+    helper_spacing: int
+    top_padding: int
+    bottom_padding: int
+    instruction_size: int
+    helper_size: int
+    content_width: int
+
+
+@lru_cache(maxsize=8)
+def _passcode_sheet_layout(metrics: ViewportMetrics) -> _PasscodeSheetLayout:
+    return _PasscodeSheetLayout(
+        sheet_spacing=scaled(metrics, spacing.SM, spacing.MD),
+        helper_spacing=scaled(metrics, spacing.XS),
+        top_padding=scaled(metrics, spacing.SM, spacing.MD),
+        bottom_padding=scaled(metrics, spacing.SM, spacing.LG),
+        instruction_size=scaled(metrics, 18, 20),
+        helper_size=scaled(metrics, 14, 15),
+        content_width=min(
+            560, int(metrics.width * (0.88 if metrics.is_compact else 0.72))
+        ),
+    )
 
 
 @ft.component
@@ -36,21 +65,7 @@ def AdminPasscodeSheet(
         area=ViewportArea.CONTENT,
         min_scale=0.64,
     )
-    sheet_spacing = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    helper_spacing = int(round(spacing.XS * metrics.scale))
-    top_padding = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    bottom_padding = int(
-        round((spacing.SM if metrics.is_compact else spacing.LG) * metrics.scale)
-    )
-    instruction_size = int(round((18 if metrics.is_compact else 20) * metrics.scale))
-    helper_size = int(round((14 if metrics.is_compact else 15) * metrics.scale))
-    content_width = min(
-        560, int(metrics.width * (0.88 if metrics.is_compact else 0.72))
-    )
+    layout = _passcode_sheet_layout(metrics)
     is_confirming = len(new_passcode) == PASSCODE_LENGTH
     active_passcode = confirm_passcode if is_confirming else new_passcode
     instruction = loc.t(
@@ -62,7 +77,7 @@ def AdminPasscodeSheet(
     async def save_passcode(passcode: str) -> None:
         await asyncio.sleep(0.1)
         try:
-            await asyncio.to_thread(settings_service.update_admin_passcode, passcode)
+            await settings_service.update_admin_passcode_async(passcode)
         except Exception:
             show_toast(
                 page=page,
@@ -90,7 +105,7 @@ def AdminPasscodeSheet(
 
         def apply_shake_offset(point: ft.Offset) -> None:
             set_shake_offset(point)
-            page.update()
+            request_update(page)
 
         await animate_passcode_shake(apply_offset=apply_shake_offset)
         set_confirm_passcode("")
@@ -138,23 +153,23 @@ def AdminPasscodeSheet(
             set_new_passcode(new_passcode[:-1])
 
     return ft.Container(
-        width=content_width,
-        padding=ft.Padding(0, top_padding, 0, bottom_padding),
+        width=layout.content_width,
+        padding=ft.Padding(0, layout.top_padding, 0, layout.bottom_padding),
         alignment=ft.Alignment.TOP_CENTER,
         content=ft.Column(
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            spacing=sheet_spacing,
+            spacing=layout.sheet_spacing,
             controls=[
                 ft.Column(
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=helper_spacing,
+                    spacing=layout.helper_spacing,
                     controls=[
                         ft.Text(
                             value=step_value,
                             style=typography.text_style(
                                 "overline",
                                 color=colors.TEXT_SOFT,
-                                size=helper_size,
+                                size=layout.helper_size,
                             ),
                             text_align=ft.TextAlign.CENTER,
                         ),
@@ -162,7 +177,7 @@ def AdminPasscodeSheet(
                             value=instruction,
                             style=typography.text_style(
                                 "subtitle",
-                                size=instruction_size,
+                                size=layout.instruction_size,
                             ),
                             text_align=ft.TextAlign.CENTER,
                         ),
@@ -171,7 +186,7 @@ def AdminPasscodeSheet(
                             style=typography.text_style(
                                 "caption",
                                 color=colors.TEXT_MUTED,
-                                size=helper_size,
+                                size=layout.helper_size,
                             ),
                             text_align=ft.TextAlign.CENTER,
                         ),
@@ -1,12 +1,56 @@
+from dataclasses import dataclass
+from functools import lru_cache
+
 import flet as ft
 
 from components.ui.card import TangoCard
 from components.ui.tag import TangoTag, TagVariant
 from components.ui.text import TangoText
 from contexts.locale import LocaleContext
+from services.app.i18n import SECONDS_PER_TRAY_UNIT, TRAYS_PER_MINUTE_UNIT
 from services.motors.motor_service import MotorStatusSnapshot
-from theme import colors, spacing
-from theme.scale import ViewportArea, get_viewport_metrics
+from theme import colors, spacing, typography
+from theme.scale import ViewportArea, ViewportMetrics, get_viewport_metrics, scaled
+from utils.render_profiler import render_profiler
+
+
+@dataclass(frozen=True)
+class _StatusSheetLayout:
+    card_gap: int
+    content_padding: int
+    card_padding: int
+    section_gap: int
+    row_gap: int
+    title_size: int
+    value_size: int
+    caption_size: int
+    column_count: int
+    card_width: int
+    value_min_width: int
+
+
+@lru_cache(maxsize=16)
+def _status_sheet_layout(
+    metrics: ViewportMetrics,
+    status_count: int,
+) -> _StatusSheetLayout:
+    card_gap = scaled(metrics, spacing.SM, spacing.MD)
+    content_width = int(metrics.width * 0.9)
+    column_count = 1 if metrics.is_compact else min(2, max(1, status_count))
+    total_gap = card_gap * max(0, column_count - 1)
+    return _StatusSheetLayout(
+        card_gap=card_gap,
+        content_padding=scaled(metrics, spacing.SM, spacing.LG),
+        card_padding=scaled(metrics, spacing.MD, spacing.XL),
+        section_gap=scaled(metrics, spacing.MD, spacing.LG),
+        row_gap=scaled(metrics, spacing.XS, spacing.SM),
+        title_size=scaled(metrics, 19, 22),
+        value_size=scaled(metrics, 16, 18),
+        caption_size=scaled(metrics, 14, 15),
+        column_count=column_count,
+        card_width=max(320, int((content_width - total_gap) / column_count)),
+        value_min_width=scaled(metrics, 116, 136),
+    )
 
 
 def _format_metric(
@@ -37,12 +81,11 @@ def _build_metric_row(
                 expand=True,
                 content=ft.Text(
                     value=label,
-                    style=TangoText(
-                        "",
-                        variant="caption",
+                    style=typography.text_style(
+                        "caption",
                         size=label_size,
                         color=colors.TEXT_MUTED,
-                    ).style,
+                    ),
                     no_wrap=True,
                     max_lines=1,
                     overflow=ft.TextOverflow.ELLIPSIS,
@@ -53,12 +96,11 @@ def _build_metric_row(
                 alignment=ft.Alignment.CENTER_RIGHT,
                 content=ft.Text(
                     value=value,
-                    style=TangoText(
-                        "",
-                        variant="body_strong",
+                    style=typography.text_style(
+                        "body_strong",
                         size=value_size,
                         color=colors.TEXT,
-                    ).style,
+                    ),
                     text_align=ft.TextAlign.RIGHT,
                     no_wrap=True,
                     max_lines=1,
@@ -81,6 +123,7 @@ def _chunk_controls(
 
 
 @ft.component
+@render_profiler.profile("MotorStatusSheet")
 def MotorStatusSheet(
     *,
     statuses: list[MotorStatusSnapshot],
@@ -93,29 +136,13 @@ def MotorStatusSheet(
         area=ViewportArea.CONTENT,
         min_scale=0.72,
     )
-    card_gap = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    content_padding = int(
-        round((spacing.SM if metrics.is_compact else spacing.LG) * metrics.scale)
+    layout = _status_sheet_layout(metrics, len(statuses))
+    render_profiler.track(
+        locale=loc.locale,
+        metrics=metrics,
+        statuses=statuses,
+        target_sec_per_tray=target_sec_per_tray,
     )
-    card_padding = int(
-        round((spacing.MD if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
-    section_gap = int(
-        round((spacing.MD if metrics.is_compact else spacing.LG) * metrics.scale)
-    )
-    row_gap = int(
-        round((spacing.XS if metrics.is_compact else spacing.SM) * metrics.scale)
-    )
-    title_size = int(round((19 if metrics.is_compact else 22) * metrics.scale))
-    value_size = int(round((16 if metrics.is_compact else 18) * metrics.scale))
-    caption_size = int(round((14 if metrics.is_compact else 15) * metrics.scale))
-    content_width = int(metrics.width * (0.9 if metrics.is_compact else 0.9))
-    column_count = 1 if metrics.is_compact else min(2, max(1, len(statuses)))
-    total_gap = card_gap * max(0, column_count - 1)
-    card_width = max(320, int((content_width - total_gap) / column_count))
-    value_min_width = int(round((116 if metrics.is_compact else 136) * metrics.scale))
     unavailable_value = loc.t("motor_status_not_available")
 
     def resolve_status(snapshot: MotorStatusSnapshot) -> tuple[str, TagVariant]:
@@ -136,11 +163,11 @@ def MotorStatusSheet(
         )
         cards.append(
             ft.Container(
-                width=card_width,
+                width=layout.card_width,
                 content=TangoCard(
-                    padding=card_padding,
+                    padding=layout.card_padding,
                     content=ft.Column(
-                        spacing=section_gap,
+                        spacing=layout.section_gap,
                         controls=[
                             ft.Row(
                                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
@@ -149,20 +176,20 @@ def MotorStatusSheet(
                                     TangoText(
                                         f"{loc.t('motor_label')} {snapshot.motor_id}",
                                         variant="subtitle",
-                                        size=title_size,
+                                        size=layout.title_size,
                                     ),
                                     TangoTag(status_label, variant=status_variant),
                                 ],
                             ),
                             ft.Column(
-                                spacing=row_gap,
+                                spacing=layout.row_gap,
                                 controls=[
                                     _build_metric_row(
                                         label=loc.t("motor_direction"),
                                         value=direction_label,
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_temperature"),
@@ -171,9 +198,9 @@ def MotorStatusSheet(
                                             suffix="°C",
                                             fallback=unavailable_value,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_velocity"),
@@ -182,32 +209,31 @@ def MotorStatusSheet(
                                             suffix="rad/s",
                                             fallback=unavailable_value,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_tray_time"),
-                                        value=_format_metric(
+                                        value=loc.format_unit(
                                             target_sec_per_tray,
-                                            suffix=loc.t("seconds_per_tray_unit"),
-                                            fallback=unavailable_value,
+                                            SECONDS_PER_TRAY_UNIT,
+                                            precision=1,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_tray_rate"),
-                                        value=_format_metric(
+                                        value=loc.format_unit(
                                             target_trays_per_minute,
-                                            suffix=loc.t("trays_per_minute_unit"),
-                                            fallback=unavailable_value,
+                                            TRAYS_PER_MINUTE_UNIT,
                                             precision=1,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_torque"),
@@ -216,9 +242,9 @@ def MotorStatusSheet(
                                             suffix="Nm",
                                             fallback=unavailable_value,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                     _build_metric_row(
                                         label=loc.t("motor_current"),
@@ -227,9 +253,9 @@ def MotorStatusSheet(
                                             suffix="A",
                                             fallback=unavailable_value,
                                         ),
-                                        label_size=caption_size,
-                                        value_size=value_size,
-                                        value_min_width=value_min_width,
+                                        label_size=layout.caption_size,
+                                        value_size=layout.value_size,
+                                        value_min_width=layout.value_min_width,
                                     ),
                                 ],
                             ),
@@ -243,21 +269,24 @@ def MotorStatusSheet(
         ft.Row(
             alignment=ft.MainAxisAlignment.CENTER,
             vertical_alignment=ft.CrossAxisAlignment.START,
-            spacing=card_gap,
+            spacing=layout.card_gap,
             controls=row_controls,
         )
-        for row_controls in _chunk_controls(cards, chunk_size=column_count)
+        for row_controls in _chunk_controls(cards, chunk_size=layout.column_count)
     ]
 
     return ft.Container(
         expand=True,
         alignment=ft.Alignment.CENTER,
         padding=ft.Padding(
-            content_padding, content_padding, content_padding, content_padding
+            layout.content_padding,
+            layout.content_padding,
+            layout.content_padding,
+            layout.content_padding,
         ),
         content=ft.Column(
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            spacing=card_gap,
+            spacing=layout.card_gap,
             controls=rows,
         ),
     )
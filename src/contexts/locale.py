@@ -3,21 +3,26 @@ from dataclasses import dataclass
 
 import flet as ft
 
+from services.app.i18n import TranslationBundle
+
 
 @dataclass(frozen=True)
 class LocaleContextValue:
     locale: str
-    translations: dict[str, str]
+    translations: TranslationBundle
     set_locale: Callable[[str], None]
 
     def t(self, key: str, default: str | None = None) -> str:
-        return self.translations.get(key, default or key)
+        return self.translations.t(key, default)
+
+    def format_unit(self, value: float, unit_key: str, *, precision: int = 0) -> str:
+        return self.translations.format_unit(value, unit_key, precision=precision)
 
 
 LocaleContext = ft.create_context(
     LocaleContextValue(
         locale="en",
-        translations={},
+        translations=TranslationBundle("en", {}),
         set_locale=lambda _: None,
     )
 )
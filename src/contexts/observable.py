@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+import flet as ft
+
+
+class _FieldWatch:
+    """Observable listener that only fires for a selected set of fields."""
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        self.fields: frozenset[str] = frozenset()
+        self._on_change = on_change
+        self._observable: ft.Observable | None = None
+        self._dispose: Callable[[], None] | None = None
+        # Observables keep listeners in a WeakSet; hold the bound method here.
+        self._listener = self._notify
+
+    def bind(self, observable: ft.Observable, fields: Iterable[str]) -> None:
+        self.fields = frozenset(fields)
+        if observable is self._observable:
+            return
+        self.close()
+        self._observable = observable
+        self._dispose = observable.subscribe(self._listener)
+
+    def close(self) -> None:
+        if self._dispose is not None:
+            self._dispose()
+        self._dispose = None
+        self._observable = None
+
+    def _notify(self, _sender: object, field: str | None) -> None:
+        # `field` is None for a manual notify(): treat it as "anything changed".
+        if field is None or field in self.fields:
+            self._on_change()
+
+
+def use_fields(observable: object, *fields: str) -> None:
+    """
+    Re-renders the calling component when one of `fields` changes on
+    `observable`, and for no other field.
+
+    Services reached through a context are not subscribed to automatically, so
+    every component declares the fields it renders from. An empty `fields`
+    keeps the component unsubscribed.
+    """
+    if not isinstance(observable, ft.Observable):
+        raise TypeError(f"{type(observable).__name__} is not observable")
+
+    _, set_revision = ft.use_state(0)
+    watch = ft.use_memo(
+        lambda: _FieldWatch(lambda: set_revision(lambda revision: revision + 1)),
+        dependencies=[],
+    )
+    watch.bind(observable, fields)
+    ft.on_unmounted(watch.close)
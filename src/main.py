@@ -1,11 +1,15 @@
-import flet as ft
+from utils.startup_trace import startup_trace
 
-from app import App
-from utils.config import config
-from utils.logging_config import setup_logging
+with startup_trace.span("import app"):
+    import flet as ft
+
+    from app import App
+    from utils.config import config
+    from utils.logging_config import setup_logging
 
 if __name__ == "__main__":
     setup_logging(level=config.log_level)
+    startup_trace.mark("flet run")
     ft.run(  # pyright: ignore[reportUnknownMemberType]
         lambda page: page.render_views(  # pyright: ignore[reportUnknownMemberType]
             lambda: App()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from urllib.parse import parse_qsl, urlsplit
+
+_MAX_HEADER_BYTES = 16 * 1024
+_MAX_BODY_BYTES = 64 * 1024
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass(frozen=True)
+class HttpRequest:
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> dict[str, object]:
+        if not self.body:
+            return {}
+        try:
+            payload = json.loads(
+                self.body.decode("utf-8"), parse_constant=_reject_json_constant
+            )
+        except (UnicodeDecodeError, ValueError) as ex:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid JSON body") from ex
+        if not isinstance(payload, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "JSON body must be an object")
+        return payload
+
+
+def _reject_json_constant(name: str) -> object:
+    # NaN and Infinity are not JSON, but json.loads accepts them by default.
+    raise ValueError(f"Unsupported JSON constant {name}")
+
+
+async def read_request(reader: asyncio.StreamReader) -> HttpRequest | None:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError as ex:
+        raise HttpError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large"
+        ) from ex
+
+    if len(head) > _MAX_HEADER_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Headers too large")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError as ex:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line") from ex
+
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, separator, value = line.partition(":")
+        if not separator:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed header line")
+        headers[name.strip().lower()] = value.strip()
+
+    content_length = _parse_content_length(headers.get("content-length", "0"))
+    body = await reader.readexactly(content_length) if content_length else b""
+    url = urlsplit(target)
+    return HttpRequest(
+        method=method.upper(),
+        path=url.path or "/",
+        query=dict(parse_qsl(url.query)),
+        headers=headers,
+        body=body,
+    )
+
+
+def encode_response(
+    status: HTTPStatus,
+    body: bytes,
+    *,
+    content_type: str,
+) -> bytes:
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Cache-Control: no-store\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def json_response(status: HTTPStatus, payload: object) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return encode_response(status, body, content_type="application/json")
+
+
+def event_stream_head() -> bytes:
+    return (
+        f"HTTP/1.1 {HTTPStatus.OK.value} {HTTPStatus.OK.phrase}\r\n"
+        "Content-Type: text/event-stream\r\n"
+        "Cache-Control: no-store\r\n"
+        "Connection: keep-alive\r\n"
+        "\r\n"
+    ).encode("latin-1")
+
+
+def encode_event(data: str) -> bytes:
+    return f"data: {data}\n\n".encode("utf-8")
+
+
+def _parse_content_length(value: str) -> int:
+    try:
+        length = int(value)
+    except ValueError as ex:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from ex
+    if length < 0:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    if length > _MAX_BODY_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body too large")
+    return length
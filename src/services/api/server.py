@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from http import HTTPStatus
+
+from models.motor_types import MotorAction, MotorActionResult
+from services.motors.controller import MotorController
+from services.motors.presets import TrayPreset
+from services.motors.schedule import ScheduleStep
+from utils.metrics import metrics
+from .http import (
+    HttpError,
+    HttpRequest,
+    encode_event,
+    encode_response,
+    event_stream_head,
+    json_response,
+    read_request,
+)
+
+logger = logging.getLogger(__name__)
+
+_CLIENT_QUEUE_SIZE = 8
+_CLIENT_DRAIN_TIMEOUT_S = 5.0
+_REQUEST_TIMEOUT_S = 10.0
+_SUCCESS_ACTIONS = {MotorAction.STARTED, MotorAction.STOPPED}
+_METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_TELEMETRY_DROPPED = metrics.counter(
+    "tango_api_telemetry_dropped_total",
+    "Telemetry frames dropped for slow stream clients",
+)
+_TELEMETRY_CLIENTS = metrics.gauge(
+    "tango_api_telemetry_clients",
+    "Connected telemetry stream clients",
+)
+
+RouteHandler = Callable[[HttpRequest], Awaitable[tuple[HTTPStatus, object]]]
+
+
+class _TelemetryHub:
+    """Samples telemetry once per period and fans it out to bounded client queues."""
+
+    def __init__(
+        self,
+        *,
+        sample: Callable[[], Awaitable[str]],
+        period_s: float,
+        queue_size: int,
+    ) -> None:
+        self._sample = sample
+        self._period_s = period_s
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    def subscribe(self) -> asyncio.Queue[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        _TELEMETRY_CLIENTS.set(len(self._subscribers))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        self._subscribers.discard(queue)
+        _TELEMETRY_CLIENTS.set(len(self._subscribers))
+
+    def close(self) -> None:
+        self._subscribers.clear()
+        _TELEMETRY_CLIENTS.set(0)
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            started_at = time.monotonic()
+            try:
+                message = await self._sample()
+            except Exception:
+                logger.exception("Telemetry sampling failed")
+            else:
+                for queue in list(self._subscribers):
+                    self._offer(queue, message)
+            elapsed_s = time.monotonic() - started_at
+            await asyncio.sleep(max(0.0, self._period_s - elapsed_s))
+
+    def _offer(self, queue: asyncio.Queue[str], message: str) -> None:
+        # Slow clients lose their oldest frame instead of growing the queue.
+        if queue.full():
+            try:
+                queue.get_nowait()
+                _TELEMETRY_DROPPED.inc()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(message)
+
+
+class ControlApiServer:
+    """Local HTTP control surface for line integrations (PLC/MES)."""
+
+    def __init__(
+        self,
+        *,
+        motor_controller: MotorController,
+        host: str,
+        port: int,
+        telemetry_hz: float,
+    ) -> None:
+        self._motor_controller = motor_controller
+        self._host = host
+        self._port = port
+        self._server: asyncio.Server | None = None
+        self._telemetry = _TelemetryHub(
+            sample=self._sample_telemetry,
+            period_s=1.0 / max(0.1, telemetry_hz),
+            queue_size=_CLIENT_QUEUE_SIZE,
+        )
+        self._routes: dict[tuple[str, str], RouteHandler] = {
+            ("GET", "/status"): self._handle_status,
+            ("POST", "/motors/start"): self._handle_start,
+            ("POST", "/motors/stop"): self._handle_stop,
+            ("POST", "/motors/rescan"): self._handle_rescan,
+            ("POST", "/tray-time"): self._handle_set_sec_per_tray,
+            ("GET", "/presets"): self._handle_list_presets,
+            ("POST", "/presets"): self._handle_save_preset,
+            ("POST", "/presets/apply"): self._handle_apply_preset,
+            ("POST", "/presets/delete"): self._handle_delete_preset,
+            ("GET", "/schedule"): self._handle_schedule_status,
+            ("POST", "/schedule"): self._handle_start_schedule,
+            ("POST", "/schedule/cancel"): self._handle_cancel_schedule,
+        }
+
+    async def serve(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            host=self._host,
+            port=self._port,
+        )
+        logger.info("Control API listening on http://%s:%s", self._host, self._port)
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            logger.info("Control API stopped")
+
+    def close(self) -> None:
+        self._telemetry.close()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request = await asyncio.wait_for(read_request(reader), _REQUEST_TIMEOUT_S)
+            if request is None:
+                return
+            if request.method == "GET" and request.path == "/telemetry/stream":
+                await self._stream_telemetry(writer)
+                return
+            if request.method == "GET" and request.path == "/metrics":
+                writer.write(
+                    encode_response(
+                        HTTPStatus.OK,
+                        metrics.render().encode("utf-8"),
+                        content_type=_METRICS_CONTENT_TYPE,
+                    )
+                )
+                await writer.drain()
+                return
+
+            handler = self._routes.get((request.method, request.path))
+            if handler is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, "Unknown endpoint")
+            status, payload = await handler(request)
+            writer.write(json_response(status, payload))
+            await writer.drain()
+        except HttpError as ex:
+            writer.write(json_response(ex.status, {"error": ex.message}))
+            await writer.drain()
+        except (ConnectionError, asyncio.TimeoutError):
+            logger.debug("Control API client disconnected")
+        except Exception:
+            logger.exception("Control API request failed")
+            writer.write(
+                json_response(
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    {"error": "Internal error"},
+                )
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _stream_telemetry(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(event_stream_head())
+        await writer.drain()
+        queue = self._telemetry.subscribe()
+        try:
+            while True:
+                message = await queue.get()
+                writer.write(encode_event(message))
+                await asyncio.wait_for(writer.drain(), _CLIENT_DRAIN_TIMEOUT_S)
+        finally:
+            self._telemetry.unsubscribe(queue)
+
+    async def _sample_telemetry(self) -> str:
+        snapshots = await asyncio.to_thread(
+            self._motor_controller.peek_status_snapshots
+        )
+        payload = self._controller_state()
+        payload["motors"] = [asdict(snapshot) for snapshot in snapshots]
+        return json.dumps(payload, separators=(",", ":"))
+
+    def _controller_state(self) -> dict[str, object]:
+        controller = self._motor_controller
+        throughput = controller.get_throughput_snapshot()
+        schedule = controller.get_schedule_status()
+        return {
+            "timestamp": time.time(),
+            "is_running": controller.is_motors_running,
+            "sec_per_tray": controller.sec_per_tray,
+            "sec_per_tray_min": controller.sec_per_tray_min,
+            "sec_per_tray_max": controller.sec_per_tray_max,
+            "trays_per_minute": controller.trays_per_minute,
+            "target_velocity_rad_s": controller.target_velocity_rad_s,
+            "active_preset": controller.active_preset,
+            "schedule": None if schedule is None else asdict(schedule),
+            "throughput": asdict(throughput),
+        }
+
+    async def _handle_status(self, _: HttpRequest) -> tuple[HTTPStatus, object]:
+        return HTTPStatus.OK, self._controller_state()
+
+    # Motor actions take the motor lock and talk to the CAN bus (stop waits
+    # out the ramp-down), so the controller's `_async` variants run them on a
+    # worker thread like the telemetry sampler: the telemetry stream and
+    # /metrics keep being served meanwhile.
+    async def _handle_start(self, _: HttpRequest) -> tuple[HTTPStatus, object]:
+        result = await self._motor_controller.start_motors_async()
+        return _action_response(result)
+
+    async def _handle_stop(self, _: HttpRequest) -> tuple[HTTPStatus, object]:
+        result = await self._motor_controller.stop_motors_async()
+        return _action_response(result)
+
+    async def _handle_rescan(self, _: HttpRequest) -> tuple[HTTPStatus, object]:
+        rescanned = await self._motor_controller.rescan_motors_async()
+        status = HTTPStatus.OK if rescanned else HTTPStatus.SERVICE_UNAVAILABLE
+        return status, {"rescanned": rescanned, **self._controller_state()}
+
+    async def _handle_set_sec_per_tray(
+        self,
+        request: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        value = request.json().get("sec_per_tray")
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, int | float)
+            or not math.isfinite(value)
+        ):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'sec_per_tray' must be a number")
+        changed = await self._motor_controller.set_sec_per_tray_async(float(value))
+        return HTTPStatus.OK, {"changed": changed, **self._controller_state()}
+
+    async def _handle_list_presets(self, _: HttpRequest) -> tuple[HTTPStatus, object]:
+        presets = self._motor_controller.list_presets()
+        return HTTPStatus.OK, {"presets": [preset.to_dict() for preset in presets]}
+
+    async def _handle_save_preset(
+        self,
+        request: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        try:
+            preset = TrayPreset.from_dict(request.json())
+        except (ValueError, TypeError, KeyError, AttributeError) as ex:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid preset: {ex}") from ex
+        await self._motor_controller.save_preset_async(preset)
+        return HTTPStatus.OK, preset.to_dict()
+
+    async def _handle_apply_preset(
+        self,
+        request: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        name = _preset_name(request)
+        if not await self._motor_controller.apply_preset_async(name):
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown preset '{name}'")
+        return HTTPStatus.OK, self._controller_state()
+
+    async def _handle_delete_preset(
+        self,
+        request: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        name = _preset_name(request)
+        deleted = await self._motor_controller.delete_preset_async(name)
+        if not deleted:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown preset '{name}'")
+        return HTTPStatus.OK, {"deleted": name}
+
+    async def _handle_schedule_status(
+        self,
+        _: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        status = self._motor_controller.get_schedule_status()
+        return HTTPStatus.OK, {"schedule": None if status is None else asdict(status)}
+
+    async def _handle_start_schedule(
+        self,
+        request: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        body = request.json()
+        raw_steps = body.get("steps")
+        if not isinstance(raw_steps, list) or not raw_steps:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "'steps' must be a non-empty list")
+        try:
+            steps = [ScheduleStep.from_dict(item) for item in raw_steps]
+        except (ValueError, TypeError, KeyError) as ex:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid step: {ex}") from ex
+        result = await self._motor_controller.start_schedule_async(
+            steps,
+            stop_at_end=body.get("stop_at_end") is True,
+        )
+        status, payload = _action_response(result)
+        return status, {**payload, **self._controller_state()}
+
+    async def _handle_cancel_schedule(
+        self,
+        _: HttpRequest,
+    ) -> tuple[HTTPStatus, object]:
+        cancelled = await self._motor_controller.cancel_schedule_async()
+        return HTTPStatus.OK, {"cancelled": cancelled, **self._controller_state()}
+
+
+def _preset_name(request: HttpRequest) -> str:
+    name = request.json().get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise HttpError(HTTPStatus.BAD_REQUEST, "'name' must be a non-empty string")
+    return name.strip()
+
+
+def _action_response(
+    result: MotorActionResult,
+) -> tuple[HTTPStatus, dict[str, object]]:
+    status = (
+        HTTPStatus.OK
+        if result.action in _SUCCESS_ACTIONS
+        else HTTPStatus.SERVICE_UNAVAILABLE
+    )
+    return status, {"action": result.action.value, "error": result.error}
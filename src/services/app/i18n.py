@@ -1,9 +1,45 @@
 import json
 import logging
+import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Unit keys used with `TranslationBundle.format_unit`.
+SECONDS_PER_TRAY_UNIT = "seconds_per_tray_unit"
+TRAYS_PER_MINUTE_UNIT = "trays_per_minute_unit"
+TRAYS_UNIT = "trays_unit"
+
+
+class TranslationBundle:
+    """
+    One locale merged over the fallback locale, compiled once and read-only.
+
+    Keys are interned so lookups with literal keys (interned by Python too)
+    match on identity. Unit templates are formatted once per precision.
+    """
+
+    def __init__(self, locale: str, strings: Mapping[str, str]) -> None:
+        self.locale = locale
+        self._strings = {sys.intern(key): value for key, value in strings.items()}
+        self.strings: Mapping[str, str] = MappingProxyType(self._strings)
+        self._unit_templates: dict[tuple[str, int], str] = {}
+
+    def t(self, key: str, default: str | None = None) -> str:
+        return self._strings.get(key, default or key)
+
+    def format_unit(self, value: float, unit_key: str, *, precision: int = 0) -> str:
+        """Formats e.g. `4.0 trays/min` from a cached `"{:.1f} trays/min"`."""
+        template_key = (unit_key, precision)
+        template = self._unit_templates.get(template_key)
+        if template is None:
+            unit = self.t(unit_key).replace("{", "{{").replace("}", "}}")
+            template = f"{{:.{precision}f}} {unit}"
+            self._unit_templates[template_key] = template
+        return template.format(value)
+
 
 class I18nService:
     def __init__(self, lang_root: Path | None = None) -> None:
@@ -11,14 +47,31 @@ class I18nService:
         self._lang_root = lang_root or (project_root / "assets" / "lang")
         self._default_locale = "en"
         self._default_translations = self._read_locale_file(self._default_locale)
+        self._bundles: dict[str, TranslationBundle] = {}
 
-    def translations_for(self, locale: str) -> dict[str, str]:
+    def bundle_for(self, locale: str) -> TranslationBundle:
+        """Each locale is read, merged and compiled once, then served cached."""
         normalized_locale = locale.lower()
-        if normalized_locale == self._default_locale:
-            return dict(self._default_translations)
+        bundle = self._bundles.get(normalized_locale)
+        if bundle is None:
+            bundle = TranslationBundle(
+                normalized_locale, self._merged_translations(normalized_locale)
+            )
+            self._bundles[normalized_locale] = bundle
+        return bundle
+
+    def preload(self) -> None:
+        # Compile every shipped locale so a switch never touches the disk.
+        for lang_file in sorted(self._lang_root.glob("*.json")):
+            self.bundle_for(lang_file.stem)
+
+    def translations_for(self, locale: str) -> Mapping[str, str]:
+        return self.bundle_for(locale).strings
 
+    def _merged_translations(self, locale: str) -> dict[str, str]:
         translations = dict(self._default_translations)
-        translations.update(self._read_locale_file(normalized_locale))
+        if locale != self._default_locale:
+            translations.update(self._read_locale_file(locale))
         return translations
 
     def _read_locale_file(self, locale: str) -> dict[str, str]:
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
@@ -6,6 +7,10 @@ from enum import StrEnum
 import flet as ft
 from flet.controls.base_control import BaseControl
 
+from .update_scheduler import discard_update, request_update
+
+logger = logging.getLogger(__name__)
+
 
 class OverlayRole(StrEnum):
     SHEET = "sheet"
@@ -13,6 +18,7 @@ class OverlayRole(StrEnum):
 
 
 _PAGE_OVERLAYS_ATTR = "_tango_overlays"
+_PAGE_POOL_ATTR = "_tango_overlay_pool"
 
 
 @dataclass
@@ -85,11 +91,55 @@ def refresh_overlay(page: ft.Page, role: OverlayRole) -> None:
         callback()
 
 
+def get_pooled_overlay_control(page: ft.Page, role: OverlayRole) -> ft.Control | None:
+    """The parked shell kept mounted for `role`, if it is still in the overlay."""
+    pool = getattr(page, _PAGE_POOL_ATTR, None)
+    if not isinstance(pool, dict):
+        return None
+    control = pool.get(role)
+    return control if control is not None and control in page.overlay else None
+
+
+def pool_overlay_control(page: ft.Page, role: OverlayRole, control: ft.Control) -> None:
+    pool = getattr(page, _PAGE_POOL_ATTR, None)
+    if not isinstance(pool, dict):
+        pool = {}
+        setattr(page, _PAGE_POOL_ATTR, pool)
+    pool[role] = control
+
+
+def _overlay_host(page: ft.Page) -> BaseControl:
+    # The control holding `page.overlay`: patching it diffs the overlay
+    # subtree only, not the views. `BasePage._overlay` is private Flet API,
+    # checked against Flet 0.80.5; if it goes away, fall back to the page.
+    host = getattr(page, "_overlay", None)
+    if isinstance(host, BaseControl):
+        return host
+    logger.debug("Page has no overlay host control; updating the whole page")
+    return page
+
+
+def mount_overlay_control(page: ft.Page, control: ft.Control, index: int) -> None:
+    """Inserts an overlay root and sends it right away, before any animation."""
+    page.overlay.insert(index, control)
+    request_update(page, _overlay_host(page), immediate=True)
+
+
+def park_overlay_control(page: ft.Page, control: ft.Control) -> bool:
+    """Hides a pooled shell instead of unmounting it, so reopening is a diff."""
+    if control not in page.overlay:
+        return False
+    control.visible = False
+    request_update(page, control)
+    return True
+
+
 def remove_overlay_control(page: ft.Page, control: BaseControl) -> bool:
     if control not in page.overlay:
         return False
     page.overlay.remove(control)
-    page.update()
+    discard_update(page, control)
+    request_update(page, _overlay_host(page))
     return True
 
 
@@ -101,9 +151,13 @@ def cleanup_overlay(
     delay_s: float = 0.0,
     is_current: Callable[[], bool] | None = None,
     on_cleanup: Callable[[], None] | None = None,
+    keep_mounted: bool = False,
 ) -> None:
     def finalize_cleanup() -> None:
-        remove_overlay_control(page, control)
+        if keep_mounted and isinstance(control, ft.Control):
+            park_overlay_control(page, control)
+        else:
+            remove_overlay_control(page, control)
         unregister_overlay(page, role)
         if on_cleanup is not None:
             on_cleanup()
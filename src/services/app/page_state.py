@@ -0,0 +1,32 @@
+from typing import Generic, TypeVar
+
+import flet as ft
+
+T = TypeVar("T")
+
+
+class PageSlot(Generic[T]):
+    """
+    One value per page, stored on the page itself.
+
+    Module-level dicts keyed by `id(page)` keep every session's state alive
+    after its page is gone (and can hand it to a new page reusing the id).
+    A slot has no strong reference outside the page, so its values are
+    collected together with the page, cycles included.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._attr = f"_tango_{name}"
+
+    def get(self, page: ft.Page) -> T | None:
+        value: T | None = getattr(page, self._attr, None)
+        return value
+
+    def set(self, page: ft.Page, value: T) -> None:
+        setattr(page, self._attr, value)
+
+    def pop(self, page: ft.Page) -> T | None:
+        value = self.get(page)
+        if value is not None:
+            setattr(page, self._attr, None)
+        return value
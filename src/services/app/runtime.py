@@ -1,17 +1,73 @@
 import asyncio
 import logging
 from collections.abc import Callable
+from typing import cast
 
 import flet as ft
 
+from services.api.server import ControlApiServer
 from services.app.overlay_registry import OverlayRole, get_overlay_close_callback
+from services.app.update_scheduler import request_update
 from services.motors.controller import MotorController
 from .settings import SettingsService
 from .shell import ShellService
 from theme.builder import configure_page
 from utils.config import config
+from utils.files import write_text_atomic
+from utils.metrics import metrics
+from utils.render_profiler import render_profiler
+from utils.startup_trace import startup_trace
 
 logger = logging.getLogger(__name__)
+_MOTOR_SYNC_INTERVAL_S = 1.0
+_RESIZE_DEBOUNCE_S = 0.1
+_RENDER_PROFILE_DUMP_INTERVAL_S = 10.0
+
+_SCREENSAVER_TIMER_LAG = metrics.gauge(
+    "tango_ui_screensaver_timer_lag_seconds",
+    "Extra delay of the last screensaver deadline wakeup",
+)
+
+
+class _ViewportStabilizer:
+    """
+    Waits for resize events to go quiet instead of polling the page size.
+    Resize handlers run on the event loop, so a plain asyncio.Event is enough.
+    """
+
+    def __init__(self, read_size: Callable[[], tuple[float, float]]) -> None:
+        self._read_size = read_size
+        self._resized = asyncio.Event()
+
+    def notify_resized(self) -> None:
+        self._resized.set()
+
+    async def wait_stable(
+        self,
+        *,
+        timeout_s: float,
+        quiet_s: float,
+        expected_size: tuple[float, float] | None,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_s
+        while True:
+            size = self._read_size()
+            if expected_size is not None and size == expected_size:
+                return True
+
+            remaining_s = deadline - loop.time()
+            if remaining_s <= 0:
+                return False
+            self._resized.clear()
+            try:
+                await asyncio.wait_for(
+                    self._resized.wait(), timeout=min(quiet_s, remaining_s)
+                )
+            except asyncio.TimeoutError:
+                # Quiet period elapsed; an unknown (0x0) size keeps waiting.
+                if size != (0.0, 0.0) and size == self._read_size():
+                    return True
 
 
 class AppRuntime:
@@ -31,23 +87,76 @@ class AppRuntime:
         self._shell_service = shell_service
         self._set_viewport_size = set_viewport_size
         self._set_ui_ready = set_ui_ready
+        self._api_server: ControlApiServer | None = None
+        self._viewport_stabilizer = _ViewportStabilizer(self._get_current_viewport_size)
+        self._resize_sync_handle: asyncio.TimerHandle | None = None
+        self._screensaver_timer: asyncio.TimerHandle | None = None
+        self._motor_changed = asyncio.Event()
+        # Observables hold listeners weakly; keep the bound methods alive.
+        self._shell_listener = self._on_shell_changed
+        self._settings_listener = self._on_settings_changed
+        self._unsubscribe: list[Callable[[], None]] = []
 
-    async def monitor_loop(self) -> None:
-        logger.info("Global inactivity monitor task started")
-        while True:
-            await asyncio.sleep(1.0)
-            self._shell_service.check_inactivity(
-                self._settings_service.inactivity_timeout
-            )
+    def _arm_screensaver_timer(self) -> None:
+        # One timer at the idle deadline instead of a 1 s poll. Activity does
+        # not re-arm it: when it fires early, it re-arms at the new deadline.
+        if self._screensaver_timer is not None:
+            self._screensaver_timer.cancel()
+        deadline = self._shell_service.idle_deadline(
+            self._settings_service.inactivity_timeout
+        )
+        self._screensaver_timer = asyncio.get_running_loop().call_at(
+            deadline, self._on_screensaver_deadline, deadline
+        )
+
+    def _on_screensaver_deadline(self, deadline: float) -> None:
+        self._screensaver_timer = None
+        _SCREENSAVER_TIMER_LAG.set(
+            max(0.0, asyncio.get_running_loop().time() - deadline)
+        )
+        self._shell_service.check_inactivity(self._settings_service.inactivity_timeout)
+        if self._shell_service.is_screensaver_active:
+            self._close_all_overlays()
+        else:
+            self._arm_screensaver_timer()
 
-            # If screensaver is active, ensure overlays are closed
-            if self._shell_service.is_screensaver_active:
-                self._close_all_overlays()
+    def _on_shell_changed(self, _sender: object, field: str | None) -> None:
+        if field == "is_screensaver_active" and (
+            not self._shell_service.is_screensaver_active
+        ):
+            self._arm_screensaver_timer()
 
-            self._motor_controller.sync_motor_state()
+    def _on_settings_changed(self, _sender: object, field: str | None) -> None:
+        if field == "inactivity_timeout" and self._screensaver_timer is not None:
+            self._arm_screensaver_timer()
+
+    async def motor_sync_loop(self) -> None:
+        # Idle, this sleeps until the motor service reports a state change;
+        # it only polls while motors are powered or the status sheet is open.
+        loop = asyncio.get_running_loop()
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(self._motor_changed.set)
+
+        self._motor_controller.set_change_listener(wake)
+        try:
+            while True:
+                timeout_s = (
+                    _MOTOR_SYNC_INTERVAL_S
+                    if self._motor_controller.needs_periodic_sync()
+                    else None
+                )
+                try:
+                    await asyncio.wait_for(self._motor_changed.wait(), timeout_s)
+                except asyncio.TimeoutError:
+                    pass
+                self._motor_changed.clear()
+                self._motor_controller.sync_motor_state()
+        finally:
+            self._motor_controller.set_change_listener(None)
 
     def _close_all_overlays(self) -> None:
-        """Closes active sheets and toasts."""
+        """Closes active sheets and toasts; each updates its own control."""
         close_sheet = get_overlay_close_callback(self._page, OverlayRole.SHEET)
         if callable(close_sheet):
             close_sheet()
@@ -56,16 +165,60 @@ class AppRuntime:
         if callable(close_toast):
             close_toast()
 
-        self._page.update()
+    async def throughput_snapshot_loop(self) -> None:
+        # Counters live in memory; disk only sees a periodic atomic snapshot,
+        # and only when the counters moved since the last one.
+        while True:
+            await asyncio.sleep(config.throughput_snapshot_interval_s)
+            await asyncio.to_thread(self._motor_controller.persist_throughput)
+
+    async def render_profile_dump_loop(self) -> None:
+        while True:
+            await asyncio.sleep(_RENDER_PROFILE_DUMP_INTERVAL_S)
+            await self._dump_render_profile()
+
+    async def _dump_render_profile(self) -> None:
+        # Serialize on the loop (renders mutate the stats), write off it.
+        payload = render_profiler.to_json()
+        try:
+            await asyncio.to_thread(
+                write_text_atomic,
+                config.storage_dir / "render_profile.json",
+                payload,
+            )
+        except OSError:
+            logger.exception("Failed to write render profile")
 
     async def initialize_motors_task(self) -> None:
-        await asyncio.to_thread(self._motor_controller.initialize_motors)
+        with startup_trace.span("initialize_motors"):
+            await asyncio.to_thread(self._motor_controller.initialize_motors)
 
     async def shutdown_motors_task(self) -> None:
-        await asyncio.to_thread(self._motor_controller.shutdown_motors)
+        await self._motor_controller.shutdown_motors_async()
+
+    async def api_server_task(self) -> None:
+        self._api_server = ControlApiServer(
+            motor_controller=self._motor_controller,
+            host=config.api_host,
+            port=config.api_port,
+            telemetry_hz=config.api_telemetry_hz,
+        )
+        try:
+            await self._api_server.serve()
+        except OSError:
+            logger.exception(
+                "Control API failed to bind %s:%s", config.api_host, config.api_port
+            )
 
     def on_page_resize(self, _: object) -> None:
-        self.sync_viewport_size()
+        # Coalesce resize bursts into one viewport sync (one App re-render).
+        self._viewport_stabilizer.notify_resized()
+        if self._resize_sync_handle is not None:
+            self._resize_sync_handle.cancel()
+        self._resize_sync_handle = asyncio.get_running_loop().call_later(
+            _RESIZE_DEBOUNCE_S,
+            self.sync_viewport_size,
+        )
 
     def on_mounted(self) -> None:
         self._page.title = config.app_title
@@ -83,12 +236,42 @@ class AppRuntime:
         self._page.on_resize = self.on_page_resize
         self.sync_viewport_size(force=True)
         self._page.on_keyboard_event = lambda _: self._shell_service.reset_timer()
+        config.start_watching()
         self._page.run_task(self.initialize_motors_task)
-        self._page.run_task(self.monitor_loop)
+        self._unsubscribe = [
+            cast(ft.Observable, self._shell_service).subscribe(self._shell_listener),
+            cast(ft.Observable, self._settings_service).subscribe(
+                self._settings_listener
+            ),
+        ]
+        self._arm_screensaver_timer()
+        self._page.run_task(self.motor_sync_loop)
+        self._page.run_task(self.throughput_snapshot_loop)
         self._page.run_task(self.warmup_first_frame_update_task)
+        if config.api_enabled:
+            self._page.run_task(self.api_server_task)
+        if render_profiler.enabled:
+            self._page.run_task(self.render_profile_dump_loop)
 
     async def on_unmounted(self) -> None:
+        config.stop_watching()
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        if self._screensaver_timer is not None:
+            self._screensaver_timer.cancel()
+            self._screensaver_timer = None
+        if self._resize_sync_handle is not None:
+            self._resize_sync_handle.cancel()
+            self._resize_sync_handle = None
+        if self._api_server is not None:
+            self._api_server.close()
+            self._api_server = None
         await self.shutdown_motors_task()
+        await asyncio.to_thread(self._motor_controller.persist_throughput)
+        await asyncio.to_thread(config.flush)
+        if render_profiler.enabled:
+            await self._dump_render_profile()
 
     def sync_viewport_size(self, *, force: bool = False) -> None:
         size = self._get_current_viewport_size()
@@ -105,41 +288,21 @@ class AppRuntime:
             float(getattr(self._page, "height", 0) or 0),
         )
 
-    async def _wait_for_viewport_stable(
-        self,
-        *,
-        timeout_s: float = 2.0,
-        poll_s: float = 0.12,
-        stable_samples: int = 3,
-    ) -> bool:
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + timeout_s
-        previous: tuple[float, float] | None = None
-        stable_count = 0
-
-        while True:
-            current = self._get_current_viewport_size()
-            if (
-                previous is not None
-                and current != (0.0, 0.0)
-                and abs(current[0] - previous[0]) < 0.5
-                and abs(current[1] - previous[1]) < 0.5
-            ):
-                stable_count += 1
-            else:
-                stable_count = 0
-
-            previous = current
-            if stable_count >= stable_samples:
-                return True
-            if loop.time() >= deadline:
-                return False
-            await asyncio.sleep(poll_s)
+    def _expected_viewport_size(self) -> tuple[float, float] | None:
+        # In kiosk fullscreen the page is exactly the configured screen size.
+        if not config.app_fullscreen_mode:
+            return None
+        return float(config.app_screen_width), float(config.app_screen_height)
 
     async def warmup_first_frame_update_task(self) -> None:
         logger.info("Viewport warmup started")
         try:
-            stable_before = await self._wait_for_viewport_stable()
+            with startup_trace.span("viewport stable (pre-update)"):
+                stable_before = await self._viewport_stabilizer.wait_stable(
+                    timeout_s=2.0,
+                    quiet_s=0.15,
+                    expected_size=self._expected_viewport_size(),
+                )
             if not stable_before:
                 width, height = self._get_current_viewport_size()
                 logger.info(
@@ -148,12 +311,15 @@ class AppRuntime:
                     height,
                 )
 
-            self._page.update()
+            with startup_trace.span("first page.update"):
+                request_update(self._page, immediate=True)
 
-            stable_after = await self._wait_for_viewport_stable(
-                timeout_s=0.8,
-                stable_samples=2,
-            )
+            with startup_trace.span("viewport stable (post-update)"):
+                stable_after = await self._viewport_stabilizer.wait_stable(
+                    timeout_s=0.8,
+                    quiet_s=0.1,
+                    expected_size=self._expected_viewport_size(),
+                )
             self.sync_viewport_size()
             width, height = self._get_current_viewport_size()
             logger.info(
@@ -167,3 +333,10 @@ class AppRuntime:
             logger.exception("Viewport warmup failed")
         finally:
             self._set_ui_ready(True)
+            startup_trace.finish(
+                export_path=(
+                    config.storage_dir / "startup_trace.json"
+                    if config.startup_trace_enabled
+                    else None
+                )
+            )
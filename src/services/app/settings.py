@@ -1,21 +1,34 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, cast
 
 import flet as ft
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
 
 from services.motors.tray_speed import clamp_sec_per_tray
-from utils.config import config
-from .i18n import I18nService
+from utils.config import config, schema_default
+from .i18n import I18nService, TranslationBundle
+
+if TYPE_CHECKING:
+    from argon2 import PasswordHasher
 
 logger = logging.getLogger(__name__)
 
+# One worker: argon2 is memory-hard, so hashes should queue rather than run in
+# parallel on the Pi. Keeps hashing off the Flet event loop.
+_PASSCODE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="passcode")
+_ARGON2_KEYS = frozenset(
+    {"ARGON2_TIME_COST", "ARGON2_MEMORY_COST_KIB", "ARGON2_PARALLELISM"}
+)
+# argon2 rejects (only when hashing) less than 8 KiB of memory per lane.
+_ARGON2_MIN_MEMORY_KIB_PER_LANE = 8
+
 
 @ft.observable
 class SettingsService:
     def __init__(self, i18n_service: I18nService) -> None:
         self._i18n_service = i18n_service
-        self._password_hasher = PasswordHasher()
+        self._password_hasher: "PasswordHasher | None" = None
         self.default_sec_per_tray_min = min(
             config.motor_min_sec_per_tray,
             config.motor_max_sec_per_tray,
@@ -26,11 +39,15 @@ class SettingsService:
         )
         self.locale = config.locale.lower()
         self.locale_version = 0
-        self.translations = self._i18n_service.translations_for(self.locale)
+        self._i18n_service.preload()
+        self.translations: TranslationBundle = self._i18n_service.bundle_for(
+            self.locale
+        )
         self.default_sec_per_tray = self._clamp_default_sec_per_tray(
             config.default_sec_per_tray
         )
         self.inactivity_timeout = config.inactivity_timeout
+        config.subscribe(self._on_config_reloaded)
 
     def set_locale(self, locale: str) -> None:
         normalized_locale = locale.lower()
@@ -38,13 +55,13 @@ class SettingsService:
             return
 
         self.locale = normalized_locale
-        self.translations = self._i18n_service.translations_for(normalized_locale)
+        self.translations = self._i18n_service.bundle_for(normalized_locale)
         self.locale_version += 1
         config.set("LOCALE", normalized_locale)
         logger.info("Locale changed to %s", self.locale)
 
     def t(self, key: str, default: str | None = None) -> str:
-        return self.translations.get(key, default or key)
+        return self.translations.t(key, default)
 
     def set_inactivity_timeout(self, seconds: float) -> None:
         if self.inactivity_timeout == seconds:
@@ -71,12 +88,24 @@ class SettingsService:
             self.default_sec_per_tray,
         )
 
+    async def update_admin_passcode_async(self, new_passcode: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            _PASSCODE_EXECUTOR, self.update_admin_passcode, new_passcode
+        )
+
+    async def verify_admin_passcode_async(self, passcode: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            _PASSCODE_EXECUTOR, self.verify_admin_passcode, passcode
+        )
+
     def update_admin_passcode(self, new_passcode: str) -> None:
-        new_hash = self._password_hasher.hash(new_passcode)
+        new_hash = self._get_password_hasher().hash(new_passcode)
         config.set("ADMIN_PASSCODE_HASH", new_hash)
         logger.info("Admin passcode updated and persisted")
 
     def verify_admin_passcode(self, passcode: str) -> bool:
+        from argon2.exceptions import VerifyMismatchError
+
         stored_hash = config.admin_passcode_hash
         default_passcode = config.app_admin_default_passcode
 
@@ -86,11 +115,15 @@ class SettingsService:
                     return False
                 config.set(
                     "ADMIN_PASSCODE_HASH",
-                    self._password_hasher.hash(passcode),
+                    self._get_password_hasher().hash(passcode),
                 )
                 return True
 
-            self._password_hasher.verify(stored_hash, passcode)
+            password_hasher = self._get_password_hasher()
+            password_hasher.verify(stored_hash, passcode)
+            if password_hasher.check_needs_rehash(stored_hash):
+                config.set("ADMIN_PASSCODE_HASH", password_hasher.hash(passcode))
+                logger.info("Admin passcode rehashed with current argon2 parameters")
             return True
         except VerifyMismatchError:
             return False
@@ -98,6 +131,39 @@ class SettingsService:
             logger.exception("Admin passcode verification failed")
             return False
 
+    def _get_password_hasher(self) -> "PasswordHasher":
+        # argon2 is only needed on the admin path; keep it off the boot path.
+        if self._password_hasher is None:
+            from argon2 import PasswordHasher
+
+            time_cost = config.argon2_time_cost
+            memory_cost_kib = config.argon2_memory_cost_kib
+            parallelism = config.argon2_parallelism
+            if memory_cost_kib < _ARGON2_MIN_MEMORY_KIB_PER_LANE * parallelism:
+                # Hashing would fail on every unlock, locking the admin out.
+                logger.error(
+                    "ARGON2_MEMORY_COST_KIB=%s is below %s KiB x "
+                    "ARGON2_PARALLELISM=%s; using the default argon2 parameters",
+                    memory_cost_kib,
+                    _ARGON2_MIN_MEMORY_KIB_PER_LANE,
+                    parallelism,
+                )
+                time_cost = cast(int, schema_default("ARGON2_TIME_COST"))
+                memory_cost_kib = cast(int, schema_default("ARGON2_MEMORY_COST_KIB"))
+                parallelism = cast(int, schema_default("ARGON2_PARALLELISM"))
+
+            self._password_hasher = PasswordHasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost_kib,
+                parallelism=parallelism,
+            )
+        return self._password_hasher
+
+    def _on_config_reloaded(self, changed_keys: frozenset[str]) -> None:
+        # Runs on the config watcher thread; the next hash builds a new hasher.
+        if changed_keys & _ARGON2_KEYS:
+            self._password_hasher = None
+
     def _clamp_default_sec_per_tray(self, sec_per_tray: float) -> float:
         return clamp_sec_per_tray(
             sec_per_tray,
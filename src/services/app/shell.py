@@ -9,17 +9,27 @@ logger = logging.getLogger(__name__)
 @ft.observable
 class ShellService:
     def __init__(self) -> None:
-        self.last_interaction = time.time()
+        # Private: touches update it constantly and must not notify the UI.
+        # Monotonic so NTP clock steps on the Pi never trigger the screensaver.
+        self._last_interaction = time.monotonic()
         self.is_screensaver_active = False
 
     def reset_timer(self) -> None:
-        self.last_interaction = time.time()
+        # Every touch is recorded: skipping some would leave the idle deadline
+        # on an older touch and start the screensaver early. Event volume is
+        # throttled on the client (ActivityBoundary) and the only notification
+        # here, the dismissal, fires once.
+        self._last_interaction = time.monotonic()
         if self.is_screensaver_active:
             self.is_screensaver_active = False
             logger.info("Screensaver dismissed")
 
+    def idle_deadline(self, inactivity_timeout: float) -> float:
+        """`time.monotonic()` at which the screensaver is due (loop.time() base)."""
+        return self._last_interaction + inactivity_timeout
+
     def check_inactivity(self, inactivity_timeout: float) -> None:
-        elapsed = time.time() - self.last_interaction
+        elapsed = time.monotonic() - self._last_interaction
         if elapsed > inactivity_timeout and not self.is_screensaver_active:
             self.is_screensaver_active = True
             logger.info("Screensaver activated due to inactivity")
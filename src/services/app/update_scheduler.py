@@ -0,0 +1,138 @@
+"""
+Frame-batched control updates.
+
+Code paths that change controls outside a component render (overlays, toast
+animations, viewport sync, passcode shakes) request an update here instead of
+calling `control.update()` / `page.update()`. Requests are collected per page
+and flushed at most once per display frame: a control requested twice, or
+whose ancestor is also dirty, is patched once.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+
+from utils.metrics import metrics
+from .page_state import PageSlot
+
+logger = logging.getLogger(__name__)
+
+FRAME_INTERVAL_S = 1 / 60
+
+_UPDATE_REQUESTS = metrics.counter(
+    "tango_ui_update_requests_total",
+    "Control updates requested through the frame scheduler",
+)
+_UPDATES_COALESCED = metrics.counter(
+    "tango_ui_updates_coalesced_total",
+    "Requested updates merged into another patch of the same frame",
+)
+_UPDATE_FLUSHES = metrics.counter(
+    "tango_ui_update_flushes_total",
+    "Frames flushed by the update scheduler",
+)
+_CONTROLS_PATCHED = metrics.counter(
+    "tango_ui_controls_patched_total",
+    "Controls patched by the update scheduler",
+)
+
+
+@dataclass
+class _PageUpdates:
+    dirty: dict[int, BaseControl] = field(default_factory=dict)
+    flush_handle: asyncio.TimerHandle | None = None
+
+
+_page_updates: PageSlot[_PageUpdates] = PageSlot("update_scheduler")
+
+
+def request_update(
+    page: ft.Page,
+    control: BaseControl | None = None,
+    *,
+    immediate: bool = False,
+) -> None:
+    """
+    Marks `control` (the whole page when omitted) dirty for the next frame.
+
+    `immediate` flushes everything pending right away, for states the client
+    must render before the next change (e.g. the closed state an open
+    animation starts from).
+    """
+    target = control if control is not None else page
+    updates = _page_updates.get(page)
+    if updates is None:
+        updates = _PageUpdates()
+        _page_updates.set(page, updates)
+
+    _UPDATE_REQUESTS.inc()
+    if id(target) in updates.dirty:
+        _UPDATES_COALESCED.inc()
+    updates.dirty[id(target)] = target
+
+    if immediate:
+        flush_updates(page)
+        return
+    if updates.flush_handle is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            flush_updates(page)
+            return
+        updates.flush_handle = loop.call_later(FRAME_INTERVAL_S, flush_updates, page)
+
+
+def discard_update(page: ft.Page, control: BaseControl) -> None:
+    """Drops a pending request, e.g. for a control about to be unmounted."""
+    updates = _page_updates.get(page)
+    if updates is not None:
+        updates.dirty.pop(id(control), None)
+
+
+def flush_updates(page: ft.Page) -> None:
+    updates = _page_updates.get(page)
+    if updates is None:
+        return
+    if updates.flush_handle is not None:
+        updates.flush_handle.cancel()
+        updates.flush_handle = None
+    if not updates.dirty:
+        return
+    dirty = updates.dirty
+    updates.dirty = {}
+
+    mounted = [control for control in dirty.values() if _is_mounted(control)]
+    targets = [
+        control for control in mounted if not _has_dirty_ancestor(control, dirty)
+    ]
+    _UPDATES_COALESCED.inc(len(mounted) - len(targets))
+    if not targets:
+        return
+    _UPDATE_FLUSHES.inc()
+    _CONTROLS_PATCHED.inc(len(targets))
+    page.update(*targets)
+
+
+def _is_mounted(control: BaseControl) -> bool:
+    if isinstance(control, ft.Page):
+        return True
+    # Relies on Flet's `BaseControl.page` walking up the parents and raising
+    # RuntimeError when the control is not attached to a page.
+    try:
+        _ = control.page
+    except RuntimeError:
+        logger.debug("Skipping update of unmounted %s", type(control).__name__)
+        return False
+    return True
+
+
+def _has_dirty_ancestor(control: BaseControl, dirty: dict[int, BaseControl]) -> bool:
+    parent = control.parent
+    while parent is not None:
+        if id(parent) in dirty:
+            return True
+        parent = parent.parent
+    return False
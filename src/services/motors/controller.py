@@ -1,4 +1,7 @@
+import asyncio
 import logging
+from collections.abc import Callable, Sequence
+from dataclasses import replace
 
 import flet as ft
 
@@ -8,6 +11,13 @@ from services.motors.motor_service import (
     MotorServiceConfig,
     MotorStatusSnapshot,
 )
+from services.motors.presets import PresetFileWrite, PresetStore, TrayPreset
+from services.motors.schedule import ScheduleSegment, ScheduleStatus, ScheduleStep
+from services.motors.throughput import (
+    ThroughputSnapshot,
+    load_throughput_snapshot,
+    save_throughput_snapshot,
+)
 from services.motors.tray_speed import (
     clamp_sec_per_tray,
     sec_per_tray_to_trays_per_minute,
@@ -16,6 +26,8 @@ from services.motors.tray_speed import (
 from utils.config import config
 
 logger = logging.getLogger(__name__)
+_THROUGHPUT_SNAPSHOT_FILE = "throughput.json"
+_PRESETS_FILE = "presets.json"
 
 
 @ft.observable
@@ -36,31 +48,154 @@ class MotorController:
         self.is_motors_running = False
         self.status_refresh_enabled = False
         self.status_version = 0
+        self.trays_this_shift = 0
+        self.trays_today = 0
+        self.active_preset = ""
+        self.schedule_step = 0
+        self.schedule_step_count = 0
+        self._preset_store = PresetStore(config.storage_dir / _PRESETS_FILE)
+        self.preset_names = self._preset_store.names()
         self._motor_service = MotorService(MotorServiceConfig.from_app_config(config))
-        self.target_velocity_rad_s = self._resolve_target_velocity_rad_s()
+        self._throughput_path = config.storage_dir / _THROUGHPUT_SNAPSHOT_FILE
+        self._change_listener: Callable[[], None] | None = None
+        self._persisted_throughput: ThroughputSnapshot | None = None
+        self._restore_throughput()
+        config.subscribe(self._on_config_reloaded)
+        self.target_velocity_rad_s = self._resolve_target_velocity_rad_s(
+            self.sec_per_tray
+        )
 
+    # The UI calls the plain methods from its event handlers, on the loop. The
+    # control API awaits the `_async` variants: they run only the motor service
+    # (and file) calls on a worker thread, because observable fields notify
+    # their subscribers and must only be written on the loop.
     def set_sec_per_tray(self, sec_per_tray: float) -> bool:
         normalized_sec_per_tray = self._clamp_sec_per_tray(sec_per_tray)
         if self.sec_per_tray == normalized_sec_per_tray:
             return False
 
-        self.sec_per_tray = normalized_sec_per_tray
-        self._apply_speed_to_motors()
-        logger.info(
-            "Tray time set to %.0fs/tray (target=%.3f rad/s)",
-            self.sec_per_tray,
-            self.target_velocity_rad_s,
+        applied_velocity = self._send_manual_speed(
+            self._resolve_target_velocity_rad_s(normalized_sec_per_tray)
+        )
+        self._show_manual_speed(normalized_sec_per_tray, applied_velocity)
+        return True
+
+    async def set_sec_per_tray_async(self, sec_per_tray: float) -> bool:
+        normalized_sec_per_tray = self._clamp_sec_per_tray(sec_per_tray)
+        if self.sec_per_tray == normalized_sec_per_tray:
+            return False
+
+        applied_velocity = await asyncio.to_thread(
+            self._send_manual_speed,
+            self._resolve_target_velocity_rad_s(normalized_sec_per_tray),
         )
+        self._show_manual_speed(normalized_sec_per_tray, applied_velocity)
+        return True
+
+    def list_presets(self) -> list[TrayPreset]:
+        return self._preset_store.all()
+
+    async def save_preset_async(self, preset: TrayPreset) -> None:
+        file_write = self._preset_store.save(preset)
+        self.preset_names = self._preset_store.names()
+        await asyncio.to_thread(self._preset_store.write, file_write)
+        logger.info("Tray preset '%s' saved", preset.name)
+
+    async def delete_preset_async(self, name: str) -> bool:
+        file_write = self._preset_store.delete(name)
+        if file_write is None:
+            return False
+        self.preset_names = self._preset_store.names()
+        leaving_preset = self.active_preset == name
+        if leaving_preset:
+            self.active_preset = ""
+        await asyncio.to_thread(self._write_deleted_preset, file_write, leaving_preset)
+        logger.info("Tray preset '%s' deleted", name)
+        return True
+
+    def apply_preset(self, name: str) -> bool:
+        preset = self._preset_store.get(name)
+        if preset is None:
+            return False
+
+        applied_velocity = self._send_preset(preset)
+        if applied_velocity is None:
+            return False
+        self._show_preset(preset, applied_velocity)
+        return True
+
+    async def apply_preset_async(self, name: str) -> bool:
+        preset = self._preset_store.get(name)
+        if preset is None:
+            return False
+
+        applied_velocity = await asyncio.to_thread(self._send_preset, preset)
+        if applied_velocity is None:
+            return False
+        self._show_preset(preset, applied_velocity)
         return True
 
+    async def start_schedule_async(
+        self,
+        steps: Sequence[ScheduleStep],
+        *,
+        stop_at_end: bool,
+    ) -> MotorActionResult:
+        if not steps:
+            raise ValueError("Schedule must contain at least one step")
+
+        segments: list[ScheduleSegment] = []
+        for step in steps:
+            sec_per_tray = self._clamp_sec_per_tray(step.sec_per_tray)
+            segments.append(
+                ScheduleSegment(
+                    sec_per_tray=sec_per_tray,
+                    velocity_rad_s=self._resolve_target_velocity_rad_s(sec_per_tray),
+                    duration_s=step.duration_s,
+                )
+            )
+        result = await asyncio.to_thread(
+            self._send_schedule, segments, stop_at_end=stop_at_end
+        )
+        self.is_motors_running = self._motor_service.is_running()
+        # Mirror the schedule only once it runs, so a failed start leaves the
+        # tray time and the active preset as they were.
+        if result.action != MotorAction.STARTED:
+            return result
+
+        self.active_preset = ""
+        self._set_scheduled_sec_per_tray(segments[0].sec_per_tray)
+        self._sync_schedule()
+        return result
+
+    async def cancel_schedule_async(self) -> bool:
+        cancelled = await asyncio.to_thread(self._motor_service.cancel_schedule)
+        self._sync_schedule()
+        return cancelled
+
+    def get_schedule_status(self) -> ScheduleStatus | None:
+        return self._motor_service.get_schedule_status()
+
     def sync_motor_state(self) -> None:
         running = self._motor_service.is_running()
         if running != self.is_motors_running:
             self.is_motors_running = running
             logger.info("Motor running state changed to %s", self.is_motors_running)
+        self._sync_schedule()
+        self._sync_throughput()
         if self.status_refresh_enabled:
             self.status_version += 1
 
+    def needs_periodic_sync(self) -> bool:
+        # Throughput and telemetry only move while motors are powered or the
+        # status sheet is open; otherwise state-change events are enough.
+        return self.status_refresh_enabled or self._motor_service.is_active()
+
+    def set_change_listener(self, listener: Callable[[], None] | None) -> None:
+        """Called (from any thread) whenever `sync_motor_state` has news."""
+        self._change_listener = listener
+        self._motor_service.set_state_listener(listener)
+
     def set_status_refresh_enabled(self, enabled: bool) -> None:
         normalized_enabled = bool(enabled)
         if self.status_refresh_enabled == normalized_enabled:
@@ -69,6 +204,8 @@ class MotorController:
         self.status_refresh_enabled = normalized_enabled
         if normalized_enabled:
             self.status_version += 1
+        if self._change_listener is not None:
+            self._change_listener()
 
     def initialize_motors(self) -> None:
         try:
@@ -77,12 +214,91 @@ class MotorController:
             logger.exception("Motor CAN initialization failed")
 
     def start_motors(self) -> MotorActionResult:
+        result = self._start_motor_service(self.target_velocity_rad_s)
+        self.is_motors_running = self._motor_service.is_running()
+        return result
+
+    async def start_motors_async(self) -> MotorActionResult:
+        result = await asyncio.to_thread(
+            self._start_motor_service, self.target_velocity_rad_s
+        )
+        self.is_motors_running = self._motor_service.is_running()
+        return result
+
+    def stop_motors(self) -> MotorActionResult:
+        result = self._stop_motor_service()
+        self.is_motors_running = self._motor_service.is_running()
+        return result
+
+    async def stop_motors_async(self) -> MotorActionResult:
+        result = await asyncio.to_thread(self._stop_motor_service)
+        self.is_motors_running = self._motor_service.is_running()
+        return result
+
+    async def shutdown_motors_async(self) -> None:
+        try:
+            await asyncio.to_thread(self._motor_service.shutdown)
+        except Exception:
+            logger.exception("Motor full shutdown failed")
+        self.is_motors_running = self._motor_service.is_running()
+
+    async def rescan_motors_async(self) -> bool:
+        try:
+            await asyncio.to_thread(self._motor_service.rescan)
+            rescanned = True
+        except Exception:
+            logger.exception("Motor rescan failed")
+            rescanned = False
+        self.is_motors_running = self._motor_service.is_running()
+        return rescanned
+
+    def toggle_motors(self) -> MotorActionResult:
+        if self.is_motors_running:
+            return self.stop_motors()
+        return self.start_motors()
+
+    def get_status_snapshots(self) -> list[MotorStatusSnapshot]:
+        return self._motor_service.get_status_snapshots()
+
+    def peek_status_snapshots(self) -> list[MotorStatusSnapshot]:
+        return self._motor_service.peek_status_snapshots()
+
+    def get_throughput_snapshot(self) -> ThroughputSnapshot:
+        return self._motor_service.get_throughput_snapshot()
+
+    def persist_throughput(self) -> None:
+        # Runs in a worker thread: the refresh takes the motor service lock.
+        # The measured rate is not stored, so only the counters (and a day or
+        # shift rollover) make a new snapshot worth an fsync.
+        try:
+            snapshot = replace(
+                self._motor_service.refresh_throughput_snapshot(),
+                measured_trays_per_minute=0.0,
+            )
+            if snapshot == self._persisted_throughput:
+                return
+            save_throughput_snapshot(self._throughput_path, snapshot)
+            self._persisted_throughput = snapshot
+        except Exception:
+            logger.exception("Failed to persist throughput snapshot")
+
+    def _on_config_reloaded(self, changed_keys: frozenset[str]) -> None:
+        # Runs on the config watcher thread: only touch the lock-protected service.
+        if not changed_keys & {"MOTOR_COMMAND_HZ", "MOTOR_RAMP_TIME_S"}:
+            return
+        self._motor_service.update_timing(
+            command_hz=config.motor_command_hz,
+            ramp_time_s=config.motor_ramp_time_s,
+        )
+
+    def _start_motor_service(
+        self, initial_target_velocity_rad_s: float
+    ) -> MotorActionResult:
         try:
             self._motor_service.start(
-                initial_target_velocity_rad_s=self.target_velocity_rad_s
+                initial_target_velocity_rad_s=initial_target_velocity_rad_s
             )
-            self.is_motors_running = self._motor_service.is_running()
-            if self.is_motors_running:
+            if self._motor_service.is_running():
                 return MotorActionResult(action=MotorAction.STARTED)
 
             return MotorActionResult(
@@ -90,7 +306,6 @@ class MotorController:
                 error="Motor service did not enter running state",
             )
         except Exception as ex:
-            self.is_motors_running = False
             logger.exception("Motor startup failed")
             if "No configured motors are connected" in str(ex):
                 return MotorActionResult(
@@ -99,52 +314,136 @@ class MotorController:
                 )
             return MotorActionResult(action=MotorAction.START_FAILED, error=str(ex))
 
-    def stop_motors(self) -> MotorActionResult:
+    def _stop_motor_service(self) -> MotorActionResult:
         try:
             self._motor_service.stop()
-            self.is_motors_running = False
             return MotorActionResult(action=MotorAction.STOPPED)
         except Exception as ex:
             logger.exception("Motor shutdown failed")
             return MotorActionResult(action=MotorAction.STOP_FAILED, error=str(ex))
 
-    def shutdown_motors(self) -> None:
+    # The `_send_*` helpers only call the motor service (which has its own
+    # lock), so they may run on a worker thread; the matching `_show_*`
+    # helpers write the observable fields and must run on the loop.
+    def _send_manual_speed(self, target_velocity_rad_s: float) -> float:
+        # A manual tray time leaves the preset (and its ramp time) and the schedule.
+        self._motor_service.restore_configured_ramp()
+        if self._motor_service.cancel_schedule():
+            logger.info("Manual tray time change overrides the speed schedule")
+        if not self._motor_service.is_running():
+            return target_velocity_rad_s
         try:
-            self._motor_service.shutdown()
-            self.is_motors_running = False
+            return self._motor_service.set_target_velocity_rad_s(target_velocity_rad_s)
         except Exception:
-            logger.exception("Motor full shutdown failed")
+            logger.exception("Failed to apply speed command to motors")
+            return target_velocity_rad_s
 
-    def rescan_motors(self) -> bool:
+    def _show_manual_speed(self, sec_per_tray: float, velocity_rad_s: float) -> None:
+        self.sec_per_tray = sec_per_tray
+        self.trays_per_minute = sec_per_tray_to_trays_per_minute(sec_per_tray)
+        self.target_velocity_rad_s = velocity_rad_s
+        self.active_preset = ""
+        self._sync_schedule()
+        logger.info(
+            "Tray time set to %.0fs/tray (target=%.3f rad/s)",
+            sec_per_tray,
+            velocity_rad_s,
+        )
+
+    def _send_preset(self, preset: TrayPreset) -> float | None:
+        if self._motor_service.cancel_schedule():
+            logger.info("Tray preset '%s' overrides the speed schedule", preset.name)
+        target_velocity_rad_s = self._resolve_target_velocity_rad_s(
+            self._clamp_sec_per_tray(preset.sec_per_tray)
+        )
         try:
-            running = self._motor_service.rescan()
-            self.is_motors_running = running
-            return True
+            applied_velocity = self._motor_service.apply_profile(
+                target_velocity_rad_s=target_velocity_rad_s,
+                ramp_time_s=preset.ramp_time_s,
+                motor_trims=preset.motors,
+            )
         except Exception:
-            logger.exception("Motor rescan failed")
-            self.is_motors_running = self._motor_service.is_running()
-            return False
+            logger.exception("Failed to apply tray preset '%s'", preset.name)
+            return None
+        if self._motor_service.is_running():
+            return applied_velocity
+        return target_velocity_rad_s
 
-    def toggle_motors(self) -> MotorActionResult:
-        if self.is_motors_running:
-            return self.stop_motors()
-        return self.start_motors()
+    def _show_preset(self, preset: TrayPreset, velocity_rad_s: float) -> None:
+        self.sec_per_tray = self._clamp_sec_per_tray(preset.sec_per_tray)
+        self.trays_per_minute = sec_per_tray_to_trays_per_minute(self.sec_per_tray)
+        self.target_velocity_rad_s = velocity_rad_s
+        self.active_preset = preset.name
+        self._sync_schedule()
+        logger.info(
+            "Tray preset '%s' applied (%.0fs/tray, ramp %.2fs)",
+            preset.name,
+            self.sec_per_tray,
+            preset.ramp_time_s,
+        )
 
-    def get_status_snapshots(self) -> list[MotorStatusSnapshot]:
-        return self._motor_service.get_status_snapshots()
+    def _send_schedule(
+        self,
+        segments: Sequence[ScheduleSegment],
+        *,
+        stop_at_end: bool,
+    ) -> MotorActionResult:
+        if not self._motor_service.is_running():
+            result = self._start_motor_service(segments[0].velocity_rad_s)
+            if result.action != MotorAction.STARTED:
+                return result
 
-    def _apply_speed_to_motors(self) -> None:
         try:
-            self.trays_per_minute = sec_per_tray_to_trays_per_minute(self.sec_per_tray)
-            self.target_velocity_rad_s = self._resolve_target_velocity_rad_s()
-            if self.is_motors_running:
-                self.target_velocity_rad_s = (
-                    self._motor_service.set_target_velocity_rad_s(
-                        self.target_velocity_rad_s
-                    )
-                )
-        except Exception:
-            logger.exception("Failed to apply speed command to motors")
+            self._motor_service.start_schedule(segments, stop_at_end=stop_at_end)
+        except Exception as ex:
+            logger.exception("Speed schedule start failed")
+            return MotorActionResult(action=MotorAction.START_FAILED, error=str(ex))
+
+        # The preset's ramp time only lasts while the preset is active.
+        self._motor_service.restore_configured_ramp()
+        return MotorActionResult(action=MotorAction.STARTED)
+
+    def _write_deleted_preset(
+        self, file_write: PresetFileWrite, leaving_preset: bool
+    ) -> None:
+        self._preset_store.write(file_write)
+        if leaving_preset:
+            self._motor_service.restore_configured_ramp()
+
+    def _sync_schedule(self) -> None:
+        status = self._motor_service.get_schedule_status()
+        step = 0 if status is None else status.step_index + 1
+        step_count = 0 if status is None else status.step_count
+        if self.schedule_step != step:
+            self.schedule_step = step
+        if self.schedule_step_count != step_count:
+            self.schedule_step_count = step_count
+        if status is not None and status.sec_per_tray != self.sec_per_tray:
+            self._set_scheduled_sec_per_tray(status.sec_per_tray)
+
+    def _set_scheduled_sec_per_tray(self, sec_per_tray: float) -> None:
+        # The motor thread owns the target while a schedule runs; only mirror it.
+        self.sec_per_tray = sec_per_tray
+        self.trays_per_minute = sec_per_tray_to_trays_per_minute(sec_per_tray)
+        self.target_velocity_rad_s = self._resolve_target_velocity_rad_s(sec_per_tray)
+
+    def _restore_throughput(self) -> None:
+        snapshot = load_throughput_snapshot(self._throughput_path)
+        if snapshot is None:
+            return
+        self._persisted_throughput = snapshot
+        self._motor_service.restore_throughput(snapshot)
+        self._sync_throughput()
+
+    def _sync_throughput(self) -> None:
+        # Only whole trays are shown, so skip observable writes between them.
+        snapshot = self._motor_service.get_throughput_snapshot()
+        trays_this_shift = int(snapshot.trays_this_shift)
+        trays_today = int(snapshot.trays_today)
+        if trays_this_shift != self.trays_this_shift:
+            self.trays_this_shift = trays_this_shift
+        if trays_today != self.trays_today:
+            self.trays_today = trays_today
 
     def _clamp_sec_per_tray(self, sec_per_tray: float) -> float:
         return clamp_sec_per_tray(
@@ -153,8 +452,8 @@ class MotorController:
             maximum=self.sec_per_tray_max,
         )
 
-    def _resolve_target_velocity_rad_s(self) -> float:
+    def _resolve_target_velocity_rad_s(self, sec_per_tray: float) -> float:
         return sec_per_tray_to_velocity_rad_s(
-            self.sec_per_tray,
+            sec_per_tray,
             tray_size_cm=self.tray_size_cm,
         )
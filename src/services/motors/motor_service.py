@@ -1,20 +1,72 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from threading import Event, RLock, Thread
+from typing import TYPE_CHECKING
 
-from cubemars_servo_can import CubeMarsServoCAN
-
+from .presets import MotorTrim
+from .schedule import ScheduleRunner, ScheduleSegment, ScheduleStatus
 from .speed_ramp import SpeedRamp
+from .throughput import ThroughputAccumulator, ThroughputSnapshot
 from .tray_speed import sec_per_tray_to_velocity_rad_s
 from utils.config import Config
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from cubemars_servo_can import CubeMarsServoCAN
 
 logger = logging.getLogger(__name__)
 _TEMP_MONITOR_INTERVAL_S = 1.0
+_METRICS_SAMPLE_INTERVAL_S = 1.0
+
+_TICK_SECONDS = metrics.histogram(
+    "tango_motor_tick_seconds",
+    "Motor keepalive tick duration, including lock wait",
+)
+_TICK_OVERRUNS = metrics.counter(
+    "tango_motor_tick_overruns_total",
+    "Keepalive ticks that took longer than the command period",
+)
+_RECONNECTS = metrics.counter(
+    "tango_motor_reconnects_total",
+    "Automatic full reconnect attempts",
+)
+_RECONNECT_FAILURES = metrics.counter(
+    "tango_motor_reconnect_failures_total",
+    "Automatic full reconnect attempts that found no motor",
+)
+_CONNECTED_MOTORS = metrics.gauge(
+    "tango_motor_connected",
+    "Number of connected motors",
+)
+_TARGET_VELOCITY = metrics.gauge(
+    "tango_motor_target_velocity_rad_s",
+    "Ramp target output velocity",
+)
+_COMMANDED_VELOCITY = metrics.gauge(
+    "tango_motor_commanded_velocity_rad_s",
+    "Output velocity commanded on the last tick",
+)
+_MEASURED_VELOCITY = metrics.gauge(
+    "tango_motor_measured_velocity_rad_s",
+    "Measured output velocity per motor",
+    ["motor_id"],
+)
+_TEMPERATURE = metrics.gauge(
+    "tango_motor_temperature_celsius",
+    "Motor temperature per motor",
+    ["motor_id"],
+)
+_CURRENT = metrics.gauge(
+    "tango_motor_qaxis_current_amps",
+    "Q-axis current per motor",
+    ["motor_id"],
+)
 
 
 @dataclass(frozen=True)
@@ -29,6 +81,8 @@ class MotorServiceConfig:
     hold_release_timeout_s: float
     max_target_velocity_rad_s: float
     max_mosfet_temp_c: float
+    tray_size_cm: float
+    shift_start_hours: tuple[int, ...]
 
     @classmethod
     def from_app_config(cls, app_config: Config) -> "MotorServiceConfig":
@@ -62,6 +116,8 @@ class MotorServiceConfig:
                 tray_size_cm=app_config.motor_tray_size_cm,
             ),
             max_mosfet_temp_c=app_config.motor_max_temp_c,
+            tray_size_cm=app_config.motor_tray_size_cm,
+            shift_start_hours=tuple(app_config.throughput_shift_start_hours),
         )
 
     @property
@@ -90,6 +146,7 @@ class _ManagedMotor:
     motor: CubeMarsServoCAN
     direction: int
     motor_id: int
+    trim: float = 1.0
 
 
 @dataclass(frozen=True)
@@ -115,20 +172,41 @@ class MotorService:
         self._cfg = cfg
         self._lock = RLock()
         self._initialized = False
-        self._state = _ServiceState.OFF
+        self._state_listener: Callable[[], None] | None = None
+        self._state_value = _ServiceState.OFF
         self._pool: list[_ManagedMotor] = []
         self._connected: list[_ManagedMotor] = []
         self._motors: list[_ManagedMotor] = []
         self._failed_start_ids: set[int] = set()
         self._max_motor_velocity_rad_s = 0.0
+        self._motor_trims: dict[int, MotorTrim] = {}
+        # A preset's ramp time wins while the preset is active; MOTOR_RAMP_TIME_S
+        # applies otherwise (see restore_configured_ramp).
+        self._configured_ramp_time_s = max(0.0, self._cfg.ramp_time_s)
+        self._profile_ramp_time_s: float | None = None
+        self._direction_overrides: dict[int, int] = {}
+        self._schedule: ScheduleRunner | None = None
         self._speed_ramp = SpeedRamp(
             max_command_value=self._cfg.max_target_velocity_rad_s,
             command_hz=self._cfg.command_hz,
             ramp_time_s=self._cfg.ramp_time_s,
         )
+        self._throughput = ThroughputAccumulator(
+            tray_size_cm=self._cfg.tray_size_cm,
+            shift_start_hours=self._cfg.shift_start_hours,
+            max_sample_gap_s=3.0 * self._speed_ramp.command_period_s(),
+        )
+        # Throughput and schedule progress as of the last keepalive tick (or
+        # state change), published as one immutable tuple so the event loop can
+        # read it without taking the lock.
+        self._progress: tuple[ThroughputSnapshot, ScheduleStatus | None] = (
+            self._throughput.snapshot(wall_ts=time.time()),
+            None,
+        )
         self._keepalive_stop = Event()
         self._keepalive_thread: Thread | None = None
         self._next_temp_log_at_s = 0.0
+        self._next_metrics_sample_at_s = 0.0
         self._holding_since_s: float | None = None
 
     def initialize(self) -> None:
@@ -147,6 +225,7 @@ class MotorService:
 
         with self._lock:
             if self._is_service_active_locked():
+                self._apply_motor_trims_locked()
                 self._state = _ServiceState.RUNNING
                 self._holding_since_s = None
                 self._speed_ramp.set_target(
@@ -168,10 +247,11 @@ class MotorService:
                 raise RuntimeError("No configured motors are connected")
 
             self._motors = list(self._connected)
+            self._speed_ramp.reset()
+            self._apply_motor_trims_locked()
             self._state = _ServiceState.RUNNING
             self._next_temp_log_at_s = 0.0
             self._holding_since_s = None
-            self._speed_ramp.reset()
             self._speed_ramp.set_target(
                 self._clamp_target_velocity_locked(initial_target_velocity_rad_s)
             )
@@ -201,6 +281,8 @@ class MotorService:
                 return
             self._state = _ServiceState.HOLDING
             self._holding_since_s = None
+            self._schedule = None
+            self._publish_progress_locked()
             self._speed_ramp.set_target(0)
             timeout_s = self._speed_ramp.stop_timeout_s()
 
@@ -256,64 +338,199 @@ class MotorService:
             return target_velocity_rad_s
 
         with self._lock:
-            clamped_velocity = self._speed_ramp.set_target(
-                self._clamp_target_velocity_locked(target_velocity_rad_s)
+            return self._set_target_velocity_locked(target_velocity_rad_s)
+
+    def apply_profile(
+        self,
+        *,
+        target_velocity_rad_s: float,
+        ramp_time_s: float,
+        motor_trims: Sequence[MotorTrim],
+    ) -> float:
+        """
+        Switch ramp time, per-motor trims and target speed in one locked step.
+
+        The ramp time stays in effect, across MOTOR_RAMP_TIME_S reloads, until
+        `restore_configured_ramp` is called when the preset is left.
+        """
+        with self._lock:
+            self._profile_ramp_time_s = max(0.0, ramp_time_s)
+            self._speed_ramp.ramp_time_s = self._profile_ramp_time_s
+            self._motor_trims = {item.motor_id: item for item in motor_trims}
+            self._apply_motor_trims_locked()
+            if not self._cfg.enabled:
+                return target_velocity_rad_s
+            return self._set_target_velocity_locked(target_velocity_rad_s)
+
+    def restore_configured_ramp(self) -> None:
+        with self._lock:
+            if self._profile_ramp_time_s is None:
+                return
+            self._profile_ramp_time_s = None
+            self._speed_ramp.ramp_time_s = self._configured_ramp_time_s
+
+    def update_timing(self, *, command_hz: float, ramp_time_s: float) -> None:
+        with self._lock:
+            self._speed_ramp.command_hz = max(1.0, command_hz)
+            self._configured_ramp_time_s = max(0.0, ramp_time_s)
+            if self._profile_ramp_time_s is None:
+                self._speed_ramp.ramp_time_s = self._configured_ramp_time_s
+            self._throughput.max_sample_gap_s = (
+                3.0 * self._speed_ramp.command_period_s()
+            )
+            logger.info(
+                "Motor timing updated (command=%.1f Hz, ramp=%.2fs)",
+                self._speed_ramp.command_hz,
+                self._speed_ramp.ramp_time_s,
             )
-            if not self._is_service_active_locked():
-                logger.debug("Speed updated while motor service inactive")
-                return clamped_velocity
-            try:
-                self._drive_toward_target_locked()
-                return self._speed_ramp.commanded_command_value
-            except Exception:
-                logger.exception("Speed command failed; attempting full auto-reconnect")
-                self._reconnect_all_runtime_locked()
-                return self._speed_ramp.target_command_value
 
     def get_status_snapshots(self) -> list[MotorStatusSnapshot]:
+        # Connects idle motors so the status sheet shows what is on the bus.
         with self._lock:
             self._refresh_connections_for_status_locked()
-            pool_by_id = {item.motor_id: item for item in self._pool}
-            connected_by_id = {item.motor_id: item for item in self._connected}
-            active_by_id = {item.motor_id: item for item in self._motors}
-
-            snapshots: list[MotorStatusSnapshot] = []
-            for motor_id, direction in self._cfg.motor_targets:
-                managed = (
-                    active_by_id.get(motor_id)
-                    or connected_by_id.get(motor_id)
-                    or pool_by_id.get(motor_id)
-                )
-                is_connected = motor_id in connected_by_id
-                is_running = (
-                    self._state is _ServiceState.RUNNING and motor_id in active_by_id
-                )
-                motor = managed.motor if is_connected and managed is not None else None
-                snapshots.append(
-                    MotorStatusSnapshot(
-                        motor_id=motor_id,
-                        direction=direction,
-                        is_connected=is_connected,
-                        is_running=is_running,
-                        temperature_c=_safe_metric_read(
-                            motor,
-                            lambda item: item.get_temperature_celsius(),
-                        ),
-                        output_velocity_rad_s=_safe_metric_read(
-                            motor,
-                            lambda item: item.get_output_velocity_radians_per_second(),
-                        ),
-                        output_torque_nm=_safe_metric_read(
-                            motor,
-                            lambda item: item.get_output_torque_newton_meters(),
-                        ),
-                        qaxis_current_a=_safe_metric_read(
-                            motor,
-                            lambda item: item.get_current_qaxis_amps(),
-                        ),
-                    )
+            return self._status_snapshots_locked()
+
+    def peek_status_snapshots(self) -> list[MotorStatusSnapshot]:
+        # Never connects: periodic samplers would otherwise keep reconnecting
+        # motors after the hold auto-release has let them go.
+        with self._lock:
+            return self._status_snapshots_locked()
+
+    def _status_snapshots_locked(self) -> list[MotorStatusSnapshot]:
+        pool_by_id = {item.motor_id: item for item in self._pool}
+        connected_by_id = {item.motor_id: item for item in self._connected}
+        active_by_id = {item.motor_id: item for item in self._motors}
+
+        snapshots: list[MotorStatusSnapshot] = []
+        for motor_id, direction in self._cfg.motor_targets:
+            managed = (
+                active_by_id.get(motor_id)
+                or connected_by_id.get(motor_id)
+                or pool_by_id.get(motor_id)
+            )
+            is_connected = motor_id in connected_by_id
+            is_running = (
+                self._state is _ServiceState.RUNNING and motor_id in active_by_id
+            )
+            motor = managed.motor if is_connected and managed is not None else None
+            snapshots.append(
+                MotorStatusSnapshot(
+                    motor_id=motor_id,
+                    direction=self._direction_overrides.get(motor_id, direction),
+                    is_connected=is_connected,
+                    is_running=is_running,
+                    temperature_c=_safe_metric_read(
+                        motor,
+                        lambda item: item.get_temperature_celsius(),
+                    ),
+                    output_velocity_rad_s=_safe_metric_read(
+                        motor,
+                        lambda item: item.get_output_velocity_radians_per_second(),
+                    ),
+                    output_torque_nm=_safe_metric_read(
+                        motor,
+                        lambda item: item.get_output_torque_newton_meters(),
+                    ),
+                    qaxis_current_a=_safe_metric_read(
+                        motor,
+                        lambda item: item.get_current_qaxis_amps(),
+                    ),
                 )
-            return snapshots
+            )
+        return snapshots
+
+    def start_schedule(
+        self,
+        segments: Sequence[ScheduleSegment],
+        *,
+        stop_at_end: bool,
+    ) -> None:
+        with self._lock:
+            if self._state is not _ServiceState.RUNNING:
+                raise RuntimeError("Motors must be running to start a schedule")
+            self._schedule = ScheduleRunner(
+                segments,
+                started_at_s=time.monotonic(),
+                stop_at_end=stop_at_end,
+            )
+            self._set_target_velocity_locked(self._schedule.current.velocity_rad_s)
+            self._publish_progress_locked()
+            logger.info(
+                "Speed schedule started with %s steps (stop at end: %s)",
+                len(segments),
+                stop_at_end,
+            )
+
+    def cancel_schedule(self) -> bool:
+        with self._lock:
+            if self._schedule is None:
+                return False
+            self._schedule = None
+            self._publish_progress_locked()
+            logger.info("Speed schedule cancelled")
+            return True
+
+    # The two progress getters are called from the event loop, so they read
+    # the published tuple instead of taking the lock.
+    def get_schedule_status(self) -> ScheduleStatus | None:
+        return self._progress[1]
+
+    def get_throughput_snapshot(self) -> ThroughputSnapshot:
+        return self._progress[0]
+
+    def refresh_throughput_snapshot(self) -> ThroughputSnapshot:
+        # Takes the lock, so call it off the loop. The keepalive thread only
+        # publishes while motors are active; this also rolls the day and shift
+        # totals over while the line is idle.
+        with self._lock:
+            self._publish_progress_locked()
+            return self._progress[0]
+
+    def restore_throughput(self, snapshot: ThroughputSnapshot) -> None:
+        with self._lock:
+            self._throughput.restore(snapshot, wall_ts=time.time())
+            self._publish_progress_locked()
+
+    def _publish_progress_locked(self) -> None:
+        schedule = self._schedule
+        self._progress = (
+            self._throughput.snapshot(wall_ts=time.time()),
+            None if schedule is None else schedule.status(time.monotonic()),
+        )
+
+    def _set_target_velocity_locked(self, target_velocity_rad_s: float) -> float:
+        clamped_velocity = self._speed_ramp.set_target(
+            self._clamp_target_velocity_locked(target_velocity_rad_s)
+        )
+        if not self._is_service_active_locked():
+            logger.debug("Speed updated while motor service inactive")
+            return clamped_velocity
+        try:
+            self._drive_toward_target_locked()
+            return self._speed_ramp.commanded_command_value
+        except Exception:
+            logger.exception("Speed command failed; attempting full auto-reconnect")
+            self._reconnect_all_runtime_locked()
+            return self._speed_ramp.target_command_value
+
+    def _apply_motor_trims_locked(self) -> None:
+        # Reversing a moving line is unsafe, so directions only change at standstill.
+        if (
+            self._state is not _ServiceState.RUNNING
+            and self._speed_ramp.is_commanded_zero()
+        ):
+            self._direction_overrides = {
+                motor_id: item.direction for motor_id, item in self._motor_trims.items()
+            }
+
+        configured = dict(zip(self._cfg.motor_ids, self._cfg.motor_directions))
+        for item in self._pool:
+            override = self._motor_trims.get(item.motor_id)
+            item.trim = override.trim if override is not None else 1.0
+            item.direction = self._direction_overrides.get(
+                item.motor_id,
+                configured.get(item.motor_id, item.direction),
+            )
 
     def _refresh_connections_for_status_locked(self) -> None:
         if not self._cfg.enabled:
@@ -329,11 +546,14 @@ class MotorService:
         if not self._motors:
             return clamped_velocity
 
+        # Trims scale past the shared target, so each motor is clamped again.
+        velocity_limit = self._velocity_limit_locked()
         failed: list[_ManagedMotor] = []
         for item in self._motors:
+            motor_velocity = clamped_velocity * item.direction * item.trim
             try:
                 item.motor.set_output_velocity_radians_per_second(
-                    clamped_velocity * item.direction
+                    max(-velocity_limit, min(motor_velocity, velocity_limit))
                 )
                 item.motor.update()
             except Exception:
@@ -356,6 +576,36 @@ class MotorService:
     def is_running(self) -> bool:
         return self._state is _ServiceState.RUNNING
 
+    # is_running, is_active and set_state_listener are called from the event
+    # loop, so like is_running they never take the lock: it is held through
+    # CAN connects and reconnects. Reading or replacing one attribute is atomic.
+    def is_active(self) -> bool:
+        return self._state_value is not _ServiceState.OFF
+
+    def set_state_listener(self, listener: Callable[[], None] | None) -> None:
+        """
+        Called on every state transition and schedule step, from whichever
+        thread made it (often the keepalive thread) while the service lock is
+        held: the listener must only hand off, e.g. via call_soon_threadsafe.
+        """
+        self._state_listener = listener
+
+    @property
+    def _state(self) -> _ServiceState:
+        return self._state_value
+
+    @_state.setter
+    def _state(self, state: _ServiceState) -> None:
+        if state is self._state_value:
+            return
+        self._state_value = state
+        self._notify_state_listener()
+
+    def _notify_state_listener(self) -> None:
+        listener = self._state_listener
+        if listener is not None:
+            listener()
+
     def _start_keepalive_loop_locked(self) -> None:
         self._keepalive_stop = Event()
         self._keepalive_thread = Thread(
@@ -366,15 +616,19 @@ class MotorService:
         self._keepalive_thread.start()
 
     def _keepalive_loop(self) -> None:
-        period_s = self._speed_ramp.command_period_s()
         while True:
             now_s = time.monotonic()
             with self._lock:
+                # Read per tick so a hot-reloaded command rate applies immediately.
+                period_s = self._speed_ramp.command_period_s()
                 if not self._is_service_active_locked():
                     return
                 try:
+                    self._advance_schedule_locked(now_s)
                     self._drive_toward_target_locked()
+                    self._sample_throughput_locked(now_s)
                     self._maybe_log_motor_temperatures_locked(now_s)
+                    self._maybe_sample_motor_metrics_locked(now_s)
                     if self._maybe_auto_release_hold_locked(now_s):
                         return
                 except Exception:
@@ -387,10 +641,17 @@ class MotorService:
                         logger.exception("Auto-reconnect failed; motor service stopped")
                         self._state = _ServiceState.OFF
                         return
+            tick_s = time.monotonic() - now_s
+            _TICK_SECONDS.observe(tick_s)
+            if tick_s > period_s:
+                _TICK_OVERRUNS.inc()
             if self._keepalive_stop.wait(period_s):
                 return
 
     def _build_pool_locked(self) -> None:
+        # Imported on first use so MOTOR_ENABLED=false never loads the CAN stack.
+        from cubemars_servo_can import CubeMarsServoCAN
+
         pool: list[_ManagedMotor] = []
         for motor_id, direction in self._cfg.motor_targets:
             motor = CubeMarsServoCAN(
@@ -399,11 +660,13 @@ class MotorService:
                 max_mosfet_temp=self._cfg.max_mosfet_temp_c,
                 can_channel=self._cfg.can_channel,
             )
+            override = self._motor_trims.get(motor_id)
             pool.append(
                 _ManagedMotor(
                     motor=motor,
-                    direction=direction,
+                    direction=self._direction_overrides.get(motor_id, direction),
                     motor_id=motor_id,
+                    trim=override.trim if override is not None else 1.0,
                 )
             )
 
@@ -452,6 +715,7 @@ class MotorService:
             )
         else:
             self._max_motor_velocity_rad_s = 0.0
+        _CONNECTED_MOTORS.set(len(self._connected))
 
         if new_connected:
             logger.info(
@@ -461,6 +725,7 @@ class MotorService:
             )
 
     def _reconnect_all_runtime_locked(self) -> None:
+        _RECONNECTS.inc()
         previous_state = self._state
         target_velocity_rad_s = self._speed_ramp.target_command_value
         commanded_velocity_rad_s = self._speed_ramp.commanded_command_value
@@ -469,6 +734,7 @@ class MotorService:
         self._connect_available_locked()
 
         if not self._connected:
+            _RECONNECT_FAILURES.inc()
             self._state = _ServiceState.OFF
             self._motors = []
             raise RuntimeError(
@@ -535,24 +801,58 @@ class MotorService:
         self._initialized = False
         self._max_motor_velocity_rad_s = 0.0
         self._next_temp_log_at_s = 0.0
+        self._next_metrics_sample_at_s = 0.0
         self._holding_since_s = None
         self._speed_ramp.reset()
+        self._schedule = None
+        self._throughput.pause()
+        self._publish_progress_locked()
+        _CONNECTED_MOTORS.set(0)
+
+    def _advance_schedule_locked(self, now_s: float) -> None:
+        schedule = self._schedule
+        if schedule is None or now_s < schedule.next_boundary_s:
+            return
+
+        segment = schedule.advance(now_s)
+        if segment is None:
+            self._schedule = None
+        self._publish_progress_locked()
+        self._notify_state_listener()
+        if segment is None:
+            if schedule.stop_at_end:
+                self._state = _ServiceState.HOLDING
+                self._holding_since_s = None
+                self._speed_ramp.set_target(0)
+                logger.info("Speed schedule finished; stopping motors")
+            else:
+                logger.info("Speed schedule finished; keeping last tray time")
+            return
+
+        self._speed_ramp.set_target(
+            self._clamp_target_velocity_locked(segment.velocity_rad_s)
+        )
+        logger.info("Speed schedule step: %.0fs/tray", segment.sec_per_tray)
 
     def _drive_toward_target_locked(self) -> None:
         next_velocity = self._speed_ramp.next_command_value()
         applied_velocity = self._send_speed_command_locked(next_velocity)
         self._speed_ramp.set_commanded(applied_velocity)
+        _TARGET_VELOCITY.set(self._speed_ramp.target_command_value)
+        _COMMANDED_VELOCITY.set(applied_velocity)
 
     def _clamp_target_velocity_locked(self, velocity_rad_s: float) -> float:
         clamped_velocity = self._speed_ramp.clamp_float(velocity_rad_s)
-        if self._max_motor_velocity_rad_s <= 0.0:
-            return clamped_velocity
+        velocity_limit = self._velocity_limit_locked()
+        return max(-velocity_limit, min(clamped_velocity, velocity_limit))
 
-        velocity_limit = min(
+    def _velocity_limit_locked(self) -> float:
+        if self._max_motor_velocity_rad_s <= 0.0:
+            return self._cfg.max_target_velocity_rad_s
+        return min(
             self._cfg.max_target_velocity_rad_s,
             self._max_motor_velocity_rad_s,
         )
-        return max(-velocity_limit, min(clamped_velocity, velocity_limit))
 
     def _wait_until_commanded_zero(self, timeout_s: float) -> bool:
         deadline = time.monotonic() + timeout_s
@@ -566,6 +866,26 @@ class MotorService:
             time.sleep(period_s)
         return False
 
+    def _sample_throughput_locked(self, now_s: float) -> None:
+        # Mirrored motors share one line, so average their measured speed.
+        velocities = [
+            abs(velocity)
+            for item in self._motors
+            if (
+                velocity := _safe_metric_read(
+                    item.motor,
+                    lambda item: item.get_output_velocity_radians_per_second(),
+                )
+            )
+            is not None
+        ]
+        self._throughput.add_sample(
+            sum(velocities) / len(velocities) if velocities else None,
+            now_s=now_s,
+            wall_ts=time.time(),
+        )
+        self._publish_progress_locked()
+
     def _maybe_log_motor_temperatures_locked(self, now_s: float) -> None:
         if not logger.isEnabledFor(logging.INFO):
             return
@@ -581,10 +901,33 @@ class MotorService:
         logger.info("Motor temperatures: %s", temperature_samples)
         self._next_temp_log_at_s = now_s + _TEMP_MONITOR_INTERVAL_S
 
+    def _maybe_sample_motor_metrics_locked(self, now_s: float) -> None:
+        if now_s < self._next_metrics_sample_at_s:
+            return
+
+        for item in self._motors:
+            motor_id = item.motor_id
+            _TEMPERATURE.labels(motor_id).set(
+                _metric_or_nan(item.motor, lambda item: item.get_temperature_celsius())
+            )
+            _MEASURED_VELOCITY.labels(motor_id).set(
+                _metric_or_nan(
+                    item.motor,
+                    lambda item: item.get_output_velocity_radians_per_second(),
+                )
+            )
+            _CURRENT.labels(motor_id).set(
+                _metric_or_nan(item.motor, lambda item: item.get_current_qaxis_amps())
+            )
+        self._next_metrics_sample_at_s = now_s + _METRICS_SAMPLE_INTERVAL_S
+
     def _maybe_auto_release_hold_locked(self, now_s: float) -> bool:
         if self._state is not _ServiceState.HOLDING:
             return False
         if self._holding_since_s is None:
+            # Stops issued from the tick (schedule end) start the timer at zero speed.
+            if self._speed_ramp.is_commanded_zero():
+                self._holding_since_s = now_s
             return False
         if (now_s - self._holding_since_s) < self._cfg.hold_release_timeout_s:
             return False
@@ -625,6 +968,14 @@ def _safe_metric_read(
         return None
 
 
+def _metric_or_nan(
+    motor: CubeMarsServoCAN,
+    reader: Callable[[CubeMarsServoCAN], float],
+) -> float:
+    value = _safe_metric_read(motor, reader)
+    return math.nan if value is None else value
+
+
 def _detach_motor_listener(motor: CubeMarsServoCAN) -> None:
     try:
         motor.detach_listener()
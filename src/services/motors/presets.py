@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from utils.files import write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+MIN_MOTOR_TRIM = 0.8
+MAX_MOTOR_TRIM = 1.2
+
+
+@dataclass(frozen=True)
+class MotorTrim:
+    motor_id: int
+    direction: int
+    trim: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.direction not in (-1, 1):
+            raise ValueError(
+                f"Motor {self.motor_id} direction must be -1 or 1 (got {self.direction})"
+            )
+        if not MIN_MOTOR_TRIM <= self.trim <= MAX_MOTOR_TRIM:
+            raise ValueError(
+                f"Motor {self.motor_id} trim must be within "
+                f"{MIN_MOTOR_TRIM}..{MAX_MOTOR_TRIM} (got {self.trim})"
+            )
+
+
+@dataclass(frozen=True)
+class TrayPreset:
+    name: str
+    sec_per_tray: float
+    ramp_time_s: float
+    motors: tuple[MotorTrim, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.name.strip():
+            raise ValueError("Preset name must not be empty")
+        if not math.isfinite(self.sec_per_tray) or self.sec_per_tray <= 0.0:
+            raise ValueError("Preset tray time must be positive")
+        if not math.isfinite(self.ramp_time_s) or self.ramp_time_s < 0.0:
+            raise ValueError("Preset ramp time must not be negative")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TrayPreset":
+        raw_motors = data.get("motors") or []
+        if not isinstance(raw_motors, list):
+            raise ValueError("Preset 'motors' must be a list")
+        return cls(
+            name=str(data["name"]).strip(),
+            sec_per_tray=float(data["sec_per_tray"]),
+            ramp_time_s=float(data["ramp_time_s"]),
+            motors=tuple(
+                MotorTrim(
+                    motor_id=int(item["motor_id"]),
+                    direction=int(item["direction"]),
+                    trim=float(item.get("trim", 1.0)),
+                )
+                for item in raw_motors
+            ),
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class PresetFileWrite:
+    version: int
+    text: str
+
+
+class PresetStore:
+    """
+    Presets indexed by name, loaded into memory once.
+
+    Reads never touch disk. Changes update memory and return the whole file as
+    a `PresetFileWrite`; `write` stores it atomically and may run on a worker
+    thread, so the event loop never waits for the fsync.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._presets: dict[str, TrayPreset] = self._load()
+        self._version = 0
+        self._written_version = 0
+        self._write_lock = Lock()
+
+    def names(self) -> tuple[str, ...]:
+        return tuple(sorted(self._presets, key=str.casefold))
+
+    def get(self, name: str) -> TrayPreset | None:
+        return self._presets.get(name)
+
+    def all(self) -> list[TrayPreset]:
+        return [self._presets[name] for name in self.names()]
+
+    def save(self, preset: TrayPreset) -> PresetFileWrite:
+        self._presets[preset.name] = preset
+        return self._file_write()
+
+    def delete(self, name: str) -> PresetFileWrite | None:
+        if self._presets.pop(name, None) is None:
+            return None
+        return self._file_write()
+
+    def write(self, file_write: PresetFileWrite) -> None:
+        # Writes from worker threads can finish out of order; an older file
+        # must never replace a newer one.
+        with self._write_lock:
+            if file_write.version <= self._written_version:
+                return
+            write_text_atomic(self._path, file_write.text)
+            self._written_version = file_write.version
+
+    def _load(self) -> dict[str, TrayPreset]:
+        if not self._path.exists():
+            return {}
+        try:
+            with open(self._path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            logger.exception("Failed to read presets file: %s", self._path)
+            return {}
+
+        if not isinstance(data, list):
+            logger.error("Presets file is not a list: %s", self._path)
+            return {}
+
+        presets: dict[str, TrayPreset] = {}
+        for item in data:
+            try:
+                preset = TrayPreset.from_dict(item)
+            except (ValueError, TypeError, KeyError, AttributeError):
+                logger.warning("Skipping invalid preset entry: %r", item)
+                continue
+            presets[preset.name] = preset
+        logger.info("Loaded %s tray presets", len(presets))
+        return presets
+
+    def _file_write(self) -> PresetFileWrite:
+        self._version += 1
+        payload = [preset.to_dict() for preset in self.all()]
+        return PresetFileWrite(
+            version=self._version,
+            text=json.dumps(payload, indent=2) + "\n",
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ScheduleStep:
+    sec_per_tray: float
+    duration_s: float
+
+    def __post_init__(self) -> None:
+        if not math.isfinite(self.sec_per_tray) or self.sec_per_tray <= 0.0:
+            raise ValueError("Schedule step tray time must be positive")
+        if not math.isfinite(self.duration_s) or self.duration_s <= 0.0:
+            raise ValueError("Schedule step duration must be positive")
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScheduleStep":
+        return cls(
+            sec_per_tray=float(data["sec_per_tray"]),
+            duration_s=float(data["duration_s"]),
+        )
+
+
+@dataclass(frozen=True)
+class ScheduleSegment:
+    sec_per_tray: float
+    velocity_rad_s: float
+    duration_s: float
+
+
+@dataclass(frozen=True)
+class ScheduleStatus:
+    step_index: int
+    step_count: int
+    sec_per_tray: float
+    step_remaining_s: float
+    total_remaining_s: float
+    stop_at_end: bool
+
+
+class ScheduleRunner:
+    """
+    Timeline of speed segments with boundaries precomputed at start.
+
+    The keepalive tick only compares the clock against `next_boundary_s`.
+    """
+
+    def __init__(
+        self,
+        segments: Sequence[ScheduleSegment],
+        *,
+        started_at_s: float,
+        stop_at_end: bool,
+    ) -> None:
+        if not segments:
+            raise ValueError("Schedule must contain at least one step")
+
+        ends_s: list[float] = []
+        boundary_s = started_at_s
+        for segment in segments:
+            boundary_s += segment.duration_s
+            ends_s.append(boundary_s)
+
+        self._segments = tuple(segments)
+        self._ends_s = tuple(ends_s)
+        self._index = 0
+        self.stop_at_end = stop_at_end
+
+    @property
+    def current(self) -> ScheduleSegment:
+        return self._segments[self._index]
+
+    @property
+    def next_boundary_s(self) -> float:
+        return self._ends_s[self._index]
+
+    def advance(self, now_s: float) -> ScheduleSegment | None:
+        # A late tick may cross several short segments at once.
+        while self._index < len(self._segments) and now_s >= self._ends_s[self._index]:
+            self._index += 1
+        if self._index >= len(self._segments):
+            return None
+        return self._segments[self._index]
+
+    def status(self, now_s: float) -> ScheduleStatus:
+        return ScheduleStatus(
+            step_index=self._index,
+            step_count=len(self._segments),
+            sec_per_tray=self.current.sec_per_tray,
+            step_remaining_s=max(0.0, self.next_boundary_s - now_s),
+            total_remaining_s=max(0.0, self._ends_s[-1] - now_s),
+            stop_at_end=self.stop_at_end,
+        )
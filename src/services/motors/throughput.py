@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, time as dt_time, timedelta
+from pathlib import Path
+
+from .tray_speed import velocity_rad_s_to_trays_per_second
+from utils.files import write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThroughputSnapshot:
+    day: str
+    shift: str
+    trays_today: float
+    trays_this_shift: float
+    trays_total: float
+    measured_trays_per_minute: float
+
+
+class ThroughputAccumulator:
+    """
+    Integrates measured output velocity into processed trays.
+
+    Not thread-safe: the motor service feeds it from the keepalive tick while
+    holding its own lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        tray_size_cm: float,
+        shift_start_hours: tuple[int, ...],
+        max_sample_gap_s: float,
+    ) -> None:
+        self._tray_size_cm = tray_size_cm
+        self._shift_start_hours = tuple(
+            sorted({hour % 24 for hour in shift_start_hours})
+        ) or (0,)
+        self.max_sample_gap_s = max_sample_gap_s
+        self._day = ""
+        self._shift = ""
+        self._next_rollover_ts = 0.0
+        self._trays_today = 0.0
+        self._trays_this_shift = 0.0
+        self._trays_total = 0.0
+        self._trays_per_second = 0.0
+        self._last_sample_s: float | None = None
+
+    def add_sample(
+        self,
+        velocity_rad_s: float | None,
+        *,
+        now_s: float,
+        wall_ts: float,
+    ) -> None:
+        self._roll_over(wall_ts)
+        trays_per_second = 0.0
+        if velocity_rad_s is not None:
+            trays_per_second = (
+                velocity_rad_s_to_trays_per_second(
+                    velocity_rad_s,
+                    tray_size_cm=self._tray_size_cm,
+                )
+                or 0.0
+            )
+
+        last_sample_s = self._last_sample_s
+        self._last_sample_s = now_s
+        self._trays_per_second = trays_per_second
+        if last_sample_s is None:
+            return
+
+        # Never integrate across a stall or a stopped keepalive loop.
+        elapsed_s = now_s - last_sample_s
+        if elapsed_s <= 0.0 or elapsed_s > self.max_sample_gap_s:
+            return
+
+        trays = trays_per_second * elapsed_s
+        self._trays_today += trays
+        self._trays_this_shift += trays
+        self._trays_total += trays
+
+    def pause(self) -> None:
+        self._last_sample_s = None
+        self._trays_per_second = 0.0
+
+    def restore(self, snapshot: ThroughputSnapshot, *, wall_ts: float) -> None:
+        self._roll_over(wall_ts)
+        self._trays_total = max(self._trays_total, snapshot.trays_total)
+        if snapshot.day == self._day:
+            self._trays_today = max(self._trays_today, snapshot.trays_today)
+        if snapshot.shift == self._shift:
+            self._trays_this_shift = max(
+                self._trays_this_shift,
+                snapshot.trays_this_shift,
+            )
+
+    def snapshot(self, *, wall_ts: float) -> ThroughputSnapshot:
+        self._roll_over(wall_ts)
+        return ThroughputSnapshot(
+            day=self._day,
+            shift=self._shift,
+            trays_today=self._trays_today,
+            trays_this_shift=self._trays_this_shift,
+            trays_total=self._trays_total,
+            measured_trays_per_minute=self._trays_per_second * 60.0,
+        )
+
+    def _roll_over(self, wall_ts: float) -> None:
+        # Boundaries are precomputed so the per-tick check is one comparison.
+        if wall_ts < self._next_rollover_ts:
+            return
+
+        now = datetime.fromtimestamp(wall_ts)
+        today = now.date()
+        boundaries = [
+            datetime.combine(today + timedelta(days=offset), dt_time(hour))
+            for offset in (-1, 0, 1)
+            for hour in self._shift_start_hours
+        ]
+        shift_start = max(boundary for boundary in boundaries if boundary <= now)
+        next_shift_start = min(boundary for boundary in boundaries if boundary > now)
+        next_midnight = datetime.combine(today + timedelta(days=1), dt_time())
+
+        day = today.isoformat()
+        shift = shift_start.isoformat(timespec="minutes")
+        if day != self._day:
+            if self._day:
+                logger.info("Day %s closed at %.0f trays", self._day, self._trays_today)
+            self._day = day
+            self._trays_today = 0.0
+        if shift != self._shift:
+            if self._shift:
+                logger.info(
+                    "Shift %s closed at %.0f trays",
+                    self._shift,
+                    self._trays_this_shift,
+                )
+            self._shift = shift
+            self._trays_this_shift = 0.0
+        self._next_rollover_ts = min(next_shift_start, next_midnight).timestamp()
+
+
+def load_throughput_snapshot(path: Path) -> ThroughputSnapshot | None:
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return ThroughputSnapshot(
+            day=str(data["day"]),
+            shift=str(data["shift"]),
+            trays_today=float(data["trays_today"]),
+            trays_this_shift=float(data["trays_this_shift"]),
+            trays_total=float(data["trays_total"]),
+            measured_trays_per_minute=0.0,
+        )
+    except (OSError, ValueError, TypeError, KeyError):
+        logger.warning("Ignoring unreadable throughput snapshot: %s", path)
+        return None
+
+
+def save_throughput_snapshot(path: Path, snapshot: ThroughputSnapshot) -> None:
+    data = asdict(snapshot)
+    data.pop("measured_trays_per_minute")
+    write_text_atomic(path, json.dumps(data, indent=2) + "\n")
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import flet as ft
@@ -188,7 +189,9 @@ def _scrollbar_theme() -> ft.ScrollbarTheme:
     )
 
 
+@lru_cache(maxsize=1)
 def build_theme() -> ft.Theme:
+    """Built once per process and shared by every page; read-only."""
     return ft.Theme(
         font_family=typography.FONT_FAMILY,
         use_material3=True,
@@ -32,6 +32,7 @@ APP_SHELL_SUBTITLE = "#DCE9FF"
 PRIMARY_OVERLAY_STRONG = "#142069D8"
 PRIMARY_OVERLAY = "#102069D8"
 PRIMARY_OVERLAY_SOFT = "#0F2069D8"
+DEBUG_OVERLAY = "#B80B264F"
 
 # Shadow
 SHADOW_STRONG = "#140B264F"
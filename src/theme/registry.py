@@ -0,0 +1,54 @@
+"""
+Shared theme objects, built once per process.
+
+Shadows and borders are plain Flet dataclasses that every render used to
+rebuild for the same few inputs. The registry builds each one once (shadows
+once per scale bucket) and hands out the same instance to every caller, so
+callers must treat the returned objects as read-only.
+"""
+
+from functools import lru_cache
+
+import flet as ft
+
+from . import shadows
+
+# Viewport scales are clamped to ~0.6-1.3; at this granularity a shadow is at
+# most half a pixel off and each builder keeps about a dozen instances.
+SCALE_BUCKET = 0.05
+_SCALED_CACHE_SIZE = 32
+# Distinct (width, color) borders in use stay well below this.
+_BORDER_CACHE_SIZE = 64
+
+
+def scale_bucket(scale: float) -> float:
+    """Rounds `scale` to the nearest `SCALE_BUCKET` step."""
+    return round(round(scale / SCALE_BUCKET) * SCALE_BUCKET, 2)
+
+
+def card_shadow(scale: float = 1.0) -> ft.BoxShadow:
+    return _card_shadow(scale_bucket(scale))
+
+
+def soft_shadow(scale: float = 1.0) -> ft.BoxShadow:
+    return _soft_shadow(scale_bucket(scale))
+
+
+@lru_cache(maxsize=_SCALED_CACHE_SIZE)
+def _card_shadow(bucket: float) -> ft.BoxShadow:
+    return shadows.card_shadow(bucket)
+
+
+@lru_cache(maxsize=_SCALED_CACHE_SIZE)
+def _soft_shadow(bucket: float) -> ft.BoxShadow:
+    return shadows.soft_shadow(bucket)
+
+
+@lru_cache(maxsize=_BORDER_CACHE_SIZE)
+def border_all(width: float, color: str) -> ft.Border:
+    return ft.Border.all(width, color)
+
+
+@lru_cache(maxsize=_BORDER_CACHE_SIZE)
+def border_bottom(width: float, color: str) -> ft.Border:
+    return ft.Border(bottom=ft.BorderSide(width, color))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 
 import flet as ft
 
@@ -11,6 +12,12 @@ class ViewportArea(StrEnum):
     CONTENT = "content"
 
 
+# Metrics and the layout tokens derived from them are cached per viewport
+# size: a kiosk sees a handful of sizes, so renders between resizes only hit
+# the caches instead of redoing the scaling arithmetic.
+_LAYOUT_CACHE_SIZE = 32
+
+
 @dataclass(frozen=True)
 class ViewportMetrics:
     width: float
@@ -19,10 +26,19 @@ class ViewportMetrics:
     is_compact: bool
 
 
+def scaled(
+    metrics: ViewportMetrics, compact: float, regular: float | None = None
+) -> int:
+    """Rounds `compact` (or `regular` on larger screens) to the current scale."""
+    value = compact if regular is None or metrics.is_compact else regular
+    return int(round(value * metrics.scale))
+
+
 def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(value, maximum))
 
 
+@lru_cache(maxsize=_LAYOUT_CACHE_SIZE)
 def resolve_panel_width(
     metrics: ViewportMetrics,
     *,
@@ -63,6 +79,7 @@ def _resolve_viewport_height(
     return max(1.0, total_height - top_inset - bottom_inset)
 
 
+@lru_cache(maxsize=_LAYOUT_CACHE_SIZE)
 def _build_viewport_metrics(
     *,
     width: float,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 import flet as ft
@@ -51,6 +52,10 @@ TEXT_VARIANTS: dict[TextVariant, TextSpec] = {
 }
 
 
+# Distinct (variant, size, color, ...) combinations in use stay well below this.
+_TEXT_STYLE_CACHE_SIZE = 256
+
+
 def text_style(
     variant: TextVariant,
     *,
@@ -59,19 +64,38 @@ def text_style(
     weight: ft.FontWeight | None = None,
     letter_spacing: float | None = None,
 ) -> ft.TextStyle:
+    """
+    Returns the shared style for the resolved arguments: equal requests get
+    the same instance, so callers must treat it as read-only.
+    """
     spec = TEXT_VARIANTS[variant]
-    resolved_weight = weight or spec.weight
-    return ft.TextStyle(
-        font_family=(
-            FONT_FAMILY_MEDIUM
-            if resolved_weight == ft.FontWeight.W_500
-            else FONT_FAMILY
-        ),
+    return _interned_text_style(
         size=size or spec.size,
-        weight=resolved_weight,
+        weight=weight or spec.weight,
         color=color or spec.color,
         height=spec.height,
         letter_spacing=(
             spec.letter_spacing if letter_spacing is None else letter_spacing
         ),
     )
+
+
+@lru_cache(maxsize=_TEXT_STYLE_CACHE_SIZE)
+def _interned_text_style(
+    *,
+    size: int,
+    weight: ft.FontWeight,
+    color: str,
+    height: float,
+    letter_spacing: float,
+) -> ft.TextStyle:
+    return ft.TextStyle(
+        font_family=(
+            FONT_FAMILY_MEDIUM if weight == ft.FontWeight.W_500 else FONT_FAMILY
+        ),
+        size=size,
+        weight=weight,
+        color=color,
+        height=height,
+        letter_spacing=letter_spacing,
+    )
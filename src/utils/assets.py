@@ -0,0 +1,69 @@
+"""
+Runtime resolver for pre-scaled image variants.
+
+`scripts/build_assets.py` writes variants named `<stem>@<width>x<height>.<ext>`
+into `assets/scaled/`. Components ask for the size they draw at and get the
+smallest variant that still covers it, so the client never decodes (or keeps
+a texture of) a full-size source image. Without variants, the original asset
+is served unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+SCALED_DIR_NAME = "scaled"
+_VARIANT_PATTERN = re.compile(
+    r"^(?P<stem>.+)@(?P<width>\d+)x(?P<height>\d+)\.(?P<ext>webp|png)$"
+)
+# Same size: WebP decodes smaller than PNG for photos.
+_EXT_PREFERENCE = {"webp": 0, "png": 1}
+
+
+@dataclass(frozen=True)
+class AssetVariant:
+    path: str
+    width: int
+    height: int
+    ext: str
+
+
+@lru_cache(maxsize=1)
+def _variants_by_stem() -> dict[str, list[AssetVariant]]:
+    scaled_dir = ASSETS_DIR / SCALED_DIR_NAME
+    variants: dict[str, list[AssetVariant]] = {}
+    if not scaled_dir.is_dir():
+        return variants
+    for file in scaled_dir.iterdir():
+        match = _VARIANT_PATTERN.match(file.name)
+        if match is None:
+            continue
+        variants.setdefault(match["stem"], []).append(
+            AssetVariant(
+                path=f"{SCALED_DIR_NAME}/{file.name}",
+                width=int(match["width"]),
+                height=int(match["height"]),
+                ext=match["ext"],
+            )
+        )
+    for stem_variants in variants.values():
+        stem_variants.sort(
+            key=lambda item: (item.width * item.height, _EXT_PREFERENCE[item.ext])
+        )
+    return variants
+
+
+@lru_cache(maxsize=32)
+def resolve_asset(name: str, *, width: int, height: int = 0) -> str:
+    """
+    Returns the asset path (relative to the assets dir) to draw `name` at
+    `width` x `height` logical pixels; `height=0` only constrains the width.
+    """
+    for variant in _variants_by_stem().get(Path(name).stem, []):
+        if variant.width >= width and variant.height >= height:
+            return variant.path
+    return name
@@ -1,29 +1,26 @@
+import atexit
+import logging
 import os
 import re
 import shutil
 import sys
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, cast
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
 
+from .files import write_text_atomic
+from .startup_trace import startup_trace
 
-def get_env(key: str, default: str) -> str:
-    val = os.getenv(key)
-    if val is None:
-        return default
-    return val
+logger = logging.getLogger(__name__)
 
-
-def get_env_bool(key: str, default: bool) -> bool:
-    value = get_env(key, "true" if default else "false").strip().lower()
-    if value == "":
-        return default
-    if value in {"1", "true", "yes", "on"}:
-        return True
-    if value in {"0", "false", "no", "off"}:
-        return False
-    return default
+# Writes are batched: a burst of slider commits becomes one file rewrite.
+_WRITE_DEBOUNCE_S = 1.0
+_KEY_LINE_PATTERN = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=")
+_WATCH_INTERVAL_S = 1.0
 
 
 def parse_int_csv(value: str) -> list[int]:
@@ -31,6 +28,137 @@ def parse_int_csv(value: str) -> list[int]:
     return [int(token) for token in tokens]
 
 
+def _parse_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _parse_motor_ids(value: str) -> list[int]:
+    return parse_int_csv(value) or [1]
+
+
+@dataclass(frozen=True)
+class ConfigField:
+    """
+    One key of the storage file: how to parse it, its default and its range.
+    `live` keys take effect on hot reload; others need a restart.
+    """
+
+    key: str
+    default: str
+    parse: Callable[[str], object] = str
+    minimum: float | None = None
+    maximum: float | None = None
+    live: bool = False
+
+    @property
+    def attr(self) -> str:
+        return self.key.lower()
+
+    def read(self, raw: str | None) -> object:
+        if raw is None:
+            return self.parse(self.default)
+        try:
+            value = self.parse(raw)
+        except ValueError:
+            logger.warning(
+                "Invalid %s=%r; using default %r", self.key, raw, self.default
+            )
+            return self.parse(self.default)
+        return self._clamp(value)
+
+    def format(self, value: object) -> str:
+        """Inverse of `read`: the text that parses back to `value`."""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, list):
+            return ",".join(str(item) for item in value)
+        return str(value)
+
+    def _clamp(self, value: object) -> object:
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            return value
+        clamped = value
+        if self.minimum is not None and clamped < self.minimum:
+            clamped = type(value)(self.minimum)
+        if self.maximum is not None and clamped > self.maximum:
+            clamped = type(value)(self.maximum)
+        if clamped != value:
+            logger.warning("%s=%s out of range; using %s", self.key, value, clamped)
+        return clamped
+
+
+CONFIG_SCHEMA: tuple[ConfigField, ...] = (
+    # App
+    ConfigField("APP_TITLE", "Tango Motors Control"),
+    ConfigField("APP_ADMIN_DEFAULT_PASSCODE", "1010"),
+    ConfigField("APP_FULLSCREEN_MODE", "true", _parse_bool),
+    ConfigField("APP_SCREEN_WIDTH", "800", int, minimum=320),
+    ConfigField("APP_SCREEN_HEIGHT", "480", int, minimum=240),
+    # User Preferences
+    ConfigField("LOCALE", "fr", str.lower),
+    ConfigField("DEFAULT_SEC_PER_TRAY", "15", float),
+    ConfigField("ADMIN_PASSCODE_HASH", ""),
+    # OWASP minimum for argon2id: 19 MiB, t=2. Memory must also cover 8 KiB per
+    # lane, which SettingsService checks when it builds the hasher.
+    ConfigField("ARGON2_TIME_COST", "2", int, minimum=1, live=True),
+    ConfigField("ARGON2_MEMORY_COST_KIB", "19456", int, minimum=19456, live=True),
+    ConfigField("ARGON2_PARALLELISM", "1", int, minimum=1, live=True),
+    # Assets
+    ConfigField("ASSET_LOGO", "tango_logo.png"),
+    ConfigField("ASSET_SCREENSAVER", "regethermic_screensaver.png"),
+    # Behavior
+    ConfigField("INACTIVITY_TIMEOUT", "30.0", float, minimum=1.0),
+    ConfigField("LOG_LEVEL", "INFO", str.upper),
+    ConfigField("STARTUP_TRACE_ENABLED", "false", _parse_bool),
+    ConfigField("RENDER_PROFILER_ENABLED", "false", _parse_bool),
+    # Motor Control
+    ConfigField("MOTOR_ENABLED", "false", _parse_bool),
+    ConfigField("MOTOR_TYPE", "AK40-10"),
+    ConfigField("MOTOR_CAN_CHANNEL", "can0"),
+    ConfigField("MOTOR_IDS", "1,2", _parse_motor_ids),
+    ConfigField("MOTOR_DIRECTIONS", "1,-1", parse_int_csv),
+    ConfigField(
+        "MOTOR_COMMAND_HZ", "2.0", float, minimum=1.0, maximum=500.0, live=True
+    ),
+    ConfigField("MOTOR_RAMP_TIME_S", "0.5", float, minimum=0.0, live=True),
+    ConfigField("MOTOR_HOLD_RELEASE_TIMEOUT_S", "5.0", float, minimum=0.0),
+    ConfigField("MOTOR_TRAY_SIZE_CM", "53", float, minimum=0.1),
+    ConfigField("MOTOR_MIN_SEC_PER_TRAY", "15", float, minimum=1.0),
+    ConfigField("MOTOR_MAX_SEC_PER_TRAY", "40", float, minimum=1.0),
+    ConfigField("MOTOR_MAX_TEMP_C", "70.0", float, minimum=0.0, maximum=120.0),
+    # Local API
+    ConfigField("API_ENABLED", "false", _parse_bool),
+    ConfigField("API_HOST", "127.0.0.1"),
+    ConfigField("API_PORT", "8765", int, minimum=1, maximum=65535),
+    ConfigField("API_TELEMETRY_HZ", "2.0", float, minimum=0.1, maximum=50.0),
+    # Throughput
+    ConfigField("THROUGHPUT_SHIFT_START_HOURS", "6,14,22", parse_int_csv),
+    ConfigField("THROUGHPUT_SNAPSHOT_INTERVAL_S", "60", float, minimum=5.0, live=True),
+)
+_SCHEMA_BY_KEY: dict[str, ConfigField] = {spec.key: spec for spec in CONFIG_SCHEMA}
+
+
+def schema_default(key: str) -> object:
+    """The parsed default value of a schema key."""
+    return _SCHEMA_BY_KEY[key].read(None)
+
+
+def _read_values(storage_path: Path, process_env: dict[str, str]) -> dict[str, str]:
+    # `process_env` is the environment from before load_dotenv: os.environ also
+    # holds the file's keys, which would outlive their removal from the file.
+    values = dict(process_env)
+    if storage_path.exists():
+        for key, value in dotenv_values(storage_path).items():
+            if value is not None:
+                values[key] = value
+    return values
+
+
 @dataclass
 class Config:
     """
@@ -49,6 +177,9 @@ class Config:
     locale: str
     default_sec_per_tray: float
     admin_passcode_hash: str
+    argon2_time_cost: int
+    argon2_memory_cost_kib: int
+    argon2_parallelism: int
 
     # Assets
     asset_logo: str
@@ -57,6 +188,8 @@ class Config:
     # Behavior
     inactivity_timeout: float
     log_level: str
+    startup_trace_enabled: bool
+    render_profiler_enabled: bool
 
     # Motor Control
     motor_enabled: bool
@@ -72,7 +205,35 @@ class Config:
     motor_max_sec_per_tray: float
     motor_max_temp_c: float
 
+    # Local API
+    api_enabled: bool
+    api_host: str
+    api_port: int
+    api_telemetry_hz: float
+
+    # Throughput
+    throughput_shift_start_hours: list[int]
+    throughput_snapshot_interval_s: float
+
     _storage_path: Path
+    _process_env: dict[str, str] = field(repr=False, default_factory=dict)
+    _pending_writes: dict[str, str] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _pending_lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _write_lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _flush_timer: threading.Timer | None = field(init=False, repr=False, default=None)
+    _listeners: list[Callable[[frozenset[str]], None]] = field(
+        init=False, repr=False, default_factory=list
+    )
+    _watch_thread: threading.Thread | None = field(init=False, repr=False, default=None)
+    _watch_stop: threading.Event = field(
+        init=False, repr=False, default_factory=threading.Event
+    )
 
     @classmethod
     def load(cls) -> "Config":
@@ -108,100 +269,163 @@ class Config:
             storage_path = project_root / "storage" / "data"
             storage_path.parent.mkdir(parents=True, exist_ok=True)
 
+        process_env = dict(os.environ)
         if storage_path.exists():
             load_dotenv(dotenv_path=storage_path, override=True)
 
-        motor_ids = parse_int_csv(get_env("MOTOR_IDS", "1,2"))
-        motor_directions = parse_int_csv(get_env("MOTOR_DIRECTIONS", "1,-1"))
-
-        if not motor_ids:
-            motor_ids = [1]
-
+        values = _read_values(storage_path, process_env)
+        parsed = {spec.attr: spec.read(values.get(spec.key)) for spec in CONFIG_SCHEMA}
         return cls(
             _storage_path=storage_path,
-            app_title=get_env("APP_TITLE", "Tango Motors Control"),
-            app_admin_default_passcode=get_env("APP_ADMIN_DEFAULT_PASSCODE", "1010"),
-            app_fullscreen_mode=get_env_bool("APP_FULLSCREEN_MODE", True),
-            app_screen_width=max(320, int(get_env("APP_SCREEN_WIDTH", "800"))),
-            app_screen_height=max(240, int(get_env("APP_SCREEN_HEIGHT", "480"))),
-            locale=get_env("LOCALE", "fr").lower(),
-            default_sec_per_tray=float(get_env("DEFAULT_SEC_PER_TRAY", "15")),
-            admin_passcode_hash=get_env("ADMIN_PASSCODE_HASH", ""),
-            asset_logo=get_env("ASSET_LOGO", "tango_logo.png"),
-            asset_screensaver=get_env(
-                "ASSET_SCREENSAVER", "regethermic_screensaver.png"
-            ),
-            inactivity_timeout=float(get_env("INACTIVITY_TIMEOUT", "30.0")),
-            log_level=get_env("LOG_LEVEL", "INFO").upper(),
-            motor_enabled=get_env_bool("MOTOR_ENABLED", False),
-            motor_type=get_env("MOTOR_TYPE", "AK40-10"),
-            motor_can_channel=get_env("MOTOR_CAN_CHANNEL", "can0"),
-            motor_ids=motor_ids,
-            motor_directions=motor_directions,
-            motor_command_hz=float(get_env("MOTOR_COMMAND_HZ", "2.0")),
-            motor_ramp_time_s=max(0.0, float(get_env("MOTOR_RAMP_TIME_S", "0.5"))),
-            motor_hold_release_timeout_s=max(
-                0.0, float(get_env("MOTOR_HOLD_RELEASE_TIMEOUT_S", "5.0"))
-            ),
-            motor_tray_size_cm=max(0.1, float(get_env("MOTOR_TRAY_SIZE_CM", "53"))),
-            motor_min_sec_per_tray=float(get_env("MOTOR_MIN_SEC_PER_TRAY", "15")),
-            motor_max_sec_per_tray=float(get_env("MOTOR_MAX_SEC_PER_TRAY", "40")),
-            motor_max_temp_c=float(get_env("MOTOR_MAX_TEMP_C", "70.0")),
+            _process_env=process_env,
+            **cast(dict[str, Any], parsed),
         )
 
+    @property
+    def storage_dir(self) -> Path:
+        return self._storage_path.parent
+
     def set(self, key: str, value: object) -> None:
         """
-        Updates a configuration value in memory and persists it to the storage file.
+        Updates a configuration value in memory and queues it for persistence.
+        The storage file is rewritten in the background after a short debounce.
+        Schema keys are persisted as parsed and clamped, like the value in memory.
         """
         str_value: str = str(value)
-        attr_name: str = key.lower()
-        if hasattr(self, attr_name):
-            current_val = getattr(self, attr_name)
-            if isinstance(current_val, bool):
-                setattr(
-                    self,
-                    attr_name,
-                    str_value.strip().lower() in {"1", "true", "yes", "on"},
-                )
-            elif isinstance(current_val, list):
-                setattr(self, attr_name, parse_int_csv(str_value))
-            elif isinstance(current_val, int):
-                setattr(self, attr_name, int(str_value))
-            elif isinstance(current_val, float):
-                setattr(self, attr_name, float(str_value))
-            else:
-                setattr(self, attr_name, str_value)
-
-        os.environ[key] = str_value
-        self._write_to_file(key, str_value)
+        spec = _SCHEMA_BY_KEY.get(key)
+        if spec is not None:
+            normalized = spec.read(str_value)
+            setattr(self, spec.attr, normalized)
+            str_value = spec.format(normalized)
+
+        with self._pending_lock:
+            self._pending_writes[key] = str_value
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_WRITE_DEBOUNCE_S, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Writes all pending keys to the storage file in one atomic rewrite.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                pending = self._pending_writes
+                self._pending_writes = {}
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not pending:
+                return
+
+            try:
+                self._write_to_file(pending)
+            except OSError:
+                logger.exception("Failed to persist config keys %s", sorted(pending))
+                with self._pending_lock:
+                    # Keep newer values queued since the failed snapshot.
+                    self._pending_writes = {**pending, **self._pending_writes}
+
+    def subscribe(self, listener: Callable[[frozenset[str]], None]) -> None:
+        """
+        Registers a callback for hot-reloaded keys. It runs on the watcher
+        thread, so it must not touch UI state directly.
+        """
+        self._listeners.append(listener)
 
-    def _write_to_file(self, key: str, value: str) -> None:
-        if not self._storage_path.exists():
-            with open(self._storage_path, "w") as f:
-                f.write(f"{key}={value}\n")
+    def reload(self) -> frozenset[str]:
+        """
+        Re-reads the storage file and applies changed keys. Queued writes win
+        over the file so an external edit cannot revert a pending change.
+        """
+        values = _read_values(self._storage_path, self._process_env)
+        with self._pending_lock:
+            values.update(self._pending_writes)
+
+        changed: set[str] = set()
+        for spec in CONFIG_SCHEMA:
+            value = spec.read(values.get(spec.key))
+            if value != getattr(self, spec.attr):
+                setattr(self, spec.attr, value)
+                changed.add(spec.key)
+        if not changed:
+            return frozenset()
+
+        restart_keys = sorted(key for key in changed if not _SCHEMA_BY_KEY[key].live)
+        logger.info("Config reloaded: %s", ", ".join(sorted(changed)))
+        if restart_keys:
+            logger.warning("Restart required to apply: %s", ", ".join(restart_keys))
+
+        changed_keys = frozenset(changed)
+        for listener in list(self._listeners):
+            try:
+                listener(changed_keys)
+            except Exception:
+                logger.exception("Config reload listener failed")
+        return changed_keys
+
+    def start_watching(self, interval_s: float = _WATCH_INTERVAL_S) -> None:
+        if self._watch_thread is not None:
             return
-
-        with open(self._storage_path, "r") as f:
-            lines = f.readlines()
-
+        self._watch_stop = threading.Event()
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(interval_s, self._watch_stop),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        self._watch_stop.set()
+        self._watch_thread = None
+
+    def _watch_loop(self, interval_s: float, stop: threading.Event) -> None:
+        # A stat() per interval is cheap and works on every platform/filesystem.
+        signature = self._file_signature()
+        while not stop.wait(interval_s):
+            current = self._file_signature()
+            if current == signature:
+                continue
+            signature = current
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Config reload failed")
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat_result = self._storage_path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def _write_to_file(self, values: dict[str, str]) -> None:
+        lines: list[str] = []
+        if self._storage_path.exists():
+            with open(self._storage_path, "r") as f:
+                lines = f.readlines()
+
+        remaining = dict(values)
         new_lines: list[str] = []
-        key_found = False
-        pattern = re.compile(rf"^\s*{re.escape(key)}\s*=")
-
         for line in lines:
-            if pattern.match(line):
-                new_lines.append(f"{key}={value}\n")
-                key_found = True
+            match = _KEY_LINE_PATTERN.match(line)
+            key = match.group(1) if match else None
+            if key is not None and key in values:
+                new_lines.append(f"{key}={values[key]}\n")
+                remaining.pop(key, None)
             else:
                 new_lines.append(line)
 
-        if not key_found:
+        if remaining:
             if new_lines and not new_lines[-1].endswith("\n"):
                 new_lines[-1] += "\n"
-            new_lines.append(f"{key}={value}\n")
+            new_lines.extend(f"{key}={value}\n" for key, value in remaining.items())
 
-        with open(self._storage_path, "w") as f:
-            f.writelines(new_lines)
+        write_text_atomic(self._storage_path, "".join(new_lines))
 
 
-config: Config = Config.load()
+with startup_trace.span("Config.load"):
+    config: Config = Config.load()
+atexit.register(config.flush)
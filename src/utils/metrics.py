@@ -0,0 +1,238 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Updates are lock-free attribute writes: each metric child has a single writer
+thread (motor keepalive or UI loop) and the exporter only reads.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+from bisect import bisect_left
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import Generic, TypeVar
+
+ChildT = TypeVar("ChildT", "CounterChild", "GaugeChild", "HistogramChild")
+
+DEFAULT_LATENCY_BUCKETS_S: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class MetricType(StrEnum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = math.nan
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric(abc.ABC, Generic[ChildT]):
+    type: MetricType
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], ChildT] = {}
+
+    def labels(self, *values: object) -> ChildT:
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(
+                    f"Metric {self.name} expects labels {self.label_names}, got {key}"
+                )
+            child = self._new_child()
+            self._children[key] = child
+        return child
+
+    def remove(self, *values: object) -> None:
+        self._children.pop(tuple(str(value) for value in values), None)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.type.value}",
+        ]
+        for key, child in list(self._children.items()):
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _format_labels(self, key: tuple[str, ...], **extra: str) -> str:
+        pairs = [*zip(self.label_names, key), *extra.items()]
+        if not pairs:
+            return ""
+        body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+        return f"{{{body}}}"
+
+    @abc.abstractmethod
+    def _new_child(self) -> ChildT: ...
+
+    @abc.abstractmethod
+    def _render_child(self, key: tuple[str, ...], child: ChildT) -> list[str]: ...
+
+
+class Counter(_Metric[CounterChild]):
+    type = MetricType.COUNTER
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def _render_child(self, key: tuple[str, ...], child: CounterChild) -> list[str]:
+        labels = self._format_labels(key)
+        return [f"{self.name}{labels} {_format_value(child.value)}"]
+
+
+class Gauge(_Metric[GaugeChild]):
+    type = MetricType.GAUGE
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def _render_child(self, key: tuple[str, ...], child: GaugeChild) -> list[str]:
+        labels = self._format_labels(key)
+        return [f"{self.name}{labels} {_format_value(child.value)}"]
+
+
+class Histogram(_Metric[HistogramChild]):
+    type = MetricType.HISTOGRAM
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float],
+    ) -> None:
+        super().__init__(name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def _render_child(
+        self,
+        key: tuple[str, ...],
+        child: HistogramChild,
+    ) -> list[str]:
+        labels = self._format_labels(key)
+        lines: list[str] = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), list(child.counts)):
+            cumulative += count
+            bucket_labels = self._format_labels(key, le=_format_value(bound))
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+AnyMetric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, AnyMetric] = {}
+
+    def counter(self, name: str, help: str, label_names: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, label_names)
+        self._register(metric)
+        return metric
+
+    def gauge(self, name: str, help: str, label_names: Sequence[str] = ()) -> Gauge:
+        metric = Gauge(name, help, label_names)
+        self._register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_S,
+    ) -> Histogram:
+        metric = Histogram(name, help, label_names, buckets)
+        self._register(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: AnyMetric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+metrics: MetricsRegistry = MetricsRegistry()
@@ -0,0 +1,158 @@
+"""
+Dev-mode render profiler for `@ft.component` functions.
+
+Counts renders and render wall time per component and attributes each render
+to the tracked inputs (observable fields, route, ...) that changed since that
+component's previous render. Renders where no tracked input changed are
+counted as `other` (parent re-render or local state).
+
+Disabled profilers return components undecorated, so production renders pay
+nothing beyond a no-op `track()` call.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+from .config import config
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+MOUNT_TRIGGER = "mount"
+OTHER_TRIGGER = "other"
+
+
+@dataclass(frozen=True)
+class RenderStats:
+    component: str
+    renders: int
+    total_ms: float
+    max_ms: float
+    triggers: dict[str, int]
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.renders if self.renders else 0.0
+
+
+@dataclass
+class _ComponentStats:
+    renders: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    triggers: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class _ActiveRender:
+    component: str
+    triggers: list[str] = field(default_factory=list)
+    tracked: bool = False
+
+
+class RenderProfiler:
+    """
+    Not thread-safe: components render on the Flet event loop, which is the
+    only caller of `profile`-wrapped functions and `track`.
+    """
+
+    def __init__(self, *, enabled: bool) -> None:
+        self.enabled = enabled
+        self._stats: dict[str, _ComponentStats] = {}
+        self._last_inputs: dict[str, dict[str, object]] = {}
+        self._active: list[_ActiveRender] = []
+
+    def profile(self, component: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Wraps a component body; apply it below `@ft.component`."""
+
+        def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+            if not self.enabled:
+                return fn
+
+            @wraps(fn)
+            def profiled(*args: P.args, **kwargs: P.kwargs) -> R:
+                active = _ActiveRender(component)
+                self._active.append(active)
+                started_s = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self._active.pop()
+                    self._record(active, time.perf_counter() - started_s)
+
+            return profiled
+
+        return decorate
+
+    def track(self, **inputs: object) -> None:
+        """Records the inputs of the component currently rendering."""
+        if not self._active:
+            return
+        active = self._active[-1]
+        active.tracked = True
+        previous = self._last_inputs.get(active.component)
+        self._last_inputs[active.component] = inputs
+        if previous is None:
+            active.triggers.append(MOUNT_TRIGGER)
+            return
+        active.triggers.extend(
+            name for name, value in inputs.items() if previous.get(name) != value
+        )
+
+    def snapshot(self) -> list[RenderStats]:
+        """Per-component stats, most rendered first."""
+        rows = [
+            RenderStats(
+                component=component,
+                renders=stats.renders,
+                total_ms=stats.total_s * 1000,
+                max_ms=stats.max_s * 1000,
+                triggers=dict(stats.triggers.most_common()),
+            )
+            for component, stats in self._stats.items()
+        ]
+        return sorted(rows, key=lambda row: row.renders, reverse=True)
+
+    def to_json(self) -> str:
+        payload = {
+            "generated_at": time.time(),
+            "components": [
+                {
+                    "component": row.component,
+                    "renders": row.renders,
+                    "total_ms": round(row.total_ms, 3),
+                    "mean_ms": round(row.mean_ms, 3),
+                    "max_ms": round(row.max_ms, 3),
+                    "triggers": row.triggers,
+                }
+                for row in self.snapshot()
+            ],
+        }
+        return json.dumps(payload, indent=2) + "\n"
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self._last_inputs.clear()
+
+    def _record(self, active: _ActiveRender, elapsed_s: float) -> None:
+        stats = self._stats.setdefault(active.component, _ComponentStats())
+        stats.renders += 1
+        stats.total_s += elapsed_s
+        stats.max_s = max(stats.max_s, elapsed_s)
+        if active.triggers:
+            stats.triggers.update(active.triggers)
+        elif active.tracked:
+            stats.triggers[OTHER_TRIGGER] += 1
+        else:
+            # Untracked components: only the first render is attributable.
+            stats.triggers[MOUNT_TRIGGER if stats.renders == 1 else OTHER_TRIGGER] += 1
+
+
+render_profiler: RenderProfiler = RenderProfiler(enabled=config.render_profiler_enabled)
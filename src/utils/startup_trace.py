@@ -0,0 +1,104 @@
+"""
+Boot timeline recorder exported in the Chrome trace event format.
+
+Open the exported file in chrome://tracing or https://ui.perfetto.dev.
+Must not import app modules: it is the first thing `main` loads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .files import write_text_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTracer:
+    def __init__(self) -> None:
+        # Timestamps count from process start, estimated when possible.
+        self._process_age_s = _process_age_s() or 0.0
+        self._origin_ns = time.perf_counter_ns() - int(self._process_age_s * 1e9)
+        self._events: list[dict[str, object]] = []
+        self._finished = False
+        if self._process_age_s > 0.0:
+            # Interpreter startup happens before any of our code can run.
+            self._events.append(
+                self._event("python startup", "X", 0.0)
+                | {"dur": self._process_age_s * 1e6}
+            )
+
+    def mark(self, name: str) -> None:
+        if self._finished:
+            return
+        self._events.append(self._event(name, "i", self._now_us()) | {"s": "p"})
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started_us = self._now_us()
+        try:
+            yield
+        finally:
+            if not self._finished:
+                self._events.append(
+                    self._event(name, "X", started_us)
+                    | {"dur": self._now_us() - started_us}
+                )
+
+    def finish(self, *, export_path: Path | None) -> None:
+        """
+        Records `ui_ready`, logs the boot time and optionally writes the trace.
+        Later marks are ignored so only the boot sequence is captured.
+        """
+        if self._finished:
+            return
+        self.mark("ui_ready")
+        self._finished = True
+        since_start_ms = self._now_us() / 1000
+        logger.info(
+            "Startup ready in %.0f ms (%.0f ms since process start)",
+            since_start_ms - self._process_age_s * 1000,
+            since_start_ms,
+        )
+        if export_path is None:
+            return
+        try:
+            payload = {"traceEvents": self._events, "displayTimeUnit": "ms"}
+            write_text_atomic(export_path, json.dumps(payload, indent=1) + "\n")
+            logger.info("Startup trace written to %s", export_path)
+        except OSError:
+            logger.exception("Failed to write startup trace")
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _event(self, name: str, phase: str, ts_us: float) -> dict[str, object]:
+        return {
+            "name": name,
+            "cat": "startup",
+            "ph": phase,
+            "ts": ts_us,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+
+
+def _process_age_s() -> float | None:
+    # Linux only: process start time (field 22) is in clock ticks since boot.
+    try:
+        stat = Path("/proc/self/stat").read_text()
+        uptime_s = float(Path("/proc/uptime").read_text().split()[0])
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        return max(0.0, uptime_s - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+startup_trace: StartupTracer = StartupTracer()
@@ -0,0 +1,53 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class TtlKeyCache:
+    """
+    Remembers when keys were last seen, for at most `ttl_s` seconds and at
+    most `max_size` keys (oldest evicted first).
+
+    Keys are kept in last-seen order, so expired entries are always at the
+    front and pruning stops at the first live one: O(expired) per call.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._seen_at: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen_at)
+
+    def seen_within(self, key: Hashable, window_s: float) -> bool:
+        """
+        True when `key` was touched less than `window_s` ago (capped at the
+        TTL); otherwise records it as seen now and returns False.
+        """
+        now = self._clock()
+        self._prune(now)
+        last_seen = self._seen_at.get(key)
+        if last_seen is not None and now - last_seen < min(window_s, self.ttl_s):
+            return True
+        self._seen_at[key] = now
+        self._seen_at.move_to_end(key)
+        while len(self._seen_at) > self.max_size:
+            self._seen_at.popitem(last=False)
+        return False
+
+    def _prune(self, now: float) -> None:
+        while self._seen_at:
+            key, seen_at = next(iter(self._seen_at.items()))
+            if now - seen_at < self.ttl_s:
+                return
+            del self._seen_at[key]
@@ -1,4 +1,6 @@
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 import flet as ft
@@ -14,20 +16,88 @@ from components.ui.text import TangoText
 from components.ui.tango_toast import ToastType, show_toast
 from components.ui.button import TangoButton
 from contexts.motor import MotorContext
+from contexts.observable import use_fields
 from contexts.settings import SettingsContext
 from contexts.locale import LocaleContext
+from services.app.i18n import SECONDS_PER_TRAY_UNIT, TRAYS_PER_MINUTE_UNIT
 from services.motors.tray_speed import sec_per_tray_to_trays_per_minute
 from theme import colors, spacing
-from theme.scale import ViewportArea, get_viewport_metrics, resolve_panel_width
+from theme.scale import (
+    ViewportArea,
+    ViewportMetrics,
+    get_viewport_metrics,
+    resolve_panel_width,
+    scaled,
+)
+from utils.render_profiler import render_profiler
+
+
+@dataclass(frozen=True)
+class _AdminLayout:
+    outer_pad: int
+    section_spacing: int
+    block_spacing: int
+    section_title_size: int
+    value_size: int
+    card_width: int
+    card_padding: int
+    card_height: int | None
+    use_scrollable_card: bool
+    slider_scale: float
+    slider_value_gap: int
+    action_button_size: int
+    action_button_variant_size: Literal["md", "lg"]
+    action_button_spacing: int
+
+
+@lru_cache(maxsize=8)
+def _admin_layout(metrics: ViewportMetrics) -> _AdminLayout:
+    outer_pad = scaled(metrics, spacing.LG, spacing.XL)
+    available_card_height = max(320, int(round(metrics.height - (outer_pad * 2))))
+    use_scrollable_card = available_card_height < scaled(metrics, 520, 560)
+    return _AdminLayout(
+        outer_pad=outer_pad,
+        section_spacing=scaled(metrics, spacing.XL, spacing.XXL),
+        block_spacing=scaled(metrics, spacing.SM, spacing.MD),
+        section_title_size=scaled(metrics, 18, 22),
+        value_size=scaled(metrics, 16, 18),
+        card_width=resolve_panel_width(
+            metrics,
+            compact_fraction=0.82,
+            regular_fraction=0.66,
+            compact_min=500,
+            regular_min=600,
+            max_width=920,
+            edge_padding=outer_pad,
+        ),
+        card_padding=scaled(metrics, spacing.XL, spacing.XXL),
+        card_height=available_card_height if use_scrollable_card else None,
+        use_scrollable_card=use_scrollable_card,
+        slider_scale=max(1.08, metrics.scale * 1.08),
+        slider_value_gap=max(4, scaled(metrics, 6)),
+        action_button_size=scaled(metrics, 18, 19),
+        action_button_variant_size="md" if metrics.is_compact else "lg",
+        action_button_spacing=scaled(metrics, spacing.XS, spacing.MD),
+    )
 
 
 @ft.component
+@render_profiler.profile("AdminView")
 def AdminView() -> ft.Control:
     loc = ft.use_context(LocaleContext)
     motor = ft.use_context(MotorContext).current()
     settings_service = ft.use_context(SettingsContext).current()
     active_sheet, set_active_sheet = ft.use_state("")
-    _ = motor.status_version if active_sheet == "motor_status" else 0
+    use_fields(settings_service, "inactivity_timeout", "default_sec_per_tray")
+    # Telemetry only matters while the motor status sheet is open.
+    use_fields(
+        motor,
+        *(
+            ("status_version", "sec_per_tray", "trays_per_minute")
+            if active_sheet == "motor_status"
+            else ()
+        ),
+    )
     inactivity_timeout_draft, set_inactivity_timeout_draft = ft.use_state(
         float(settings_service.inactivity_timeout)
     )
@@ -43,46 +113,14 @@ def AdminView() -> ft.Control:
         min_scale=0.7,
     )
 
-    outer_pad = int(
-        round((spacing.LG if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
-    section_spacing = int(
-        round((spacing.XL if metrics.is_compact else spacing.XXL) * metrics.scale)
-    )
-    block_spacing = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    section_title_size = int(round((18 if metrics.is_compact else 22) * metrics.scale))
-    value_size = int(round((16 if metrics.is_compact else 18) * metrics.scale))
-    card_width = resolve_panel_width(
-        metrics,
-        compact_fraction=0.82,
-        regular_fraction=0.66,
-        compact_min=500,
-        regular_min=600,
-        max_width=920,
-        edge_padding=outer_pad,
-    )
-    card_padding = int(
-        round((spacing.XL if metrics.is_compact else spacing.XXL) * metrics.scale)
-    )
-    available_card_height = max(
-        320,
-        int(round(metrics.height - (outer_pad * 2))),
-    )
-    preferred_card_height = int(
-        round((520 if metrics.is_compact else 560) * metrics.scale)
-    )
-    use_scrollable_card = available_card_height < preferred_card_height
-    card_height = available_card_height if use_scrollable_card else None
-    slider_scale = max(1.08, metrics.scale * 1.08)
-    slider_value_gap = max(4, int(round(6 * metrics.scale)))
-    action_button_size = int(round((18 if metrics.is_compact else 19) * metrics.scale))
-    action_button_variant_size: Literal["md", "lg"] = (
-        "md" if metrics.is_compact else "lg"
-    )
-    action_button_spacing = int(
-        round((spacing.XS if metrics.is_compact else spacing.MD) * metrics.scale)
+    layout = _admin_layout(metrics)
+    render_profiler.track(
+        locale=loc.locale,
+        metrics=metrics,
+        active_sheet=active_sheet,
+        status_version=motor.status_version if active_sheet == "motor_status" else 0,
+        inactivity_timeout=settings_service.inactivity_timeout,
+        default_sec_per_tray=settings_service.default_sec_per_tray,
     )
     motor_status_snapshots = (
         motor.get_status_snapshots() if active_sheet == "motor_status" else []
@@ -155,41 +193,41 @@ def AdminView() -> ft.Control:
     timeout_label = TangoText(
         loc.t("inactivity_timeout"),
         variant="subtitle",
-        size=section_title_size,
+        size=layout.section_title_size,
     )
     timeout_value = TangoText(
         f"{int(round(inactivity_timeout_draft))} {loc.t('seconds')}",
         variant="caption",
-        size=value_size,
+        size=layout.value_size,
         color=colors.TEXT_MUTED,
     )
     default_tray_time_label = TangoText(
         loc.t("default_tray_time"),
         variant="subtitle",
-        size=section_title_size,
+        size=layout.section_title_size,
     )
     default_tray_time_value = TangoText(
-        f"{int(round(default_tray_time_draft))} {loc.t('seconds_per_tray_unit')}",
+        loc.format_unit(default_tray_time_draft, SECONDS_PER_TRAY_UNIT),
         variant="caption",
-        size=value_size,
+        size=layout.value_size,
         color=colors.TEXT_MUTED,
     )
     admin_passcode_label = TangoText(
         loc.t("change_admin_passcode"),
         variant="subtitle",
-        size=section_title_size,
+        size=layout.section_title_size,
     )
     admin_passcode_description = TangoText(
         loc.t("admin_passcode_description"),
         variant="caption",
-        size=value_size,
+        size=layout.value_size,
         color=colors.TEXT_MUTED,
     )
 
     timeout_header: ft.Control
     if metrics.is_compact:
         timeout_header = ft.Column(
-            spacing=slider_value_gap,
+            spacing=layout.slider_value_gap,
             horizontal_alignment=ft.CrossAxisAlignment.START,
             controls=[timeout_label, timeout_value],
         )
@@ -202,7 +240,7 @@ def AdminView() -> ft.Control:
     default_tray_time_header: ft.Control
     if metrics.is_compact:
         default_tray_time_header = ft.Column(
-            spacing=slider_value_gap,
+            spacing=layout.slider_value_gap,
             horizontal_alignment=ft.CrossAxisAlignment.START,
             controls=[default_tray_time_label, default_tray_time_value],
         )
@@ -269,7 +307,7 @@ def AdminView() -> ft.Control:
         active_sheet_on_dismiss = close_motor_status_sheet
 
     sheet_action_buttons: ft.Control = ft.Row(
-        spacing=action_button_spacing,
+        spacing=layout.action_button_spacing,
         controls=[
             ft.Container(
                 expand=True,
@@ -277,8 +315,8 @@ def AdminView() -> ft.Control:
                     text=loc.t("change_admin_passcode"),
                     variant="secondary",
                     expand=True,
-                    size=action_button_variant_size,
-                    text_size=action_button_size,
+                    size=layout.action_button_variant_size,
+                    text_size=layout.action_button_size,
                     on_click=on_change_admin_passcode_click,
                 ),
             ),
@@ -288,8 +326,8 @@ def AdminView() -> ft.Control:
                     text=loc.t("motor_status_sheet_title"),
                     variant="secondary",
                     expand=True,
-                    size=action_button_variant_size,
-                    text_size=action_button_size,
+                    size=layout.action_button_variant_size,
+                    text_size=layout.action_button_size,
                     icon=ft.Icons.TUNE,
                     on_click=on_motor_status_click,
                 ),
@@ -299,7 +337,9 @@ def AdminView() -> ft.Control:
 
     return TangoPage(
         expand=True,
-        padding=ft.Padding(outer_pad, outer_pad, outer_pad, outer_pad),
+        padding=ft.Padding(
+            layout.outer_pad, layout.outer_pad, layout.outer_pad, layout.outer_pad
+        ),
         alignment=ft.Alignment.CENTER,
         content=ft.Column(
             spacing=0,
@@ -309,17 +349,17 @@ def AdminView() -> ft.Control:
                 ft.Container(
                     alignment=ft.Alignment.CENTER,
                     content=TangoCard(
-                        width=card_width,
-                        height=card_height,
-                        scrollable=use_scrollable_card,
+                        width=layout.card_width,
+                        height=layout.card_height,
+                        scrollable=layout.use_scrollable_card,
                         padding=ft.Padding(
-                            card_padding,
-                            card_padding,
-                            card_padding,
-                            card_padding,
+                            layout.card_padding,
+                            layout.card_padding,
+                            layout.card_padding,
+                            layout.card_padding,
                         ),
                         content=ft.Column(
-                            spacing=block_spacing,
+                            spacing=layout.block_spacing,
                             controls=[
                                 timeout_header,
                                 TangoSlider(
@@ -330,17 +370,21 @@ def AdminView() -> ft.Control:
                                     value=inactivity_timeout_draft,
                                     set_value=set_inactivity_timeout_draft,
                                     on_commit=on_timeout_commit,
-                                    scale=slider_scale,
+                                    scale=layout.slider_scale,
                                 ),
-                                ft.Divider(height=section_spacing),
+                                ft.Divider(height=layout.section_spacing),
                                 default_tray_time_header,
                                 ft.Row(
                                     alignment=ft.MainAxisAlignment.CENTER,
                                     controls=[
                                         TangoText(
-                                            f"{default_tray_rate:.1f} {loc.t('trays_per_minute_unit')}",
+                                            loc.format_unit(
+                                                default_tray_rate,
+                                                TRAYS_PER_MINUTE_UNIT,
+                                                precision=1,
+                                            ),
                                             variant="caption",
-                                            size=value_size,
+                                            size=layout.value_size,
                                             color=colors.TEXT_MUTED,
                                             text_align=ft.TextAlign.CENTER,
                                         ),
@@ -354,9 +398,9 @@ def AdminView() -> ft.Control:
                                     value=default_tray_time_draft,
                                     set_value=on_default_control_value_change,
                                     on_commit=on_default_tray_time_commit,
-                                    scale=slider_scale,
+                                    scale=layout.slider_scale,
                                 ),
-                                ft.Divider(height=section_spacing),
+                                ft.Divider(height=layout.section_spacing),
                                 admin_passcode_label,
                                 admin_passcode_description,
                                 sheet_action_buttons,
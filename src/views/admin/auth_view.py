@@ -13,8 +13,9 @@ from components.ui.passcode_indicator import (
 from components.ui.tango_toast import ToastType, show_toast
 from contexts.route import RouteContext
 from contexts.settings import SettingsContext
+from services.app.update_scheduler import request_update
 from theme import spacing
-from theme.scale import ViewportArea, get_viewport_metrics, resolve_panel_width
+from theme.scale import ViewportArea, get_viewport_metrics, resolve_panel_width, scaled
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +37,8 @@ def AuthView() -> ft.Control:
     async def verify_passcode(current_passcode: str) -> None:
         # Small delay to let the 4th dot render
         await asyncio.sleep(0.1)
-        authenticated = await asyncio.to_thread(
-            settings_service.verify_admin_passcode,
-            current_passcode,
+        authenticated = await settings_service.verify_admin_passcode_async(
+            current_passcode
         )
 
         if authenticated:
@@ -59,7 +59,7 @@ def AuthView() -> ft.Control:
 
             def apply_shake_offset(point: ft.Offset) -> None:
                 set_shake_offset(point)
-                page.update()
+                request_update(page)
 
             await animate_passcode_shake(
                 apply_offset=apply_shake_offset,
@@ -81,9 +81,7 @@ def AuthView() -> ft.Control:
             set_passcode(passcode[:-1])
 
     metrics = get_viewport_metrics(page, area=ViewportArea.CONTENT, min_scale=0.7)
-    content_spacing = int(
-        round((spacing.MD if metrics.is_compact else spacing.LG) * metrics.scale)
-    )
+    content_spacing = scaled(metrics, spacing.MD, spacing.LG)
     card_width = resolve_panel_width(
         metrics,
         compact_fraction=0.64,
@@ -93,9 +91,7 @@ def AuthView() -> ft.Control:
         max_width=700,
         edge_padding=spacing.XL,
     )
-    card_padding = int(
-        round((spacing.LG if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
+    card_padding = scaled(metrics, spacing.LG, spacing.XL)
 
     return TangoPage(
         expand=True,
@@ -1,4 +1,6 @@
 from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 
 import flet as ft
 from flet.controls.control_event import Event
@@ -10,18 +12,90 @@ from components.ui.text import TangoText
 from components.ui.tango_toast import ToastType, show_toast
 from contexts.locale import LocaleContext
 from contexts.motor import MotorContext
+from contexts.observable import use_fields
 from contexts.settings import SettingsContext
 from models.motor_types import MotorAction
+from services.app.i18n import (
+    SECONDS_PER_TRAY_UNIT,
+    TRAYS_PER_MINUTE_UNIT,
+    TRAYS_UNIT,
+)
 from services.motors.tray_speed import sec_per_tray_to_trays_per_minute
 from theme import colors, spacing
-from theme.scale import ViewportArea, get_viewport_metrics, resolve_panel_width
+from theme.scale import (
+    ViewportArea,
+    ViewportMetrics,
+    get_viewport_metrics,
+    resolve_panel_width,
+    scaled,
+)
+from utils.render_profiler import render_profiler
+
+
+@dataclass(frozen=True)
+class _MotorsLayout:
+    content_spacing: int
+    panel_spacing: int
+    speed_value_size: int
+    speed_unit_size: int
+    throughput_size: int
+    speed_number_width: int
+    panel_width: int
+    slider_scale: float
+    card_padding: int
+    action_gap: int
+    value_row_gap: int
+    value_action_gap: int
+    value_block_padding_y: int
+    toggle_icon_size: int
+
+
+@lru_cache(maxsize=8)
+def _motors_layout(metrics: ViewportMetrics) -> _MotorsLayout:
+    return _MotorsLayout(
+        content_spacing=scaled(metrics, spacing.LG, spacing.XL),
+        panel_spacing=scaled(metrics, spacing.LG, spacing.XL),
+        speed_value_size=scaled(metrics, 54, 64),
+        speed_unit_size=scaled(metrics, 22, 24),
+        throughput_size=scaled(metrics, 16, 18),
+        speed_number_width=scaled(metrics, 150, 180),
+        panel_width=resolve_panel_width(
+            metrics,
+            compact_fraction=0.84,
+            regular_fraction=0.60,
+            compact_min=460,
+            regular_min=560,
+            max_width=820,
+            edge_padding=spacing.XL,
+        ),
+        slider_scale=max(1.06, metrics.scale * 1.04),
+        card_padding=scaled(metrics, spacing.XL, spacing.XXL),
+        action_gap=scaled(metrics, spacing.SM, spacing.MD),
+        value_row_gap=scaled(metrics, spacing.SM, spacing.MD),
+        value_action_gap=scaled(metrics, spacing.XL, spacing.XXL),
+        value_block_padding_y=scaled(metrics, spacing.XS, spacing.SM),
+        toggle_icon_size=scaled(metrics, 52, 60),
+    )
 
 
 @ft.component
+@render_profiler.profile("MotorsView")
 def MotorsView() -> ft.Control:
     loc = ft.use_context(LocaleContext)
     motor = ft.use_context(MotorContext).current()
     settings_service = ft.use_context(SettingsContext).current()
+    # Control state only: status_version (telemetry) must not re-render this.
+    use_fields(
+        motor,
+        "is_motors_running",
+        "sec_per_tray",
+        "trays_this_shift",
+        "trays_today",
+        "active_preset",
+        "preset_names",
+        "schedule_step",
+        "schedule_step_count",
+    )
     metrics = get_viewport_metrics(
         ft.context.page,
         area=ViewportArea.CONTENT,
@@ -29,7 +103,18 @@ def MotorsView() -> ft.Control:
         base_height=540,
         min_scale=0.8,
     )
+    layout = _motors_layout(metrics)
     is_running = motor.is_motors_running
+    render_profiler.track(
+        locale=loc.locale,
+        metrics=metrics,
+        is_motors_running=is_running,
+        sec_per_tray=motor.sec_per_tray,
+        trays_this_shift=motor.trays_this_shift,
+        trays_today=motor.trays_today,
+        active_preset=motor.active_preset,
+        schedule_step=motor.schedule_step,
+    )
     tray_setting_draft, set_tray_setting_draft = ft.use_state(float(motor.sec_per_tray))
 
     def sync_tray_setting_draft() -> None:
@@ -38,50 +123,17 @@ def MotorsView() -> ft.Control:
     ft.use_effect(sync_tray_setting_draft, [motor.sec_per_tray])
 
     tray_rate_preview = sec_per_tray_to_trays_per_minute(tray_setting_draft)
+    throughput_label = (
+        f"{loc.t('trays_this_shift')}: "
+        f"{loc.format_unit(motor.trays_this_shift, TRAYS_UNIT)} · "
+        f"{loc.t('trays_today')}: {loc.format_unit(motor.trays_today, TRAYS_UNIT)}"
+    )
     control_min = motor.sec_per_tray_min
     control_max = motor.sec_per_tray_max
     control_divisions = max(
         1, int(round(motor.sec_per_tray_max - motor.sec_per_tray_min))
     )
 
-    content_spacing = int(
-        round((spacing.LG if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
-    panel_spacing = int(
-        round((spacing.LG if metrics.is_compact else spacing.XL) * metrics.scale)
-    )
-    speed_value_size = int(round((54 if metrics.is_compact else 64) * metrics.scale))
-    speed_unit_size = int(round((22 if metrics.is_compact else 24) * metrics.scale))
-    speed_number_width = int(
-        round((150 if metrics.is_compact else 180) * metrics.scale)
-    )
-    panel_width = resolve_panel_width(
-        metrics,
-        compact_fraction=0.84,
-        regular_fraction=0.60,
-        compact_min=460,
-        regular_min=560,
-        max_width=820,
-        edge_padding=spacing.XL,
-    )
-    slider_scale = max(1.06, metrics.scale * 1.04)
-    card_padding = int(
-        round((spacing.XL if metrics.is_compact else spacing.XXL) * metrics.scale)
-    )
-    action_gap = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    value_row_gap = int(
-        round((spacing.SM if metrics.is_compact else spacing.MD) * metrics.scale)
-    )
-    value_action_gap = int(
-        round((spacing.XL if metrics.is_compact else spacing.XXL) * metrics.scale)
-    )
-    value_block_padding_y = int(
-        round((spacing.XS if metrics.is_compact else spacing.SM) * metrics.scale)
-    )
-    toggle_icon_size = int(round((52 if metrics.is_compact else 60) * metrics.scale))
-
     def build_toast_message(message_key: str) -> Callable[[], str]:
         return lambda: settings_service.t(message_key)
 
@@ -109,6 +161,19 @@ def MotorsView() -> ft.Control:
             build=build_toast_message(message_key),
         )
 
+    def build_preset_click(name: str) -> Callable[[Event[Button]], None]:
+        def on_preset_click(_: Event[Button]) -> None:
+            applied = motor.apply_preset(name)
+            show_toast(
+                page=ft.context.page,
+                type=ToastType.SUCCESS if applied else ToastType.ERROR,
+                build=build_toast_message(
+                    "preset_applied" if applied else "preset_apply_failed"
+                ),
+            )
+
+        return on_preset_click
+
     def on_control_value_change(value: float) -> None:
         bounded_value = max(
             motor.sec_per_tray_min, min(float(value), motor.sec_per_tray_max)
@@ -148,48 +213,78 @@ def MotorsView() -> ft.Control:
         )
 
     return TangoCard(
-        width=panel_width,
-        padding=ft.Padding(card_padding, card_padding, card_padding, card_padding),
+        width=layout.panel_width,
+        padding=ft.Padding(
+            layout.card_padding,
+            layout.card_padding,
+            layout.card_padding,
+            layout.card_padding,
+        ),
         content=ft.Column(
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             alignment=ft.MainAxisAlignment.CENTER,
             tight=True,
-            spacing=panel_spacing,
+            spacing=layout.panel_spacing,
             controls=[
                 ft.Column(
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=content_spacing,
+                    spacing=layout.content_spacing,
                     controls=[
+                        *(
+                            [
+                                ft.Row(
+                                    alignment=ft.MainAxisAlignment.CENTER,
+                                    wrap=True,
+                                    spacing=layout.action_gap,
+                                    run_spacing=layout.action_gap,
+                                    controls=[
+                                        TangoButton(
+                                            name,
+                                            on_click=build_preset_click(name),
+                                            size="sm",
+                                            variant=(
+                                                "primary"
+                                                if name == motor.active_preset
+                                                else "surface"
+                                            ),
+                                        )
+                                        for name in motor.preset_names
+                                    ],
+                                )
+                            ]
+                            if motor.preset_names
+                            else []
+                        ),
                         ft.Row(
                             alignment=ft.MainAxisAlignment.CENTER,
                             vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                            spacing=value_action_gap,
+                            spacing=layout.value_action_gap,
                             controls=[
                                 ft.Container(
                                     padding=ft.Padding(
                                         0,
-                                        value_block_padding_y,
+                                        layout.value_block_padding_y,
                                         0,
-                                        value_block_padding_y,
+                                        layout.value_block_padding_y,
                                     ),
                                     content=ft.Row(
                                         vertical_alignment=ft.CrossAxisAlignment.END,
-                                        spacing=value_row_gap,
+                                        spacing=layout.value_row_gap,
                                         controls=[
                                             ft.Container(
-                                                width=speed_number_width,
+                                                width=layout.speed_number_width,
                                                 alignment=ft.Alignment.CENTER_RIGHT,
                                                 content=TangoText(
                                                     str(int(round(tray_setting_draft))),
                                                     variant="display",
-                                                    size=speed_value_size,
+                                                    size=layout.speed_value_size,
                                                     text_align=ft.TextAlign.RIGHT,
                                                 ),
                                             ),
                                             TangoText(
-                                                loc.t("seconds_per_tray_unit"),
+                                                loc.t(SECONDS_PER_TRAY_UNIT),
                                                 variant="subtitle",
-                                                size=speed_unit_size,
+                                                size=layout.speed_unit_size,
                                                 color=colors.TEXT_MUTED,
                                                 text_align=ft.TextAlign.CENTER,
                                             ),
@@ -202,14 +297,49 @@ def MotorsView() -> ft.Control:
                             alignment=ft.MainAxisAlignment.CENTER,
                             controls=[
                                 TangoText(
-                                    f"{tray_rate_preview:.1f} {loc.t('trays_per_minute_unit')}",
+                                    loc.format_unit(
+                                        tray_rate_preview,
+                                        TRAYS_PER_MINUTE_UNIT,
+                                        precision=1,
+                                    ),
+                                    variant="caption",
+                                    size=layout.speed_unit_size,
+                                    color=colors.TEXT_MUTED,
+                                    text_align=ft.TextAlign.CENTER,
+                                ),
+                            ],
+                        ),
+                        ft.Row(
+                            alignment=ft.MainAxisAlignment.CENTER,
+                            controls=[
+                                TangoText(
+                                    throughput_label,
                                     variant="caption",
-                                    size=speed_unit_size,
+                                    size=layout.throughput_size,
                                     color=colors.TEXT_MUTED,
                                     text_align=ft.TextAlign.CENTER,
                                 ),
                             ],
                         ),
+                        *(
+                            [
+                                ft.Row(
+                                    alignment=ft.MainAxisAlignment.CENTER,
+                                    controls=[
+                                        TangoText(
+                                            f"{loc.t('schedule_step')} "
+                                            f"{motor.schedule_step}/{motor.schedule_step_count}",
+                                            variant="caption",
+                                            size=layout.throughput_size,
+                                            color=colors.PRIMARY,
+                                            text_align=ft.TextAlign.CENTER,
+                                        ),
+                                    ],
+                                )
+                            ]
+                            if motor.schedule_step_count
+                            else []
+                        ),
                         TangoSlider(
                             min=control_min,
                             max=control_max,
@@ -218,13 +348,13 @@ def MotorsView() -> ft.Control:
                             value=tray_setting_draft,
                             set_value=on_control_value_change,
                             on_commit=on_control_value_commit,
-                            scale=slider_scale,
+                            scale=layout.slider_scale,
                         ),
                     ],
                 ),
                 (
                     ft.Column(
-                        spacing=action_gap,
+                        spacing=layout.action_gap,
                         controls=[
                             TangoButton(
                                 expand=True,
@@ -232,7 +362,7 @@ def MotorsView() -> ft.Control:
                                     ft.Icons.STOP if is_running else ft.Icons.PLAY_ARROW
                                 ),
                                 icon_only=True,
-                                icon_size=toggle_icon_size,
+                                icon_size=layout.toggle_icon_size,
                                 tooltip=(
                                     loc.t("stop_motors")
                                     if is_running
@@ -258,7 +388,7 @@ def MotorsView() -> ft.Control:
                                         else ft.Icons.PLAY_ARROW
                                     ),
                                     icon_only=True,
-                                    icon_size=toggle_icon_size,
+                                    icon_size=layout.toggle_icon_size,
                                     tooltip=(
                                         loc.t("stop_motors")
                                         if is_running